@@ -32,20 +32,56 @@ a = Analysis(
         # Project modules (ensure collected)
         'readers',
         'readers.base_reader',
+        'readers.document',
         'readers.document_factory',
         'readers.docx_reader',
         'readers.pdf_reader',
         'readers.text_reader',
+        'readers.odt_reader',
+        'readers.epub_reader',
+        'readers.html_reader',
+        'readers.rtf_reader',
         'readers.file_type_detector',
         'processors',
         'processors.word_extractor',
         'processors.text_processor',
+        'processors.word_index',
+        'processors.word_offsets',
+        'processors.collation',
+        'processors.variant_grouping',
+        'processors.vocabulary_diff',
+        'processors.term_matrix',
+        'processors.normalization',
         'exporters',
         'exporters.excel_exporter',
+        'pipeline',
+        'pipeline.archive_source',
+        'pipeline.extraction',
+        'pipeline.isolation',
+        'pipeline.journal',
+        'pipeline.near_duplicates',
+        'pipeline.scheduler',
+        'pipeline.url_source',
+        'service',
+        'service.http_server',
+        'service.watch_daemon',
+        'cli',
         'ui',
         'ui.main_window',
+        'ui.document_tab',
+        'ui.vocabulary_diff_dialog',
+        'ui.load_queue',
+        'ui.word_list_model',
+        'ui.occurrence_highlighter',
+        'ui.diagnostics_panel',
         'utils',
         'utils.styles',
+        'utils.updates',
+        'utils.startup',
+        'utils.fingerprint',
+        'utils.session_store',
+        'utils.vocabulary_cache',
+        'utils.instrumentation',
     ],
     hookspath=[],
     hooksconfig={},
@@ -59,13 +95,13 @@ a = Analysis(
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
 
+# One-dir build: a onefile EXE unpacks every library to a temp dir on each
+# launch before any Python code runs, which dominates cold start.
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.zipfiles,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='DocumentWordExtractor',
     debug=False,
     bootloader_ignore_signals=False,
@@ -81,3 +117,14 @@ exe = EXE(
     entitlements_file=None,
     icon=None,  # Set to 'path/to/icon.ico' if you have one
 )
+
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.zipfiles,
+    a.datas,
+    strip=False,
+    upx=True,
+    upx_exclude=[],
+    name='DocumentWordExtractor',
+)
@@ -0,0 +1 @@
+"""Performance benchmarks. Run from the DocumentWordExtractor directory."""
@@ -0,0 +1,117 @@
+"""Synthetic TXT, DOCX and PDF documents with a configurable script mix."""
+
+import random
+from pathlib import Path
+
+# Letters used to build words of each script. Uzbek mixes the Latin
+# orthography (oʻ, gʻ, sh, ch, ng) with the Cyrillic-only letters ў қ ғ ҳ.
+SCRIPTS: dict[str, tuple[str, ...]] = {
+    "latin": tuple("abcdefghijklmnopqrstuvwxyz"),
+    "cyrillic": tuple("абвгдеёжзийклмнопрстуфхцчшщъыьэюя"),
+    "uzbek": tuple("abdefhijklmnopqrstuvxyz") + ("oʻ", "gʻ", "sh", "ch", "ng")
+    + tuple("ўқғҳ"),
+}
+
+DEFAULT_MIX = {"latin": 0.5, "cyrillic": 0.3, "uzbek": 0.2}
+WORDS_PER_LINE = 12
+WORDS_PER_PAGE = 400
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Parse ``"latin=0.5,cyrillic=0.5"`` into normalized script weights."""
+    mix: dict[str, float] = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in SCRIPTS:
+            raise ValueError(f"Unknown script: {name} (choose from {', '.join(SCRIPTS)})")
+        mix[name] = float(weight or 1)
+    total = sum(mix.values())
+    if total <= 0:
+        raise ValueError("Script weights must add up to more than zero")
+    return {name: weight / total for name, weight in mix.items()}
+
+
+def make_words(count: int, mix: dict[str, float] | None = None, seed: int = 0) -> list[str]:
+    """Return ``count`` words drawn from a Zipf-like vocabulary.
+
+    The vocabulary grows with ``count`` (about one new word in five), so
+    larger documents also have more unique words to deduplicate. Roughly
+    one word in ten is capitalized to exercise case-insensitive dedupe.
+    """
+    mix = mix or DEFAULT_MIX
+    rng = random.Random(seed)
+    scripts = list(mix)
+    weights = [mix[s] for s in scripts]
+    vocab_size = max(100, count // 5)
+    vocab = []
+    for _ in range(vocab_size):
+        letters = SCRIPTS[rng.choices(scripts, weights)[0]]
+        vocab.append("".join(rng.choices(letters, k=rng.randint(2, 10))))
+    # Zipf weights: the n-th most common word appears ~1/n as often
+    ranks = [1 / n for n in range(1, vocab_size + 1)]
+    words = rng.choices(vocab, ranks, k=count)
+    for i in range(0, count, 10):
+        words[i] = words[i].capitalize()
+    return words
+
+
+def _lines(words: list[str]) -> list[str]:
+    return [
+        " ".join(words[i:i + WORDS_PER_LINE]) for i in range(0, len(words), WORDS_PER_LINE)
+    ]
+
+
+def write_txt(path: Path, words: list[str]) -> None:
+    path.write_text("\n".join(_lines(words)), encoding="utf-8")
+
+
+def write_docx(path: Path, words: list[str]) -> None:
+    from docx import Document
+
+    doc = Document()
+    for line in _lines(words):
+        doc.add_paragraph(line)
+    doc.save(path)
+
+
+def write_pdf(path: Path, words: list[str]) -> None:
+    """Write ``WORDS_PER_PAGE`` words per page.
+
+    ``insert_htmlbox`` falls back to fonts covering Cyrillic and the Uzbek
+    letters, which the built-in Base-14 fonts lack.
+    """
+    import fitz  # PyMuPDF
+
+    doc = fitz.open()
+    try:
+        for i in range(0, len(words), WORDS_PER_PAGE):
+            page = doc.new_page()
+            page.insert_htmlbox(page.rect + (50, 50, -50, -50), " ".join(words[i:i + WORDS_PER_PAGE]))
+        doc.save(path)
+    finally:
+        doc.close()
+
+
+WRITERS = {".txt": write_txt, ".docx": write_docx, ".pdf": write_pdf}
+
+
+def generate(
+    directory: Path,
+    extension: str,
+    count: int,
+    mix: dict[str, float] | None = None,
+    seed: int = 0,
+) -> Path:
+    """Write a synthetic document of ``count`` words and return its path.
+
+    Existing files with the same parameters are reused, since large PDFs
+    take a while to generate.
+    """
+    mix = mix or DEFAULT_MIX
+    tag = "-".join(f"{name}{round(weight * 100)}" for name, weight in sorted(mix.items()))
+    path = directory / f"synthetic-{count}-{tag}-{seed}{extension}"
+    if not path.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        WRITERS[extension](path, make_words(count, mix, seed))
+    return path
@@ -0,0 +1,75 @@
+"""Compare PDF tokenization: full text + regex versus PyMuPDF's word stream.
+
+Run from the DocumentWordExtractor directory::
+
+    python -m benchmarks.pdf_words_bench --sizes 10000,100000
+
+Both paths read the same synthetic PDFs. For each one the benchmark
+reports the median time of both paths, tokens per second, and how far
+the two word lists agree. The word stream joins line-break hyphenation,
+so the counts can differ slightly.
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from benchmarks.generators import DEFAULT_MIX, generate, parse_mix
+from processors.word_extractor import WordExtractor
+from readers.pdf_reader import PdfReader
+
+
+def text_path(reader: PdfReader, path: Path) -> list[str]:
+    return WordExtractor.extract_words(reader.read_text(path)[0])
+
+
+def word_stream_path(reader: PdfReader, path: Path) -> list[str]:
+    return reader.read_words(path).words
+
+
+def _median_seconds(func, repeats: int) -> tuple[float, list[str]]:
+    func()  # Warm-up
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        words = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times), words
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.pdf_words_bench", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument("--sizes", default="10000,100000,300000", help="Comma-separated word counts")
+    parser.add_argument(
+        "--mix", default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+        help="Script weights, e.g. latin=0.5,cyrillic=0.5",
+    )
+    parser.add_argument("--repeats", type=int, default=5, help="Timed runs per path")
+    parser.add_argument("--workdir", type=Path, help="Keep generated PDFs here (default: temporary)")
+    args = parser.parse_args(argv)
+
+    reader = PdfReader()
+    mix = parse_mix(args.mix)
+    print(f"{'words':>9}{'text+regex':>13}{'word stream':>13}{'speedup':>9}{'tokens/s':>13}{'agree':>8}")
+    with tempfile.TemporaryDirectory(prefix="dwe-bench-") as tmp:
+        for size in (int(s) for s in args.sizes.split(",")):
+            path = generate(args.workdir or Path(tmp), ".pdf", size, mix)
+            old_s, old_words = _median_seconds(lambda: text_path(reader, path), args.repeats)
+            new_s, new_words = _median_seconds(lambda: word_stream_path(reader, path), args.repeats)
+            old_counts, new_counts = Counter(old_words), Counter(new_words)
+            agree = sum((old_counts & new_counts).values()) / max(len(old_words), len(new_words), 1)
+            print(
+                f"{size:>9,}{old_s * 1000:>11.1f}ms{new_s * 1000:>11.1f}ms"
+                f"{old_s / new_s:>8.2f}x{len(new_words) / new_s:>13,.0f}{agree:>8.1%}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
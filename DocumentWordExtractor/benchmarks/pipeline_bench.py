@@ -0,0 +1,205 @@
+"""End-to-end benchmark of detect → read → tokenize → dedupe → export.
+
+Run from the DocumentWordExtractor directory::
+
+    python -m benchmarks.pipeline_bench --save-baseline   # record a baseline
+    python -m benchmarks.pipeline_bench                   # compare against it
+    python -m benchmarks.pipeline_bench --formats txt,pdf --sizes 10000,200000
+
+Each case (format × size) is run once to warm up imports and caches, then
+``--repeats`` times; stage and total times are medians of those runs. Peak
+memory comes from one extra run under tracemalloc, so tracing overhead
+never skews the timings; it covers Python allocations only, not memory
+held inside PyMuPDF. The exit status is 1 when a case's throughput
+falls, or its peak memory grows, by more than the thresholds relative to
+the baseline. Baselines are machine-specific; record one per machine.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+from benchmarks.generators import DEFAULT_MIX, generate, parse_mix
+from exporters.excel_exporter import ExcelExporter
+from processors.word_extractor import WordExtractor
+from readers.document_factory import DocumentFactory
+from readers.file_type_detector import detect_file_type
+from utils.instrumentation import StageRecorder, memory_tracing
+
+STAGES = ("detect", "read", "tokenize", "dedupe", "export")
+DEFAULT_BASELINE = Path(__file__).parent / "baselines" / "pipeline.json"
+DEFAULT_SIZES = (10_000, 100_000, 300_000)
+DEFAULT_FORMATS = ("txt", "docx", "pdf")
+
+
+def run_pipeline(path: Path, out_dir: Path, recorder: StageRecorder) -> int:
+    """Process one document through every stage; return the token count."""
+    with recorder.stage("detect"):
+        detect_file_type(path)
+        reader = DocumentFactory.get_reader(path)
+    with recorder.stage("read", "pages") as stage:
+        reader.last_page_count = None
+        text = reader.read(path)
+        stage.items = reader.last_page_count
+    with recorder.stage("tokenize", "tokens") as stage:
+        words = WordExtractor.extract_words(text)
+        stage.items = len(words)
+    with recorder.stage("dedupe", "words") as stage:
+        unique = WordExtractor.unique_words(words)
+        stage.items = len(unique)
+    with recorder.stage("export", "words") as stage:
+        stage.items = len(unique)
+        if not ExcelExporter.export(unique, out_dir / (path.stem + ".xlsx")):
+            raise RuntimeError(f"Export failed for {path.name}")
+    return len(words)
+
+
+def measure(path: Path, out_dir: Path, repeats: int) -> dict:
+    """Benchmark one document and return its throughput and memory figures."""
+    run_pipeline(path, out_dir, StageRecorder(path.name))  # Warm-up
+    runs = []
+    tokens = 0
+    for _ in range(repeats):
+        recorder = StageRecorder(path.name)
+        tokens = run_pipeline(path, out_dir, recorder)
+        runs.append(recorder)
+
+    with memory_tracing():
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        run_pipeline(path, out_dir, StageRecorder(path.name))
+        peak = tracemalloc.get_traced_memory()[1] - base
+
+    wall_ms = statistics.median(r.total_wall_ms() for r in runs)
+    size = path.stat().st_size
+    return {
+        "bytes": size,
+        "tokens": tokens,
+        "wall_ms": round(wall_ms, 2),
+        "tokens_per_s": round(tokens / (wall_ms / 1000)),
+        "mb_per_s": round(size / 2**20 / (wall_ms / 1000), 3),
+        "peak_mb": round(peak / 2**20, 2),
+        "stages_ms": {
+            name: round(statistics.median(
+                s.wall_ms for r in runs for s in r.stages if s.stage == name
+            ), 2)
+            for name in STAGES
+        },
+    }
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float,
+    memory_threshold: float,
+) -> list[str]:
+    """Return a message for each case that regressed against ``baseline``."""
+    regressions = []
+    for case, result in results.items():
+        base = baseline.get(case)
+        if base is None:
+            continue
+        speed = result["tokens_per_s"] / base["tokens_per_s"] - 1
+        if speed < -threshold:
+            regressions.append(
+                f"{case}: throughput {result['tokens_per_s']:,} tokens/s is "
+                f"{-speed:.0%} below baseline {base['tokens_per_s']:,}"
+            )
+        if base["peak_mb"] > 0:
+            growth = result["peak_mb"] / base["peak_mb"] - 1
+            if growth > memory_threshold:
+                regressions.append(
+                    f"{case}: peak memory {result['peak_mb']} MB is "
+                    f"{growth:.0%} above baseline {base['peak_mb']} MB"
+                )
+    return regressions
+
+
+def _environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def _print_table(results: dict[str, dict], baseline: dict[str, dict]) -> None:
+    header = f"{'case':<14}{'tokens/s':>12}{'MB/s':>9}{'peak MB':>9}{'vs base':>9}  stages (ms)"
+    print(header)
+    print("-" * len(header))
+    for case, r in results.items():
+        base = baseline.get(case)
+        delta = f"{r['tokens_per_s'] / base['tokens_per_s'] - 1:+.0%}" if base else "new"
+        stages = " ".join(f"{k}={v:g}" for k, v in r["stages_ms"].items())
+        print(
+            f"{case:<14}{r['tokens_per_s']:>12,}{r['mb_per_s']:>9.2f}"
+            f"{r['peak_mb']:>9.1f}{delta:>9}  {stages}"
+        )
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.pipeline_bench", description=__doc__.split("\n")[0])
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS), help="Comma-separated: txt,docx,pdf")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated word counts")
+    parser.add_argument(
+        "--mix", default=",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items()),
+        help="Script weights, e.g. latin=0.5,cyrillic=0.3,uzbek=0.2",
+    )
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per case (median is reported)")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.15, help="Allowed throughput drop (0.15 = 15%%)")
+    parser.add_argument("--memory-threshold", type=float, default=0.20, help="Allowed peak memory growth")
+    parser.add_argument("--workdir", type=Path, help="Keep generated documents here (default: temporary)")
+    parser.add_argument("--json", type=Path, help="Also write the results to this file")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    sizes = [int(s) for s in args.sizes.split(",")]
+    formats = [f.strip().lstrip(".") for f in args.formats.split(",")]
+
+    try:
+        stored = json.loads(args.baseline.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        stored = {}
+    baseline = stored.get("cases", {})
+    if stored.get("environment") and stored["environment"] != _environment():
+        print(f"Warning: baseline was recorded on {stored['environment']}", file=sys.stderr)
+    if stored.get("mix") and stored["mix"] != mix:
+        print(f"Warning: baseline used script mix {stored['mix']}", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory(prefix="dwe-bench-") as tmp:
+        doc_dir = args.workdir or Path(tmp)
+        results = {}
+        for fmt in formats:
+            for size in sizes:
+                path = generate(doc_dir, "." + fmt, size, mix)
+                results[f"{fmt}-{size}"] = measure(path, Path(tmp), args.repeats)
+                print(f"  measured {fmt}-{size}", file=sys.stderr, flush=True)
+
+    _print_table(results, baseline)
+    report = {"environment": _environment(), "mix": mix, "cases": results}
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.save_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        merged = dict(stored, environment=report["environment"], mix=mix)
+        merged["cases"] = {**baseline, **results}
+        args.baseline.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.threshold, args.memory_threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
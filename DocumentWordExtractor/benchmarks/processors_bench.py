@@ -0,0 +1,215 @@
+"""Micro-benchmarks of the word processing hot paths.
+
+Run from the DocumentWordExtractor directory::
+
+    python -m benchmarks.processors_bench --save before.json
+    # ... change processors ...
+    python -m benchmarks.processors_bench --save after.json --compare before.json
+
+Every case is timed ``--samples`` times. Each sample runs the function in
+a loop long enough (``--min-time``) to swamp timer resolution and reports
+seconds per call. Two runs are compared case by case with the median
+change and a two-sided Mann-Whitney U test. That test makes no
+normality assumption, which suits skewed timing noise. A change is only
+called faster or slower when p < ``--alpha`` and the medians differ by
+more than ``--min-change``.
+"""
+
+import argparse
+import gc
+import json
+import math
+import platform
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+from benchmarks.generators import make_words
+from processors.text_processor import TextProcessor
+from processors.word_extractor import WordExtractor
+
+DEFAULT_SIZES = (1_000, 10_000, 100_000)
+
+# Character distributions of the generated input
+DISTRIBUTIONS: dict[str, dict[str, float]] = {
+    "latin": {"latin": 1.0},
+    "cyrillic": {"cyrillic": 1.0},
+    "mixed": {"latin": 0.5, "cyrillic": 0.3, "uzbek": 0.2},
+}
+
+_WRAPPERS = ('"{}"', "({}),", "«{}»", "{}.", "{}—", "{}…", "{}")
+
+
+def _punctuated(words: list[str], seed: int = 0) -> list[str]:
+    """Wrap words in punctuation the way tokens appear in running text."""
+    rng = random.Random(seed)
+    return [rng.choice(_WRAPPERS).format(w) for w in words]
+
+
+def build_cases(sizes, distributions) -> dict[str, Callable[[], object]]:
+    """Return zero-argument callables keyed by ``function/distribution/size``."""
+    cases: dict[str, Callable[[], object]] = {}
+    for dist in distributions:
+        mix = DISTRIBUTIONS[dist]
+        for size in sizes:
+            words = make_words(size, mix)
+            text = " ".join(_punctuated(words))
+            tokens = _punctuated(words)
+            suffix = f"{dist}/{size}"
+            cases[f"TextProcessor.extract_words/{suffix}"] = (
+                lambda t=text: TextProcessor.extract_words(t)
+            )
+            cases[f"TextProcessor.remove_duplicates/{suffix}"] = (
+                lambda w=words: TextProcessor.remove_duplicates(w)
+            )
+            cases[f"TextProcessor.remove_punctuation/{suffix}"] = (
+                lambda w=tokens: [TextProcessor.remove_punctuation(x) for x in w]
+            )
+            if hasattr(TextProcessor, "normalize_words"):
+                cases[f"TextProcessor.normalize_words/{suffix}"] = (
+                    lambda w=tokens: TextProcessor.normalize_words(w)
+                )
+            cases[f"WordExtractor.extract_unique_words/{suffix}"] = (
+                lambda t=text: WordExtractor.extract_unique_words(t)
+            )
+    return cases
+
+
+def time_case(func: Callable[[], object], samples: int, min_time: float) -> list[float]:
+    """Return ``samples`` measurements of seconds per call."""
+    func()  # Warm-up
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed == 0 else max(2, math.ceil(min_time / elapsed))
+    results = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()  # Keep collector pauses out of the samples
+    try:
+        for _ in range(samples):
+            start = time.perf_counter()
+            for _ in range(loops):
+                func()
+            results.append((time.perf_counter() - start) / loops)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return results
+
+
+def mann_whitney_p(a: list[float], b: list[float]) -> float:
+    """Two-sided p-value of the Mann-Whitney U test (normal approximation)."""
+    n1, n2 = len(a), len(b)
+    if not n1 or not n2:
+        return 1.0
+    ranked = sorted([(v, 0) for v in a] + [(v, 1) for v in b])
+    ranks = [0.0] * len(ranked)
+    tie_term = 0
+    i = 0
+    while i < len(ranked):
+        j = i
+        while j + 1 < len(ranked) and ranked[j + 1][0] == ranked[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1  # Average rank of a tie group
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+    r1 = sum(r for r, (_, group) in zip(ranks, ranked) if group == 0)
+    u = r1 - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - n1 * n2 / 2) - 0.5) / math.sqrt(variance)  # Continuity corrected
+    return math.erfc(max(z, 0) / math.sqrt(2))
+
+
+def compare(
+    new: dict[str, list[float]],
+    old: dict[str, list[float]],
+    alpha: float,
+    min_change: float,
+) -> list[tuple[str, float, float, float, float, str]]:
+    """Compare two runs; return ``(case, old, new, change, p, verdict)`` rows."""
+    rows = []
+    for case, samples in new.items():
+        if case not in old:
+            continue
+        old_median = statistics.median(old[case])
+        new_median = statistics.median(samples)
+        change = new_median / old_median - 1
+        p = mann_whitney_p(old[case], samples)
+        verdict = "same"
+        if p < alpha and abs(change) > min_change:
+            verdict = "faster" if change < 0 else "slower"
+        rows.append((case, old_median, new_median, change, p, verdict))
+    return rows
+
+
+def _fmt_time(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.processors_bench", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)), help="Comma-separated word counts")
+    parser.add_argument(
+        "--distributions", default=",".join(DISTRIBUTIONS),
+        help=f"Comma-separated: {', '.join(DISTRIBUTIONS)}",
+    )
+    parser.add_argument("--filter", default="", help="Only run cases containing this text")
+    parser.add_argument("--samples", type=int, default=15, help="Measurements per case")
+    parser.add_argument("--min-time", type=float, default=0.02, help="Seconds per measurement")
+    parser.add_argument("--save", type=Path, help="Write the samples to this JSON file")
+    parser.add_argument("--compare", type=Path, help="Compare against samples saved earlier")
+    parser.add_argument("--alpha", type=float, default=0.01, help="Significance level")
+    parser.add_argument("--min-change", type=float, default=0.03, help="Ignore smaller median changes")
+    args = parser.parse_args(argv)
+
+    cases = build_cases(
+        [int(s) for s in args.sizes.split(",")],
+        [d.strip() for d in args.distributions.split(",")],
+    )
+    results: dict[str, list[float]] = {}
+    for case, func in cases.items():
+        if args.filter not in case:
+            continue
+        results[case] = time_case(func, args.samples, args.min_time)
+        print(f"{case:<52}{_fmt_time(statistics.median(results[case])):>12}", flush=True)
+
+    if args.save:
+        args.save.write_text(json.dumps({
+            "environment": {"python": platform.python_version(), "platform": platform.platform()},
+            "cases": results,
+        }, indent=1), encoding="utf-8")
+
+    if args.compare:
+        old = json.loads(args.compare.read_text(encoding="utf-8"))["cases"]
+        print(f"\n{'case':<52}{'before':>12}{'after':>12}{'change':>9}{'p':>9}  verdict")
+        slower = False
+        for case, before, after, change, p, verdict in compare(results, old, args.alpha, args.min_change):
+            print(
+                f"{case:<52}{_fmt_time(before):>12}{_fmt_time(after):>12}"
+                f"{change:>+9.1%}{p:>9.3g}  {verdict}"
+            )
+            slower |= verdict == "slower"
+        return 1 if slower else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,725 @@
+"""Headless command-line modes of Document Word Extractor."""
+
+import argparse
+import sys
+
+
+def _add_serve(subparsers) -> None:
+    p = subparsers.add_parser("serve", help="Run the HTTP extraction service")
+    p.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: localhost)")
+    p.add_argument("--port", type=int, default=8765, help="Port to listen on (0 = any free port)")
+    p.add_argument("--workers", type=int, help="Extraction processes (default: CPU count)")
+    _add_limits(p)
+    p.add_argument("--max-queue", type=int, default=64, help="Documents waiting before 429 is returned")
+    p.add_argument("--batch-size", type=int, default=8, help="Documents sent to a worker at once")
+    p.add_argument("--batch-window", type=float, default=0.01, help="Seconds to wait to fill a batch")
+
+
+def _run_serve(args: argparse.Namespace) -> int:
+    from service.http_server import run_server
+
+    run_server(
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout=args.timeout or None,
+        memory_limit_mb=args.memory_limit or None,
+        max_queue=args.max_queue,
+        batch_size=args.batch_size,
+        batch_window=args.batch_window,
+    )
+    return 0
+
+
+def _add_watch(subparsers) -> None:
+    p = subparsers.add_parser("watch", help="Extract documents dropped into folders")
+    p.add_argument("folders", nargs="+", help="Folders to watch")
+    p.add_argument("--output", required=True, help="JSON lines corpus to append results to")
+    p.add_argument("--state", help="Processed-fingerprint state file (default: <output>.state)")
+    p.add_argument("--settle", type=float, default=2.0, help="Seconds a file must stay unchanged")
+    p.add_argument("--poll-interval", type=float, default=2.0, help="Scan interval without inotify")
+    p.add_argument("--force-polling", action="store_true", help="Scan instead of using inotify")
+    p.add_argument("--workers", type=int, help="Extraction processes (default: CPU count)")
+    _add_limits(p)
+
+
+def _run_watch(args: argparse.Namespace) -> int:
+    from pathlib import Path
+
+    from service.watch_daemon import WatchDaemon
+
+    folders = [Path(f) for f in args.folders]
+    for folder in folders:
+        if not folder.is_dir():
+            print(f"Not a directory: {folder}", file=sys.stderr)
+            return 2
+    output = Path(args.output)
+    daemon = WatchDaemon(
+        folders,
+        output=output,
+        state=Path(args.state) if args.state else output.with_name(output.name + ".state"),
+        settle=args.settle,
+        poll_interval=args.poll_interval,
+        force_polling=args.force_polling,
+        workers=args.workers,
+        timeout=args.timeout or None,
+        memory_limit_mb=args.memory_limit or None,
+    )
+    print(f"Watching {', '.join(map(str, folders))} ({type(daemon.watcher).__name__})", flush=True)
+    try:
+        daemon.run()
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def _add_extract(subparsers) -> None:
+    p = subparsers.add_parser("extract", help="Extract words from documents and print JSON lines")
+    p.add_argument("files", nargs="+", help="Documents to extract")
+    p.add_argument("--export", metavar="XLSX", help="Also export the words of a single document to Excel")
+    p.add_argument("--metrics", metavar="PATH", help="Append per-stage metrics as JSON lines ('-' for stderr)")
+    p.add_argument("--trace-memory", action="store_true", help="Measure per-stage memory with tracemalloc")
+    p.add_argument("--profile", metavar="PATH", help="Profile a single document and save the profile")
+    p.add_argument(
+        "--profiler", choices=("cprofile", "pyinstrument"), default="cprofile",
+        help="Profiler used by --profile (default: cprofile)",
+    )
+    p.add_argument(
+        "--pdf-word-stream", action="store_true",
+        help="Tokenize PDFs from PyMuPDF's word stream, joining words hyphenated across lines (slower)",
+    )
+    p.add_argument(
+        "--normalize", choices=("en", "ru", "uz"), metavar="LANG",
+        help="Drop the stopwords of a language (en, ru, uz) and merge words with the same stem",
+    )
+    p.add_argument(
+        "--keep-stopwords", action="store_true", help="With --normalize, only merge words by stem",
+    )
+    p.add_argument(
+        "--merge-variants", type=int, default=0, metavar="EDITS",
+        help="Merge spelling/OCR variants up to this many edits into their most frequent form",
+    )
+    p.add_argument(
+        "--sort", choices=("occurrence", "alphabetical", "frequency", "length"), default="occurrence",
+        help="Order of the words in the output and export (default: occurrence)",
+    )
+    p.add_argument(
+        "--collation", choices=("en", "ru", "uz"), default="en",
+        help="Alphabet used for alphabetical order and ties (default: en)",
+    )
+    p.add_argument(
+        "--skip-duplicates", action="store_true",
+        help="Extract one document per near-duplicate cluster and report the others",
+    )
+    p.add_argument(
+        "--similarity", type=float, default=0.8,
+        help="Estimated Jaccard similarity for --skip-duplicates (default: 0.8)",
+    )
+
+
+def _normalize_words(result: dict, normalizer, recorder) -> None:
+    """Replace the words of an extraction result with their stem groups."""
+    words = result["words"]
+    with recorder.stage("normalize", "words") as stage:
+        stage.items = len(words)
+        groups = normalizer.group([w["word"] for w in words], [w["count"] for w in words])
+    result["words"] = [
+        {"word": g.word, "stem": g.stem, "count": g.count, **({"forms": g.forms} if g.forms else {})}
+        for g in groups
+    ]
+    result["unique_words"] = len(groups)
+    result["stages"] = recorder.as_dict()["stages"]
+
+
+def _merge_variants(result: dict, max_distance: int, recorder) -> None:
+    """Collapse the variants in an extraction result into their main forms."""
+    from processors.variant_grouping import group_variants
+
+    words = result["words"]
+    with recorder.stage("merge", "words") as stage:
+        stage.items = len(words)
+        groups = group_variants([w["word"] for w in words], [w["count"] for w in words], max_distance)
+    result["words"] = [
+        {"word": g.canonical, "count": g.count, **({"variants": g.variants} if g.variants else {})}
+        for g in groups
+    ]
+    result["unique_words"] = len(groups)
+    result["stages"] = recorder.as_dict()["stages"]
+
+
+def _sort_words(result: dict, order: str, language: str, recorder) -> None:
+    """Reorder the words of an extraction result."""
+    from processors.collation import sort_order
+
+    words = result["words"]
+    with recorder.stage("sort", "words") as stage:
+        stage.items = len(words)
+        positions = sort_order([w["word"] for w in words], [w["count"] for w in words], order, language)
+    result["words"] = [words[i] for i in positions]
+    result["stages"] = recorder.as_dict()["stages"]
+
+
+def _run_extract(args: argparse.Namespace) -> int:
+    import contextlib
+    import json
+    from pathlib import Path
+
+    from pipeline.extraction import extract_file
+    from utils.instrumentation import StageRecorder, memory_tracing, profile_call
+
+    if (args.profile or args.export) and len(args.files) != 1:
+        print("--profile and --export take a single document", file=sys.stderr)
+        return 2
+
+    files = [Path(name) for name in args.files]
+    duplicate_of: dict[str, tuple[str, float]] = {}
+    if args.skip_duplicates:
+        from pipeline.near_duplicates import find_near_duplicates
+
+        clusters, _ = find_near_duplicates(files, threshold=args.similarity)
+        for cluster in clusters:
+            for path, score in cluster.duplicates:
+                duplicate_of[path] = (cluster.representative, score)
+        # Unreadable files stay in the list and fail in extract_file below
+
+    normalizer = None
+    if args.normalize:
+        from processors.normalization import Normalizer
+
+        # One normalizer for all documents, so its cache carries over
+        normalizer = Normalizer(args.normalize, stopwords=not args.keep_stopwords)
+
+    status = 0
+    with contextlib.ExitStack() as stack:
+        if args.trace_memory:
+            stack.enter_context(memory_tracing())
+        metrics_out = None
+        if args.metrics == "-":
+            metrics_out = sys.stderr
+        elif args.metrics:
+            metrics_out = stack.enter_context(open(args.metrics, "a", encoding="utf-8"))
+
+        for file_path in files:
+            if str(file_path) in duplicate_of:
+                representative, score = duplicate_of[str(file_path)]
+                print(json.dumps({
+                    "name": file_path.name,
+                    "path": str(file_path),
+                    "duplicate_of": representative,
+                    "similarity": round(score, 3),
+                }, ensure_ascii=False), flush=True)
+                continue
+            recorder = StageRecorder(str(file_path), trace_memory=args.trace_memory)
+            try:
+                if args.profile:
+                    result = profile_call(
+                        extract_file, file_path, output=Path(args.profile),
+                        engine=args.profiler, recorder=recorder, pdf_word_stream=args.pdf_word_stream,
+                    )
+                else:
+                    result = extract_file(file_path, recorder=recorder, pdf_word_stream=args.pdf_word_stream)
+            except Exception as e:
+                result = {"name": file_path.name, "error": str(e)}
+                status = 1
+            if normalizer is not None and "error" not in result:
+                _normalize_words(result, normalizer, recorder)
+            if args.merge_variants > 0 and "error" not in result:
+                _merge_variants(result, args.merge_variants, recorder)
+            if args.sort != "occurrence" and "error" not in result:
+                _sort_words(result, args.sort, args.collation, recorder)
+            if args.export and "error" not in result:
+                from exporters.excel_exporter import ExcelExporter
+
+                words = [w["word"] for w in result["words"]]
+                with recorder.stage("export", "words") as stage:
+                    stage.items = len(words)
+                    if not ExcelExporter.export(words, Path(args.export)):
+                        result["error"] = f"Could not write {args.export}"
+                        status = 1
+                result["stages"] = recorder.as_dict()["stages"]
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+            if metrics_out is not None and recorder.stages:
+                print(recorder.to_json_line(), file=metrics_out, flush=True)
+    return status
+
+
+def _add_duplicates(subparsers) -> None:
+    p = subparsers.add_parser("duplicates", help="Group near-duplicate documents and print the clusters")
+    p.add_argument("files", nargs="+", help="Documents to compare")
+    p.add_argument(
+        "--similarity", type=float, default=0.8,
+        help="Estimated Jaccard similarity of word shingles to call a duplicate (default: 0.8)",
+    )
+    p.add_argument("--shingle-size", type=int, default=4, help="Words per shingle")
+    p.add_argument("--sample-words", type=int, default=10_000, help="Words read from the start of each document")
+    p.add_argument("--all", action="store_true", help="Also print documents without duplicates")
+
+
+def _run_duplicates(args: argparse.Namespace) -> int:
+    import json
+    from pathlib import Path
+
+    from pipeline.near_duplicates import find_near_duplicates
+
+    clusters, errors = find_near_duplicates(
+        [Path(name) for name in args.files],
+        threshold=args.similarity,
+        shingle_size=args.shingle_size,
+        max_tokens=args.sample_words,
+    )
+    for cluster in clusters:
+        if cluster.duplicates or args.all:
+            print(json.dumps(cluster.as_dict(), ensure_ascii=False), flush=True)
+    for path, error in errors.items():
+        print(json.dumps({"path": path, "error": error}, ensure_ascii=False), flush=True)
+    return 1 if errors else 0
+
+
+def _add_diff(subparsers) -> None:
+    p = subparsers.add_parser(
+        "diff", help="Compare the vocabularies of documents and print the added, removed and common words",
+    )
+    p.add_argument("files", nargs="+", help="Documents in order, e.g. successive revisions")
+    p.add_argument(
+        "--against-first", action="store_true",
+        help="Compare every document with the first instead of the previous one",
+    )
+    p.add_argument("--cache", metavar="DIR", help="Reuse and store extracted vocabularies in this folder")
+    p.add_argument("--summary", action="store_true", help="Print only the number of words in each group")
+
+
+def _run_diff(args: argparse.Namespace) -> int:
+    import json
+    import time
+    from pathlib import Path
+
+    from pipeline.extraction import extract_file
+    from processors.vocabulary_diff import Lexicon, Vocabulary, diff_vocabularies
+
+    if len(args.files) < 2:
+        print("diff takes at least two documents", file=sys.stderr)
+        return 2
+    cache = None
+    if args.cache:
+        from utils.vocabulary_cache import VocabularyCache
+
+        cache = VocabularyCache(Path(args.cache))
+
+    vocabularies = []
+    for name in args.files:
+        file_path = Path(name)
+        vocabulary = cache.load(file_path) if cache else None
+        if vocabulary is None:
+            try:
+                result = extract_file(file_path)
+            except Exception as e:
+                print(json.dumps({"path": str(file_path), "error": str(e)}, ensure_ascii=False), flush=True)
+                return 1
+            vocabulary = Vocabulary.from_counts(
+                file_path.name, {w["word"]: w["count"] for w in result["words"]}
+            )
+            if cache:
+                cache.save(file_path, vocabulary)
+        vocabularies.append(vocabulary)
+
+    lexicon = Lexicon()
+    for i in range(1, len(vocabularies)):
+        base = vocabularies[0] if args.against_first else vocabularies[i - 1]
+        start = time.perf_counter()
+        diff = diff_vocabularies(base, vocabularies[i], lexicon)
+        elapsed = (time.perf_counter() - start) * 1000
+        result = diff.as_dict(words=not args.summary)
+        result["elapsed_ms"] = round(elapsed, 2)
+        print(json.dumps(result, ensure_ascii=False), flush=True)
+    return 0
+
+
+def _add_sort(subparsers) -> None:
+    p = subparsers.add_parser(
+        "sort", help="Sort word lists in a language's alphabetical order, also when larger than memory",
+    )
+    p.add_argument("files", nargs="+", help="Word lists, one word per line with an optional tab and count ('-' for stdin)")
+    p.add_argument(
+        "--order", choices=("alphabetical", "frequency", "length"), default="alphabetical",
+        help="Sort order; frequency and length break ties alphabetically (default: alphabetical)",
+    )
+    p.add_argument("--collation", choices=("en", "ru", "uz"), default="en", help="Alphabet to sort by (default: en)")
+    p.add_argument("--output", metavar="PATH", help="Write the sorted list here instead of stdout")
+    p.add_argument("--counts", action="store_true", help="Write the count after each word")
+    p.add_argument(
+        "--run-size", type=int, default=500_000, metavar="WORDS",
+        help="Words sorted in memory before a run is written to disk (default: 500000)",
+    )
+    p.add_argument("--temp-dir", metavar="DIR", help="Folder for the sorted runs (default: system temp)")
+
+
+def _run_sort(args: argparse.Namespace) -> int:
+    import contextlib
+    from pathlib import Path
+
+    from processors.collation import ExternalSorter
+
+    sorter = ExternalSorter(
+        args.collation, args.order, args.run_size, Path(args.temp_dir) if args.temp_dir else None
+    )
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(sorter)
+        for name in args.files:
+            source = sys.stdin if name == "-" else stack.enter_context(open(name, encoding="utf-8"))
+            for line in source:
+                word, _, count = line.rstrip("\r\n").partition("\t")
+                if word:
+                    sorter.add(word, int(count) if count else 0)
+        out = stack.enter_context(open(args.output, "w", encoding="utf-8")) if args.output else sys.stdout
+        if args.counts:
+            out.writelines(f"{word}\t{count}\n" for word, count in sorter)
+        else:
+            out.writelines(word + "\n" for word, _ in sorter)
+    return 0
+
+
+def _add_batch(subparsers) -> None:
+    p = subparsers.add_parser(
+        "batch", help="Extract many documents in parallel, longest first, with a live ETA",
+    )
+    p.add_argument(
+        "paths", nargs="+",
+        help="Documents, ZIP/TAR archives, or folders searched recursively for supported files",
+    )
+    p.add_argument("--output", metavar="PATH", help="Write the JSON lines here instead of stdout")
+    p.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    p.add_argument(
+        "--split-pages", type=int, default=200, metavar="PAGES",
+        help="Split PDFs longer than this into page ranges run in parallel; 0 disables (default: 200)",
+    )
+    p.add_argument("--quiet", action="store_true", help="Do not print progress to stderr")
+    _add_limits(p)
+    p.add_argument(
+        "--journal", metavar="PATH",
+        help="Journal of finished documents used to resume (default: OUTPUT.journal)",
+    )
+    p.add_argument("--restart", action="store_true", help="Discard the output and journal and start over")
+    p.add_argument("--retry-failed", action="store_true", help="When resuming, extract failed documents again")
+
+
+def _add_limits(p) -> None:
+    p.add_argument(
+        "--timeout", type=float, default=300, metavar="SECONDS",
+        help="Fail a document still being read after this long; 0 disables (default: 300)",
+    )
+    p.add_argument(
+        "--memory-limit", type=int, default=4096, metavar="MB",
+        help="Address-space cap of each worker process; 0 disables (default: 4096)",
+    )
+
+
+def _batch_files(paths: list[str]) -> list:
+    """Expand folders to the supported documents and archives in them, in path order.
+
+    A file named more than once, directly or through a folder, is listed once.
+    """
+    from pathlib import Path
+
+    from pipeline.archive_source import is_archive
+    from readers.document_factory import DocumentFactory
+
+    extensions = set(DocumentFactory.supported_extensions())
+    files = []
+    for name in paths:
+        path = Path(name)
+        if path.is_dir():
+            files.extend(sorted(
+                p for p in path.rglob("*")
+                if (p.suffix.lower() in extensions or is_archive(p)) and p.is_file()
+            ))
+        else:
+            files.append(path)
+    unique, seen = [], set()
+    for f in files:
+        key = f.resolve()
+        if key not in seen:
+            seen.add(key)
+            unique.append(f)
+    return unique
+
+
+def _archive_results(archives: list, scheduler, args: argparse.Namespace, include_for=None):
+    """Extract the documents inside archives on a worker pool like the scheduler's."""
+    from pipeline.archive_source import extract_archive
+    from pipeline.isolation import IsolatedWorkerPool
+
+    executor = IsolatedWorkerPool(scheduler.workers, args.timeout or None, args.memory_limit or None)
+    try:
+        for archive in archives:
+            include = include_for(archive) if include_for else None
+            yield from extract_archive(archive, executor, scheduler.workers, include)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _run_batch(args: argparse.Namespace) -> int:
+    import itertools
+    import json
+    from pathlib import Path
+
+    from pipeline.archive_source import is_archive
+    from pipeline.scheduler import BatchScheduler
+
+    interactive = sys.stderr.isatty()
+
+    def show(progress) -> None:
+        if interactive:
+            print("\r" + progress.summary(), end="", file=sys.stderr, flush=True)
+        elif progress.documents_done == progress.documents:
+            print(progress.summary(), file=sys.stderr, flush=True)
+
+    scheduler = BatchScheduler(
+        workers=args.workers,
+        split_pages=args.split_pages,
+        on_progress=None if args.quiet else show,
+        timeout=args.timeout or None,
+        memory_limit_mb=args.memory_limit or None,
+    )
+    files = _batch_files(args.paths)
+    # Archive members are streamed rather than scheduled: a compressed TAR
+    # can only be read front to back, so their costs are not known upfront.
+    archives = [f for f in files if is_archive(f)]
+    files = [f for f in files if not is_archive(f)]
+    status = 0
+    if not args.output:
+        documents = scheduler.run(files) if files or not archives else ()
+        results = itertools.chain(documents, _archive_results(archives, scheduler, args))
+        for result in results:
+            status = 1 if "error" in result else status
+            print(json.dumps(result, ensure_ascii=False), flush=True)
+    else:
+        from pipeline.journal import BatchJournal
+        from utils.fingerprint import fingerprint_file
+
+        journal = BatchJournal(Path(args.output), Path(args.journal) if args.journal else None)
+        journal.open(restart=args.restart)
+        try:
+            fingerprints: dict[str, str | None] = {}
+            todo = []
+            # Whole-file hashes: a sampled fingerprint misses edits that keep
+            # the size and fall between the samples, and the edited document
+            # would then be skipped as done
+            for path in files:
+                try:
+                    fingerprint = fingerprint_file(path, full=True)
+                except OSError:
+                    fingerprint = None
+                if not journal.is_done(path, fingerprint, args.retry_failed):
+                    fingerprints[str(path)] = fingerprint
+                    todo.append(path)
+            if len(todo) < len(files) and not args.quiet:
+                print(
+                    f"Resuming: {len(files) - len(todo)} of {len(files)} documents already done",
+                    file=sys.stderr, flush=True,
+                )
+
+            def include_for(archive: Path):
+                """Skip members journaled from the same archive content."""
+                try:
+                    fingerprint = fingerprint_file(archive, full=True)
+                except OSError:
+                    fingerprint = None
+
+                def include(member: str) -> bool:
+                    if journal.is_done(member, fingerprint, args.retry_failed):
+                        return False
+                    fingerprints[member] = fingerprint
+                    return True
+
+                return include
+
+            documents = scheduler.run(todo) if todo or not archives else ()
+            results = itertools.chain(documents, _archive_results(archives, scheduler, args, include_for))
+            for result in results:
+                status = 1 if "error" in result else status
+                journal.write(result, fingerprints.get(result["path"]))
+        finally:
+            journal.close()
+    if interactive and not args.quiet:
+        print(file=sys.stderr)
+    return status
+
+
+def _add_fetch(subparsers) -> None:
+    p = subparsers.add_parser(
+        "fetch", help="Download documents from URLs concurrently and extract them as they arrive",
+    )
+    p.add_argument("urls", nargs="*", help="Document URLs")
+    p.add_argument("--urls-file", metavar="PATH", help="Also read URLs from this file, one per line ('-' for stdin)")
+    p.add_argument("--connections", type=int, default=8, help="Concurrent downloads (default: 8)")
+    p.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    p.add_argument("--retries", type=int, default=3, help="Retries of a failed request (default: 3)")
+    p.add_argument(
+        "--backoff", type=float, default=0.5, metavar="SECONDS",
+        help="First retry delay, doubled for each further retry (default: 0.5)",
+    )
+    p.add_argument(
+        "--download-dir", metavar="DIR",
+        help="Keep documents too large for memory in this folder (default: a temporary folder)",
+    )
+    _add_limits(p)
+
+
+def _run_fetch(args: argparse.Namespace) -> int:
+    import json
+    from pathlib import Path
+
+    from pipeline.isolation import IsolatedWorkerPool
+    from pipeline.url_source import UrlSource, extract_urls
+
+    urls = list(args.urls)
+    if args.urls_file:
+        source = sys.stdin if args.urls_file == "-" else open(args.urls_file, encoding="utf-8")
+        with source:
+            urls.extend(line.strip() for line in source if line.strip() and not line.startswith("#"))
+    if not urls:
+        print("fetch takes at least one URL", file=sys.stderr)
+        return 2
+
+    status = 0
+    executor = IsolatedWorkerPool(args.workers, args.timeout or None, args.memory_limit or None)
+    try:
+        with UrlSource(
+            workers=args.connections,
+            retries=args.retries,
+            backoff=args.backoff,
+            directory=Path(args.download_dir) if args.download_dir else None,
+        ) as source:
+            for result in extract_urls(urls, source, executor):
+                status = 1 if "error" in result else status
+                print(json.dumps(result, ensure_ascii=False), flush=True)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+    return status
+
+
+def _add_terms(subparsers) -> None:
+    p = subparsers.add_parser(
+        "terms", help="Rank each document's most distinctive words by TF-IDF across a corpus",
+    )
+    p.add_argument(
+        "paths", nargs="+",
+        help="JSON lines corpora written by batch or watch ('-' for stdin), "
+        "or documents, archives and folders to extract first",
+    )
+    p.add_argument("--top", type=int, default=20, help="Words listed per document (default: 20)")
+    p.add_argument(
+        "--min-count", type=int, default=1, metavar="N",
+        help="Skip words occurring fewer than N times in a document (default: 1)",
+    )
+    p.add_argument("--raw-tf", action="store_true", help="Weight by raw counts instead of 1 + ln(count)")
+    p.add_argument(
+        "--pdf-word-stream", action="store_true",
+        help="Tokenize PDFs from PyMuPDF's word stream, joining words hyphenated across lines (slower)",
+    )
+    p.add_argument(
+        "--normalize", choices=("en", "ru", "uz"), metavar="LANG",
+        help="Drop the stopwords of a language (en, ru, uz) and rank stems instead of words",
+    )
+    p.add_argument("--output", metavar="PATH", help="Write the JSON lines here instead of stdout")
+    p.add_argument("--workers", type=int, default=None, help="Extraction processes (default: CPU count)")
+    _add_limits(p)
+
+
+def _run_terms(args: argparse.Namespace) -> int:
+    import itertools
+    import json
+
+    from pipeline.archive_source import is_archive
+    from processors.term_matrix import TermMatrixBuilder, export_top_terms
+
+    builder = TermMatrixBuilder()
+    normalizer = None
+    if args.normalize:
+        from processors.normalization import Normalizer
+
+        normalizer = Normalizer(args.normalize)
+    status = 0
+
+    def add(result: dict) -> None:
+        nonlocal status
+        if "error" in result or "words" not in result:
+            status = 1
+            print(json.dumps({"path": result.get("path"), "error": result.get("error", "No words")},
+                             ensure_ascii=False), file=sys.stderr, flush=True)
+            return
+        counts = {w["word"]: w["count"] for w in result["words"]}
+        if normalizer is not None:
+            counts = {g.stem: g.count for g in normalizer.group(list(counts), list(counts.values()))}
+        builder.add_counts(result.get("path") or result.get("name", ""), counts)
+
+    corpora = [p for p in args.paths if p == "-" or p.lower().endswith(".jsonl")]
+    files = _batch_files([p for p in args.paths if p not in corpora])
+    for corpus in corpora:
+        source = sys.stdin if corpus == "-" else open(corpus, encoding="utf-8")
+        with source:
+            for line in source:
+                if line.strip():
+                    add(json.loads(line))
+    if files:
+        from pipeline.scheduler import BatchScheduler
+
+        scheduler = BatchScheduler(
+            workers=args.workers,
+            timeout=args.timeout or None,
+            memory_limit_mb=args.memory_limit or None,
+        )
+        archives = [f for f in files if is_archive(f)]
+        documents = [f for f in files if not is_archive(f)]
+        for result in itertools.chain(
+            scheduler.run(documents) if documents else (),
+            _archive_results(archives, scheduler, args) if archives else (),
+        ):
+            add(result)
+    if not len(builder):
+        print("terms found no documents to rank", file=sys.stderr)
+        return 2
+
+    try:
+        matrix = builder.build()
+    except RuntimeError as e:
+        print(str(e), file=sys.stderr)
+        return 2
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        export_top_terms(matrix, out, args.top, args.min_count, sublinear=not args.raw_tf)
+    finally:
+        if args.output:
+            out.close()
+    return status
+
+
+COMMANDS = {
+    "serve": (_add_serve, _run_serve),
+    "watch": (_add_watch, _run_watch),
+    "extract": (_add_extract, _run_extract),
+    "duplicates": (_add_duplicates, _run_duplicates),
+    "diff": (_add_diff, _run_diff),
+    "sort": (_add_sort, _run_sort),
+    "batch": (_add_batch, _run_batch),
+    "fetch": (_add_fetch, _run_fetch),
+    "terms": (_add_terms, _run_terms),
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="DocumentWordExtractor",
+        description="Headless modes. Run without a command to start the desktop app.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    for add, _ in COMMANDS.values():
+        add(subparsers)
+    return parser
+
+
+def run(argv: list[str]) -> int:
+    """Run a headless command and return the process exit status."""
+    args = build_parser().parse_args(argv)
+    _, handler = COMMANDS[args.command]
+    return handler(args)
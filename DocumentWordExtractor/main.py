@@ -1,34 +1,101 @@
 """Document Word Extractor - Main entry point."""
 
+import argparse
+import multiprocessing
 import sys
+import time
 from pathlib import Path
 
+_LAUNCH_TIME = time.perf_counter()
+
 # Ensure project root is on path
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
-from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
 
-from ui.main_window import MainWindow
+def _parse_args(argv: list[str]) -> tuple[argparse.Namespace, list[str]]:
+    """Parse application options, leaving unknown ones for Qt."""
+    parser = argparse.ArgumentParser(prog="DocumentWordExtractor", add_help=True)
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="Print time-to-first-paint and per-module import costs",
+    )
+    parser.add_argument(
+        "--startup-budget",
+        type=float,
+        metavar="MS",
+        help="Exit with status 1 if the first paint takes longer than MS",
+    )
+    parser.add_argument(
+        "--startup-exit",
+        action="store_true",
+        help="Quit right after the first paint (for startup measurements)",
+    )
+    return parser.parse_known_args(argv)
 
 
 def main() -> None:
-    """Run the application."""
-    app = QApplication(sys.argv)
+    """Run the application, or a headless command if one is given."""
+    import cli
+
+    if len(sys.argv) > 1 and sys.argv[1] in cli.COMMANDS:
+        sys.exit(cli.run(sys.argv[1:]))
+
+    args, qt_args = _parse_args(sys.argv[1:])
+
+    profiler = None
+    if args.startup_profile or args.startup_budget is not None or args.startup_exit:
+        from utils.startup import StartupProfiler
+
+        profiler = StartupProfiler(_LAUNCH_TIME)
+        profiler.start()
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import Qt
+
+    # High DPI scaling (must be set before the application is created)
+    QApplication.setHighDpiScaleFactorRoundingPolicy(
+        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+    )
+
+    app = QApplication([sys.argv[0], *qt_args])
     app.setApplicationName("Document Word Extractor")
     app.setApplicationVersion("1.0.0")
     app.setOrganizationName("DocumentWordExtractor")
+    if profiler:
+        profiler.mark("QApplication created")
 
-    # High DPI scaling
-    app.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
+    from ui.main_window import MainWindow
 
     window = MainWindow()
+    if profiler:
+        profiler.mark("MainWindow constructed")
+
+    def on_first_paint() -> None:
+        from utils.startup import warm_modules_in_background
+
+        # Heavy readers/exporters load while the user looks at the window
+        warm_modules_in_background()
+        if profiler is None:
+            return
+        first_paint = profiler.mark("first paint")
+        print(profiler.report(), file=sys.stderr)
+        if args.startup_budget is not None and first_paint > args.startup_budget:
+            print(
+                f"Startup budget exceeded: {first_paint:.1f} ms > {args.startup_budget:.1f} ms",
+                file=sys.stderr,
+            )
+            app.exit(1)
+        elif args.startup_exit:
+            app.exit(0)
+
+    window.firstPainted.connect(on_first_paint)
     window.show()
 
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    # Frozen builds re-enter here in worker processes
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1 @@
+"""Headless document extraction pipeline module."""
@@ -0,0 +1,188 @@
+"""Extraction of the documents inside ZIP and TAR archives, without unpacking.
+
+Members are read one at a time straight into memory and handed to the
+readers as bytes; nothing is written to disk. A member's type is sniffed
+from its name and first bytes before the rest is read, so images,
+spreadsheets and other unsupported members are skipped cheaply.
+
+ZIP archives allow random access, so each worker opens the archive and
+reads its own member, and members are read and extracted in parallel.
+TAR archives (plain or compressed) can only be read front to back; they
+are streamed once in the calling process and each member's bytes are
+sent to a worker while the next one is being read.
+"""
+
+import tarfile
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, Iterator
+
+from pipeline.extraction import UnsupportedFormatError, extract_bytes
+from readers.document_factory import DocumentFactory
+from readers.file_type_detector import HEADER_SIZE, detect_bytes
+
+ARCHIVE_SUFFIXES = (".zip", ".tar", ".tar.gz", ".tgz", ".tar.bz2", ".tbz2", ".tar.xz", ".txz")
+# Separates an archive's path from a member's name in result paths
+MEMBER_SEPARATOR = "!"
+# Members larger than this are reported as failed instead of read into memory
+MAX_MEMBER_SIZE = 512 * 1024 * 1024
+_TOO_LARGE = f"Archive member larger than {MAX_MEMBER_SIZE // (1024 * 1024)} MB"
+
+
+def is_archive(file_path: Path) -> bool:
+    """Return True if the file name has an archive extension."""
+    name = file_path.name.lower()
+    return any(name.endswith(suffix) for suffix in ARCHIVE_SUFFIXES)
+
+
+def member_path(archive: Path, name: str) -> str:
+    """Return the path reported for a member, e.g. ``bundle.zip!docs/a.pdf``."""
+    return f"{archive}{MEMBER_SEPARATOR}{name}"
+
+
+@dataclass
+class ArchiveMember:
+    """A supported document inside an archive; ``data`` holds TAR members' bytes."""
+
+    archive: Path
+    name: str
+    size: int
+    data: bytes | None = None
+
+    @property
+    def path(self) -> str:
+        return member_path(self.archive, self.name)
+
+
+def _supported(name: str, header: bytes) -> bool:
+    """Sniff a member: a known extension decides, otherwise its first bytes do."""
+    suffix = PurePosixPath(name).suffix.lower()
+    if suffix and suffix not in DocumentFactory.supported_extensions():
+        return False
+    return DocumentFactory.reader_for_type(detect_bytes(header, name)) is not None
+
+
+def _too_large(member: ArchiveMember) -> Dict[str, Any]:
+    return {
+        "name": PurePosixPath(member.name).name,
+        "path": member.path,
+        "error": _TOO_LARGE,
+        "status": 413,
+    }
+
+
+def iter_members(archive: Path) -> Iterator[ArchiveMember]:
+    """Yield the supported documents in an archive, in archive order.
+
+    ZIP members are only sniffed; ``read_zip_member`` reads them later.
+    TAR members come with their bytes, since a TAR stream cannot go back.
+
+    Raises:
+        ValueError: If the archive cannot be read.
+    """
+    try:
+        if archive.name.lower().endswith(".zip"):
+            with zipfile.ZipFile(archive) as zf:
+                for info in zf.infolist():
+                    if info.is_dir() or info.flag_bits & 0x1:  # Folders and encrypted members
+                        continue
+                    with zf.open(info) as f:
+                        header = f.read(HEADER_SIZE)
+                    if _supported(info.filename, header):
+                        yield ArchiveMember(archive, info.filename, info.file_size)
+            return
+        # "r|*" streams the archive and detects the compression
+        with tarfile.open(archive, "r|*") as tf:
+            for info in tf:
+                if not info.isfile():
+                    continue
+                f = tf.extractfile(info)
+                header = f.read(HEADER_SIZE)
+                if not _supported(info.name, header):
+                    continue
+                member = ArchiveMember(archive, info.name, info.size)
+                if info.size <= MAX_MEMBER_SIZE:
+                    member.data = header + f.read()
+                yield member
+    except (zipfile.BadZipFile, tarfile.TarError, EOFError, OSError) as e:
+        raise ValueError(f"Cannot read archive {archive.name}: {e}") from e
+
+
+def read_zip_member(archive: Path, name: str) -> bytes:
+    with zipfile.ZipFile(archive) as zf:
+        with zf.open(name) as f:
+            # Declared sizes can lie; never read past the limit
+            data = f.read(MAX_MEMBER_SIZE + 1)
+    if len(data) > MAX_MEMBER_SIZE:
+        raise ValueError(_TOO_LARGE)
+    return data
+
+
+def extract_member(archive: str, name: str, data: bytes | None = None) -> Dict[str, Any]:
+    """Extract one member in a worker process; failures come back as results.
+
+    Without ``data`` the member is read from the ZIP archive here.
+    """
+    path = member_path(Path(archive), name)
+    base = PurePosixPath(name).name
+    try:
+        if data is None:
+            data = read_zip_member(Path(archive), name)
+        return extract_bytes(data, base, path=path)
+    except UnsupportedFormatError as e:
+        return {"name": base, "path": path, "error": str(e), "status": 415}
+    except Exception as e:
+        return {"name": base, "path": path, "error": str(e), "status": 422}
+
+
+def extract_archive(
+    archive: Path,
+    executor: Executor,
+    workers: int,
+    include: Callable[[str], bool] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Extract the documents in an archive and yield results as they finish.
+
+    At most ``2 × workers`` members are in flight, which bounds the TAR
+    member bytes held in memory. ``include`` is called with each member's
+    path; members it rejects are skipped (e.g. when resuming). An archive
+    that cannot be read yields a single result with ``error``.
+    """
+    running: Dict[Future, ArchiveMember] = {}
+    members = iter_members(archive)
+    error = None
+    try:
+        while True:
+            try:
+                for member in members:
+                    if include is not None and not include(member.path):
+                        continue
+                    if member.size > MAX_MEMBER_SIZE:
+                        yield _too_large(member)
+                        continue
+                    future = executor.submit(extract_member, str(archive), member.name, member.data)
+                    running[future] = member
+                    member.data = None  # Now owned by the job
+                    if len(running) >= 2 * workers:
+                        break
+            except ValueError as e:
+                # Finish the members already submitted, then report the archive
+                error = str(e)
+                members = iter(())
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                member = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:  # A worker limit was hit, or the worker died
+                    result = {"name": PurePosixPath(member.name).name, "path": member.path, "error": str(e)}
+                yield result
+    finally:
+        for future in running:
+            future.cancel()
+    if error is not None:
+        yield {"name": archive.name, "path": str(archive), "error": error}
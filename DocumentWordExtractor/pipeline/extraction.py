@@ -0,0 +1,193 @@
+"""Process-safe document extraction used by the headless modes."""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from readers.base_reader import BaseReader, Source
+from readers.document_factory import DocumentFactory
+from readers.file_type_detector import HEADER_SIZE, detect_bytes, detect_file_type
+from readers.pdf_reader import PdfReader
+from processors.word_extractor import WordExtractor
+from processors.word_offsets import WordOffsetIndex
+from utils.instrumentation import StageRecorder
+
+
+class UnsupportedFormatError(ValueError):
+    """Raised when no reader is registered for a file."""
+
+
+def extract_file(
+    file_path: Path,
+    display_name: str | None = None,
+    recorder: StageRecorder | None = None,
+    pages: tuple[int, int] | None = None,
+    pdf_word_stream: bool = False,
+) -> Dict[str, Any]:
+    """Read a document and return its words, counts and metadata.
+
+    Args:
+        file_path: Document to read.
+        display_name: Name to report instead of the file name (e.g. for
+            uploads stored under a temporary name).
+        recorder: Stage recorder to fill; a new one is used if omitted.
+        pages: ``[start, stop)`` page range to read from a PDF; the
+            result then also reports ``pages``. Ignored for other formats.
+        pdf_word_stream: Tokenize PDFs from PyMuPDF's word stream, which
+            joins words hyphenated across line breaks, instead of running
+            the word pattern over the page text. About 20% slower.
+
+    Returns:
+        JSON-serializable result with ``words`` as a list of
+        ``{"word", "count"}`` objects in first-occurrence order, and
+        ``stages`` with the per-stage metrics. PDFs also report
+        ``skipped_pages`` (pages without a text layer); with
+        ``pdf_word_stream`` they do not report ``characters``.
+
+    Raises:
+        UnsupportedFormatError: If the file type is not supported.
+        ValueError: If the document is corrupted or unreadable.
+    """
+    start = time.perf_counter()
+    name = display_name or file_path.name
+    recorder = recorder or StageRecorder(name)
+    with recorder.stage("detect"):
+        file_type = detect_file_type(file_path)
+        reader = DocumentFactory.get_reader(file_path)
+    if not reader:
+        raise UnsupportedFormatError(f"Unsupported format: {file_path.suffix}")
+    return _extract(
+        reader, file_path, name, str(file_path), file_type, recorder, pages, start, pdf_word_stream
+    )
+
+
+def extract_bytes(
+    data: bytes,
+    name: str,
+    path: str | None = None,
+    recorder: StageRecorder | None = None,
+) -> Dict[str, Any]:
+    """Extract a document held in memory, like ``extract_file`` does from disk.
+
+    The type comes from the extension of ``name``, or else from the first
+    bytes. ``path`` is reported as the result's path (e.g. a URL or an
+    archive member); it defaults to ``name``.
+
+    Raises:
+        UnsupportedFormatError: If the type is not supported.
+        ValueError: If the document is corrupted or unreadable.
+    """
+    start = time.perf_counter()
+    recorder = recorder or StageRecorder(name)
+    with recorder.stage("detect"):
+        file_type = detect_bytes(data[:HEADER_SIZE], name)
+        reader = DocumentFactory.reader_for_type(file_type)
+    if not reader:
+        raise UnsupportedFormatError(f"Unsupported format: {Path(name).suffix or 'unknown'}")
+    return _extract(reader, data, name, path or name, file_type, recorder, None, start)
+
+
+def _extract(
+    reader: BaseReader,
+    source: Source,
+    name: str,
+    path: str,
+    file_type: str | None,
+    recorder: StageRecorder,
+    pages: tuple[int, int] | None,
+    start: float,
+    pdf_word_stream: bool = False,
+) -> Dict[str, Any]:
+    extra: Dict[str, Any] = {}
+    if isinstance(reader, PdfReader) and pdf_word_stream:
+        with recorder.stage("read", "pages") as stage:
+            pdf_words = reader.read_words(source, pages)
+            first, last = pages if pages is not None else (0, pdf_words.page_count)
+            last = min(last, pdf_words.page_count)
+            stage.items = max(last - first, 0) - len(pdf_words.skipped_pages)
+        with recorder.stage("tokenize", "tokens") as stage:
+            counts = WordExtractor.count_tokens(pdf_words.words)
+            stage.items = len(pdf_words.words)
+        extra["skipped_pages"] = pdf_words.skipped_pages
+        if pages is not None:
+            extra["pages"] = [first, last]
+    elif isinstance(reader, PdfReader):
+        with recorder.stage("read", "pages") as stage:
+            text, skipped_pages = reader.read_text(source, pages)
+            first, last = pages if pages is not None else (0, reader.last_page_count)
+            last = min(last, reader.last_page_count)
+            stage.items = max(last - first, 0) - len(skipped_pages)
+        with recorder.stage("tokenize", "tokens") as stage:
+            counts = WordExtractor.count_words(text)
+            stage.items = sum(counts.values())
+        extra["characters"] = len(text)
+        extra["skipped_pages"] = skipped_pages
+        if pages is not None:
+            extra["pages"] = [first, last]
+    else:
+        with recorder.stage("read", "pages") as stage:
+            reader.last_page_count = None
+            text = reader.read(source)
+            stage.items = reader.last_page_count
+        with recorder.stage("tokenize", "tokens") as stage:
+            counts = WordExtractor.count_words(text)
+            stage.items = sum(counts.values())
+        extra["characters"] = len(text)
+    return {
+        "name": name,
+        "path": path,
+        "type": file_type,
+        **extra,
+        "total_words": stage.items,
+        "unique_words": len(counts),
+        "words": [{"word": w, "count": n} for w, n in counts.items()],
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+        "stages": recorder.as_dict()["stages"],
+    }
+
+
+def load_document(file_path: Path) -> tuple[str, WordOffsetIndex, StageRecorder]:
+    """Read a document and index its word occurrences, as the viewer needs.
+
+    Returns the text, its word offset index and the stage metrics. Runs in
+    a worker process when the application isolates loading, so everything
+    returned is picklable.
+
+    Raises:
+        UnsupportedFormatError: If the file type is not supported.
+        ValueError: If the document is corrupted or unreadable.
+    """
+    metrics = StageRecorder(file_path.name)
+    with metrics.stage("detect"):
+        reader = DocumentFactory.get_reader(file_path)
+    if not reader:
+        raise UnsupportedFormatError(f"Unsupported format: {file_path.suffix}")
+    with metrics.stage("read", "pages") as stage:
+        reader.last_page_count = None
+        text = reader.read(file_path)
+        stage.items = reader.last_page_count
+    with metrics.stage("index", "tokens") as stage:
+        offsets = WordOffsetIndex(text)
+        stage.items = len(offsets.ids)
+    return text, offsets, metrics
+
+
+def extract_batch(items: List[tuple[str, str | None]]) -> List[Dict[str, Any]]:
+    """Extract several documents in one call (one process-pool round trip).
+
+    Args:
+        items: ``(path, display_name)`` pairs.
+
+    Returns:
+        One result per item; failures are reported as ``{"error", "status"}``
+        instead of raising, so one bad file does not fail the whole batch.
+    """
+    results = []
+    for path, name in items:
+        try:
+            results.append(extract_file(Path(path), name))
+        except UnsupportedFormatError as e:
+            results.append({"name": name or Path(path).name, "error": str(e), "status": 415})
+        except Exception as e:
+            results.append({"name": name or Path(path).name, "error": str(e), "status": 422})
+    return results
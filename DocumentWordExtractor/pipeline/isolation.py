@@ -0,0 +1,301 @@
+"""Isolated, recyclable worker processes with per-job time and memory limits.
+
+``IsolatedWorkerPool`` is an ``Executor`` like ``ProcessPoolExecutor``,
+but each job runs under limits enforced from outside the job:
+
+- a wall-clock deadline: a worker still busy when its job's deadline
+  passes is killed;
+- an address-space cap (``RLIMIT_AS``, on POSIX systems): allocations
+  beyond it raise MemoryError inside the worker, which reports it and
+  exits.
+
+In both cases, and when a worker dies on its own (a crash in a native
+library, the OOM killer), only that job fails, with a
+``WorkerLimitError``. The worker is replaced and the rest of the queue
+goes on. A ``ProcessPoolExecutor`` instead marks the whole pool broken.
+Workers are also replaced after ``max_tasks_per_worker`` jobs, so slow
+leaks in native readers cannot build up.
+"""
+
+import multiprocessing
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from multiprocessing.connection import wait as wait_any
+from typing import Any, Callable, Deque, List, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Defaults shared by the batch command and the application
+DEFAULT_TIMEOUT = 300.0
+DEFAULT_MEMORY_LIMIT_MB = 4096
+
+
+class WorkerLimitError(RuntimeError):
+    """A job broke a worker limit or took its worker process down."""
+
+
+class DeadlineExceeded(WorkerLimitError):
+    """The job ran past its wall-clock deadline."""
+
+
+class MemoryLimitExceeded(WorkerLimitError):
+    """The job ran out of its worker's address-space cap."""
+
+
+class WorkerCrashed(WorkerLimitError):
+    """The worker process died while running the job."""
+
+
+_MEMORY_ERROR = "memory"
+
+
+def _limit_memory(limit_bytes: int) -> None:
+    soft, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit_bytes = min(limit_bytes, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit_bytes, hard))
+
+
+def _worker_main(conn, memory_limit: int | None) -> None:
+    """Run jobs received on ``conn`` until told to stop."""
+    if memory_limit and resource is not None:
+        _limit_memory(memory_limit)
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        fn, args, kwargs = task
+        try:
+            conn.send((True, fn(*args, **kwargs)))
+        except MemoryError:
+            # The heap may be fragmented or half-initialized; start afresh
+            conn.send((False, _MEMORY_ERROR))
+            return
+        except BaseException as e:
+            try:
+                conn.send((False, e))
+            except Exception:  # Unpicklable exception
+                conn.send((False, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    """One worker process and the job it is running, if any."""
+
+    __slots__ = ("process", "conn", "future", "deadline", "jobs")
+
+    def __init__(self, context, memory_limit: int | None) -> None:
+        self.conn, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child, memory_limit), daemon=True)
+        try:
+            self.process.start()
+        except BaseException:
+            self.conn.close()
+            raise
+        finally:
+            child.close()
+        self.future: Future | None = None
+        self.deadline: float | None = None
+        self.jobs = 0
+
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except OSError:
+                self.process.kill()
+        self.process.join(1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class IsolatedWorkerPool(Executor):
+    """Executor running each job in a worker process under limits.
+
+    Workers are started on demand, up to ``max_workers``, and kept for
+    later jobs. ``timeout`` is in seconds and ``memory_limit_mb`` in
+    megabytes of address space; None disables either limit. Functions and
+    arguments must be picklable, as with ``ProcessPoolExecutor``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        memory_limit_mb: int | None = DEFAULT_MEMORY_LIMIT_MB,
+        max_tasks_per_worker: int | None = 100,
+        mp_context=None,
+    ) -> None:
+        self.max_workers = max_workers or multiprocessing.cpu_count() or 2
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_tasks_per_worker = max_tasks_per_worker
+        self.replaced_workers = 0
+        self._context = mp_context or multiprocessing.get_context()
+        self._memory_limit = memory_limit_mb * 1024 * 1024 if memory_limit_mb else None
+        self._queue: Deque[Tuple[Future, Callable, tuple, dict]] = deque()
+        self._lock = threading.Lock()
+        self._idle: List[_Worker] = []
+        self._busy: List[_Worker] = []
+        self._shutdown = False
+        self._terminate = False
+        self._wake_reader, self._wake_writer = self._context.Pipe(duplex=False)
+        self._manager: threading.Thread | None = None
+
+    def submit(self, fn: Callable, /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.append((future, fn, args, kwargs))
+            if self._manager is None:
+                self._manager = threading.Thread(target=self._manage, name="IsolatedWorkerPool", daemon=True)
+                self._manager.start()
+        self._wake()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._lock:
+            self._shutdown = True
+            if cancel_futures:
+                while self._queue:
+                    self._queue.popleft()[0].cancel()
+        self._wake()
+        if wait and self._manager is not None:
+            self._manager.join()
+
+    def terminate(self) -> None:
+        """Cancel queued jobs and kill running ones (they fail with WorkerCrashed)."""
+        with self._lock:
+            self._terminate = True
+        self.shutdown(wait=True, cancel_futures=True)
+
+    def _wake(self) -> None:
+        try:
+            self._wake_writer.send_bytes(b"")
+        except OSError:
+            pass
+
+    def _manage(self) -> None:
+        try:
+            while self._step():
+                pass
+        finally:
+            for worker in self._idle:
+                worker.stop()
+            for worker in self._busy:
+                worker.stop(kill=True)
+                self._fail(worker, WorkerCrashed("Worker pool was shut down"))
+            self._idle, self._busy = [], []
+            self._wake_reader.close()
+            self._wake_writer.close()
+
+    def _step(self) -> bool:
+        """Dispatch, wait for one event, and handle it; False once done."""
+        with self._lock:
+            if self._terminate:
+                return False
+        self._dispatch()
+        with self._lock:
+            if self._shutdown and not self._queue and not self._busy:
+                return False
+        deadlines = [w.deadline for w in self._busy if w.deadline is not None]
+        wait_for = max(min(deadlines) - time.monotonic(), 0) if deadlines else None
+        handles = [self._wake_reader]
+        for worker in self._busy:
+            handles += (worker.conn, worker.process.sentinel)
+        ready = set(wait_any(handles, wait_for))
+        if self._wake_reader in ready:
+            while self._wake_reader.poll():
+                self._wake_reader.recv_bytes()
+        now = time.monotonic()
+        for worker in list(self._busy):
+            if worker.conn in ready:
+                self._receive(worker)
+            elif worker.process.sentinel in ready:
+                code = worker.process.exitcode
+                self._replace(worker, WorkerCrashed(f"Worker process died (exit code {code})"))
+            elif worker.deadline is not None and now >= worker.deadline:
+                self._replace(worker, DeadlineExceeded(f"Timed out after {self.timeout:g} s"), kill=True)
+        return True
+
+    def _dispatch(self) -> None:
+        """Hand queued jobs to idle workers, starting workers as needed.
+
+        Only taking a job off the queue holds the lock: starting a worker
+        can take a while, and submit() must not wait for it.
+        """
+        while self._idle or len(self._busy) < self.max_workers:
+            with self._lock:
+                if not self._queue:
+                    return
+                future, fn, args, kwargs = self._queue.popleft()
+            if not future.set_running_or_notify_cancel():
+                continue
+            if self._idle:
+                worker = self._idle.pop()
+            else:
+                try:
+                    worker = _Worker(self._context, self._memory_limit)
+                except Exception as e:  # No process to be had (EAGAIN, ENOMEM)
+                    future.set_exception(e)
+                    continue
+            try:
+                worker.conn.send((fn, args, kwargs))
+            except Exception as e:  # Unpicklable job, or the worker is gone
+                future.set_exception(e)
+                worker.stop(kill=True)
+                continue
+            worker.future = future
+            worker.deadline = time.monotonic() + self.timeout if self.timeout else None
+            self._busy.append(worker)
+
+    def _receive(self, worker: _Worker) -> None:
+        try:
+            ok, value = worker.conn.recv()
+        except (EOFError, OSError):
+            code = worker.process.exitcode
+            self._replace(worker, WorkerCrashed(f"Worker process died (exit code {code})"))
+            return
+        except Exception as e:  # Unpicklable result
+            ok, value = False, e
+        if not ok and value == _MEMORY_ERROR:
+            limit = f"the {self.memory_limit_mb} MB memory limit" if self.memory_limit_mb else "memory"
+            self._replace(worker, MemoryLimitExceeded(f"Ran out of {limit}"))
+            return
+        future = worker.future
+        self._busy.remove(worker)
+        worker.future = worker.deadline = None
+        worker.jobs += 1
+        if self.max_tasks_per_worker and worker.jobs >= self.max_tasks_per_worker:
+            worker.stop()
+        else:
+            self._idle.append(worker)
+        if ok:
+            future.set_result(value)
+        else:
+            future.set_exception(value)
+
+    def _replace(self, worker: _Worker, error: WorkerLimitError, kill: bool = False) -> None:
+        """Fail the worker's job and retire it; the next dispatch starts a new one."""
+        self._busy.remove(worker)
+        worker.stop(kill=kill or worker.process.is_alive())
+        self.replaced_workers += 1
+        self._fail(worker, error)
+
+    @staticmethod
+    def _fail(worker: _Worker, error: WorkerLimitError) -> None:
+        if worker.future is not None and not worker.future.done():
+            worker.future.set_exception(error)
+        worker.future = None
@@ -0,0 +1,181 @@
+"""Append-only journal that makes batch runs resumable.
+
+A batch writes each result as one JSON line to its output file. The
+journal is a second append-only file with one entry per finished
+document: its path, content fingerprint, and the byte offset, length and
+CRC-32 of its output line. The output is fsynced before the entries
+that point into it are written, so the journal never refers to output a
+crash could lose. Both files are synced in batches, every
+``sync_every`` results or ``sync_interval`` seconds, rather than once
+per document.
+
+On resume, journaled lines are checked against the output. Output after
+the last valid entry, such as a torn line or results written but not
+yet journaled when the run stopped, is truncated. Those documents are
+extracted again. So is a document whose content changed since it was
+journaled; its new line supersedes the earlier one for the same path.
+"""
+
+import json
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List
+
+JOURNAL_SUFFIX = ".journal"
+
+
+class BatchJournal:
+    """Writes batch results to an output file and journals each one.
+
+    Use as a context manager; leaving it syncs everything still pending.
+    """
+
+    def __init__(
+        self,
+        output: Path,
+        journal: Path | None = None,
+        sync_every: int = 64,
+        sync_interval: float = 1.0,
+    ) -> None:
+        self.output = Path(output)
+        self.journal = Path(journal) if journal else self.output.with_name(self.output.name + JOURNAL_SUFFIX)
+        self.sync_every = max(1, sync_every)
+        self.sync_interval = sync_interval
+        # Journal entries of finished documents by path
+        self.completed: Dict[str, Dict[str, Any]] = {}
+        self.truncated_bytes = 0
+        self._out = None
+        self._log = None
+        self._entries: List[Dict[str, Any]] = []  # Valid entries in output order
+        self._pending: List[Dict[str, Any]] = []
+        self._torn = False
+        self._last_sync = time.monotonic()
+
+    def __enter__(self) -> "BatchJournal":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def open(self, restart: bool = False) -> None:
+        """Open both files, resuming from the journal unless ``restart`` is set."""
+        self.output.parent.mkdir(parents=True, exist_ok=True)
+        if restart:
+            for path in (self.output, self.journal):
+                path.unlink(missing_ok=True)
+        entries = self._read_entries()
+        self._out = open(self.output, "a+b")
+        valid_end = self._validate(entries)
+        size = self._out.seek(0, os.SEEK_END)
+        if size > valid_end:
+            self.truncated_bytes = size - valid_end
+            self._out.truncate(valid_end)
+            self._out.flush()
+            os.fsync(self._out.fileno())
+        if self._torn or len(self._entries) < len(entries):
+            # Rewrite the journal without the torn line and dropped entries
+            self._rewrite_journal()
+        self._log = open(self.journal, "a", encoding="utf-8")
+
+    def _read_entries(self) -> List[Dict[str, Any]]:
+        entries = []
+        self._torn = False
+        try:
+            with open(self.journal, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        entry["path"], entry["offset"], entry["length"], entry["crc"]
+                    except (ValueError, KeyError, TypeError):
+                        self._torn = True  # Torn last line after a crash
+                        break
+                    entries.append(entry)
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _validate(self, entries: List[Dict[str, Any]]) -> int:
+        """Keep entries whose output lines are intact; return where the valid output ends.
+
+        Entries are checked in order and the first bad one ends the valid
+        prefix, since later output may have shifted with it.
+        """
+        end = 0
+        out = self._out
+        size = out.seek(0, os.SEEK_END)
+        self._entries = []
+        for entry in entries:
+            offset, length = entry["offset"], entry["length"]
+            if offset != end or offset + length > size:
+                break
+            out.seek(offset)
+            if zlib.crc32(out.read(length)) != entry["crc"]:
+                break
+            end = offset + length
+            self._entries.append(entry)
+            self.completed[entry["path"]] = entry
+        return end
+
+    def _rewrite_journal(self) -> None:
+        tmp = self.journal.with_name(self.journal.name + ".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(e, ensure_ascii=False) + "\n" for e in self._entries)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.journal)
+
+    def is_done(self, file_path: Path, fingerprint: str | None, retry_failed: bool = False) -> bool:
+        """Return True if a document was finished with the same content."""
+        entry = self.completed.get(str(file_path))
+        if entry is None or fingerprint is None or entry.get("fingerprint") != fingerprint:
+            return False
+        return not (retry_failed and entry.get("error"))
+
+    def write(self, result: Dict[str, Any], fingerprint: str | None) -> None:
+        """Append a result to the output; its journal entry follows at the next sync."""
+        data = (json.dumps(result, ensure_ascii=False) + "\n").encode("utf-8")
+        offset = self._out.seek(0, os.SEEK_END)
+        self._out.write(data)
+        entry = {
+            "path": result["path"],
+            "fingerprint": fingerprint,
+            "offset": offset,
+            "length": len(data),
+            "crc": zlib.crc32(data),
+        }
+        if "error" in result:
+            entry["error"] = True
+        self._pending.append(entry)
+        if (
+            len(self._pending) >= self.sync_every
+            or time.monotonic() - self._last_sync >= self.sync_interval
+        ):
+            self.sync()
+
+    def sync(self) -> None:
+        """Make pending output durable, then journal it."""
+        self._last_sync = time.monotonic()
+        if not self._pending:
+            return
+        self._out.flush()
+        os.fsync(self._out.fileno())
+        self._log.writelines(json.dumps(e, ensure_ascii=False) + "\n" for e in self._pending)
+        self._log.flush()
+        os.fsync(self._log.fileno())
+        for entry in self._pending:
+            self._entries.append(entry)
+            self.completed[entry["path"]] = entry
+        self._pending = []
+
+    def close(self) -> None:
+        if self._out is None:
+            return
+        try:
+            self.sync()
+        finally:
+            self._out.close()
+            self._log.close()
+            self._out = self._log = None
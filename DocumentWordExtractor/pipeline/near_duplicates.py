@@ -0,0 +1,273 @@
+"""Near-duplicate document detection with MinHash signatures and LSH.
+
+A document's signature is a one-permutation MinHash over the shingles
+(runs of ``shingle_size`` lowercased words) of at most ``max_tokens``
+words from its start. Each shingle is hashed once, not once per
+permutation. Documents whose signatures agree in at least one LSH band
+become candidates. Only candidates whose estimated Jaccard similarity
+reaches the threshold are clustered.
+
+The text comes from ``BaseReader.iter_text``, which stops reading once
+enough words are collected. A signature therefore costs a fraction of a
+full extraction on long documents, and on short ones it skips the word
+counting.
+"""
+
+import unicodedata
+import zlib
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Sequence, Tuple
+
+from processors.word_extractor import WordExtractor
+from readers.document_factory import DocumentFactory
+
+NUM_PERM = 128
+SHINGLE_SIZE = 4
+MAX_TOKENS = 10_000
+DEFAULT_THRESHOLD = 0.8
+
+_MASK = (1 << 64) - 1
+_EMPTY = _MASK
+_OFFSET = 1 << 63  # Shifts signed hash values into the unsigned range
+
+
+def sample_tokens(file_path: Path, max_tokens: int = MAX_TOKENS) -> List[str]:
+    """Return up to ``max_tokens`` lowercased words from the start of a document.
+
+    Text is NFKC-normalized first, so ligatures in PDFs ("ﬂ") match the
+    plain letters of the same text in DOCX or TXT.
+
+    Raises:
+        ValueError: If the format is unsupported or the file is unreadable.
+    """
+    reader = DocumentFactory.get_reader(file_path)
+    if reader is None:
+        raise ValueError(f"Unsupported format: {file_path.suffix}")
+    find_words = WordExtractor.WORD_PATTERN.findall
+    tokens: List[str] = []
+    for piece in reader.iter_text(file_path):
+        tokens.extend(find_words(unicodedata.normalize("NFKC", piece).lower()))
+        if len(tokens) >= max_tokens:
+            del tokens[max_tokens:]
+            break
+    return tokens
+
+
+def minhash(tokens: Sequence[str], num_perm: int = NUM_PERM, shingle_size: int = SHINGLE_SIZE) -> array | None:
+    """Return the one-permutation MinHash signature of a token sequence.
+
+    Each shingle hash picks a bucket (``hash % num_perm``) and the bucket
+    keeps its smallest value. Buckets no shingle landed in borrow from the
+    next filled bucket (rotation densification). This keeps a bucket
+    match an unbiased estimate of the Jaccard similarity. Returns None
+    when there are no tokens.
+    """
+    if not tokens:
+        return None
+    # Hash every distinct word once; word frequencies are Zipfian
+    word_hash = {w: zlib.crc32(w.encode("utf-8")) for w in dict.fromkeys(tokens)}
+    hashes = list(map(word_hash.__getitem__, tokens))
+    k = min(shingle_size, len(hashes))
+    # Tuple hashes of ints are deterministic (no hash randomization), well
+    # mixed and computed in C; so are the set and the sort
+    shingles = sorted(set(map(hash, zip(*(hashes[i:] for i in range(k))))))
+
+    # Ascending order visits each bucket's minimum first, so the loop can
+    # stop as soon as every bucket is filled (after about n·ln n values)
+    mins = [_EMPTY] * num_perm
+    remaining = num_perm
+    for h in shingles:
+        value, bucket = divmod(h, num_perm)
+        if mins[bucket] == _EMPTY:
+            mins[bucket] = value + _OFFSET
+            remaining -= 1
+            if not remaining:
+                break
+    return array("Q", _densify(mins))
+
+
+def _densify(mins: List[int]) -> List[int]:
+    """Fill empty buckets from the next filled one to their right (circular)."""
+    n = len(mins)
+    filled = [i for i in range(n) if mins[i] != _EMPTY]
+    if len(filled) == n or not filled:
+        return mins
+    result = list(mins)
+    source = filled[0]
+    for i in range(n - 1, -1, -1):
+        if mins[i] != _EMPTY:
+            source = i
+        else:
+            # Offset by the distance so borrowed values differ between buckets
+            result[i] = (mins[source] + ((source - i) % n) * 0x9E3779B97F4A7C15) & _MASK
+    return result
+
+
+def similarity(a: Sequence[int], b: Sequence[int]) -> float:
+    """Estimate the Jaccard similarity of two signatures."""
+    return sum(x == y for x, y in zip(a, b)) / len(a)
+
+
+def file_signature(
+    file_path: Path,
+    num_perm: int = NUM_PERM,
+    shingle_size: int = SHINGLE_SIZE,
+    max_tokens: int = MAX_TOKENS,
+) -> array | None:
+    """Compute the signature of a document (None if it has no words).
+
+    Raises:
+        ValueError: If the format is unsupported or the file is unreadable.
+    """
+    return minhash(sample_tokens(file_path, max_tokens), num_perm, shingle_size)
+
+
+def lsh_bands(num_perm: int, threshold: float) -> Tuple[int, int]:
+    """Choose ``(bands, rows)`` whose candidate curve crosses near ``threshold``.
+
+    A pair with similarity s becomes a candidate with probability
+    ``1 - (1 - s**rows) ** bands``. The split minimizing the summed false
+    positive and false negative areas around the threshold is chosen.
+    """
+    def area(f, lo, hi, steps=50):
+        width = (hi - lo) / steps
+        return sum(f(lo + (i + 0.5) * width) for i in range(steps)) * width
+
+    best, best_error = (num_perm, 1), float("inf")
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        false_pos = area(lambda s: 1 - (1 - s ** rows) ** bands, 0.0, threshold)
+        false_neg = area(lambda s: (1 - s ** rows) ** bands, threshold, 1.0)
+        if false_pos + false_neg < best_error:
+            best, best_error = (bands, rows), false_pos + false_neg
+    return best
+
+
+@dataclass
+class DuplicateCluster:
+    """Documents judged near-duplicates of one representative.
+
+    ``duplicates`` holds ``(key, similarity)`` pairs, the similarity being
+    estimated against the representative.
+    """
+
+    representative: str
+    duplicates: List[Tuple[str, float]] = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return {
+            "representative": self.representative,
+            "duplicates": [{"path": k, "similarity": round(s, 3)} for k, s in self.duplicates],
+        }
+
+
+class NearDuplicateIndex:
+    """LSH index grouping signatures into near-duplicate clusters.
+
+    Keys are added in input order and the first key of each cluster is its
+    representative. Clusters are the connected components of the pairs at
+    or above the threshold. A chain A~B~C is therefore one cluster even if
+    A and C alone would fall below it.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD, num_perm: int = NUM_PERM) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError("threshold must be in (0, 1]")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+        self._keys: List[str] = []
+        self._signatures: List[array] = []
+        self._buckets: List[Dict[bytes, List[int]]] = [{} for _ in range(self.bands)]
+        self._parent: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: str, signature: array) -> None:
+        """Add a document's signature and link it to its near-duplicates."""
+        if len(signature) != self.num_perm:
+            raise ValueError(f"Expected a signature of {self.num_perm} values")
+        index = len(self._keys)
+        self._keys.append(key)
+        self._signatures.append(signature)
+        self._parent.append(index)
+        raw = signature.tobytes()
+        width = self.rows * signature.itemsize
+        checked = set()
+        for band, buckets in enumerate(self._buckets):
+            members = buckets.setdefault(raw[band * width:(band + 1) * width], [])
+            for other in members:
+                if other not in checked:
+                    checked.add(other)
+                    if similarity(signature, self._signatures[other]) >= self.threshold:
+                        self._union(other, index)
+            members.append(index)
+
+    def _find(self, i: int) -> int:
+        parent = self._parent
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def _union(self, a: int, b: int) -> None:
+        ra, rb = self._find(a), self._find(b)
+        if ra != rb:
+            # The earlier document stays the root, and so the representative
+            self._parent[max(ra, rb)] = min(ra, rb)
+
+    def clusters(self, include_singletons: bool = False) -> List[DuplicateCluster]:
+        """Return the clusters in input order of their representatives."""
+        groups: Dict[int, List[int]] = {}
+        for i in range(len(self._keys)):
+            groups.setdefault(self._find(i), []).append(i)
+        result = []
+        for root, members in groups.items():
+            if len(members) == 1 and not include_singletons:
+                continue
+            rep = self._signatures[root]
+            result.append(DuplicateCluster(
+                self._keys[root],
+                [(self._keys[i], similarity(rep, self._signatures[i])) for i in members[1:]],
+            ))
+        return result
+
+
+def find_near_duplicates(
+    paths: Iterable[Path],
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = NUM_PERM,
+    shingle_size: int = SHINGLE_SIZE,
+    max_tokens: int = MAX_TOKENS,
+) -> Tuple[List[DuplicateCluster], Dict[str, str]]:
+    """Cluster documents by near-duplicate content.
+
+    Returns:
+        Every document as a cluster (singletons included) in input order,
+        and a ``{path: error}`` map of documents that could not be read.
+        Documents without words are kept as singletons.
+    """
+    index = NearDuplicateIndex(threshold, num_perm)
+    errors: Dict[str, str] = {}
+    empty: List[str] = []
+    order: List[str] = []
+    for path in paths:
+        key = str(path)
+        try:
+            signature = file_signature(Path(path), num_perm, shingle_size, max_tokens)
+        except Exception as e:
+            errors[key] = str(e)
+            continue
+        order.append(key)
+        if signature is None:
+            empty.append(key)
+        else:
+            index.add(key, signature)
+    clusters = {c.representative: c for c in index.clusters(include_singletons=True)}
+    clusters.update((key, DuplicateCluster(key)) for key in empty)
+    return [clusters[k] for k in order if k in clusters], errors
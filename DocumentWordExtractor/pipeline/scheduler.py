@@ -0,0 +1,284 @@
+"""Cost-aware scheduling of batch extractions over a process pool.
+
+Every document gets a cheap cost estimate before any work starts: its
+page count for PDFs (read from the cross-reference table, no page is
+parsed), its size in bytes for other formats. Costs are measured in page
+equivalents, roughly the time to extract one PDF page. Jobs run longest
+first, so one huge document starts early instead of running alone at
+the end of the queue. PDFs longer than ``split_pages`` are split into
+page-range jobs whose results are merged once all parts are done.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+from pipeline.extraction import UnsupportedFormatError, extract_file
+from pipeline.isolation import DEFAULT_MEMORY_LIMIT_MB, DEFAULT_TIMEOUT, IsolatedWorkerPool
+
+# Pages per sub-job when a PDF is split; 0 disables splitting
+SPLIT_PAGES = 200
+
+# Bytes per page equivalent, from extraction times of generated documents
+BYTES_PER_PAGE = {".docx": 4_000, ".txt": 60_000}
+DEFAULT_BYTES_PER_PAGE = 20_000
+# Fixed cost of a job (process round trip, opening the file)
+JOB_OVERHEAD = 1.0
+
+
+def estimate_cost(file_path: Path) -> Tuple[float, int | None]:
+    """Return a document's estimated cost in page equivalents and its page count.
+
+    The page count is None for formats without pages, or when a PDF cannot
+    be opened; the cost then falls back to the file size.
+    """
+    suffix = file_path.suffix.lower()
+    if suffix == ".pdf":
+        try:
+            import fitz  # PyMuPDF
+
+            with fitz.open(file_path) as doc:
+                pages = doc.page_count
+            return JOB_OVERHEAD + pages, pages
+        except Exception:
+            pass
+    try:
+        size = os.path.getsize(file_path)
+    except OSError:
+        size = 0
+    return JOB_OVERHEAD + size / BYTES_PER_PAGE.get(suffix, DEFAULT_BYTES_PER_PAGE), None
+
+
+@dataclass
+class Job:
+    """One unit of work: a whole document or a page range of a PDF."""
+
+    path: Path
+    cost: float
+    pages: Tuple[int, int] | None = None
+    part: int = 0
+    parts: int = 1
+
+
+def plan_jobs(paths: Iterable[Path], split_pages: int = SPLIT_PAGES) -> List[Job]:
+    """Estimate every document and return its jobs, most expensive first.
+
+    A document given more than once is planned once, under the first of
+    its paths. Equal costs keep the input order (the sort is stable).
+    """
+    jobs: List[Job] = []
+    seen = set()
+    for path in paths:
+        path = Path(path)
+        key = path.resolve()
+        if key in seen:
+            continue
+        seen.add(key)
+        cost, page_count = estimate_cost(path)
+        if page_count and split_pages > 0 and page_count > split_pages:
+            # Equal ranges, so no part is left much smaller than the others
+            parts = -(-page_count // split_pages)
+            size = -(-page_count // parts)
+            for part, start in enumerate(range(0, page_count, size)):
+                stop = min(start + size, page_count)
+                jobs.append(Job(path, JOB_OVERHEAD + stop - start, (start, stop), part, parts))
+        else:
+            jobs.append(Job(path, cost))
+    jobs.sort(key=lambda job: -job.cost)
+    return jobs
+
+
+def run_job(path: str, pages: Tuple[int, int] | None) -> Dict[str, Any]:
+    """Extract one job in a worker process; failures come back as results."""
+    file_path = Path(path)
+    try:
+        return extract_file(file_path, pages=pages)
+    except UnsupportedFormatError as e:
+        return {"name": file_path.name, "path": path, "error": str(e), "status": 415}
+    except Exception as e:
+        return {"name": file_path.name, "path": path, "error": str(e), "status": 422}
+
+
+def merge_parts(parts: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine the page-range results of one PDF, given in page order.
+
+    Counts are merged case-insensitively and words keep their first
+    occurrence across the ranges, as a whole-document extraction would.
+    Stage timings are summed over the parts.
+    """
+    failed = [p for p in parts if "error" in p]
+    if failed:
+        return dict(failed[0], parts=len(parts))
+    merged: Dict[str, list] = {}
+    for part in parts:
+        for entry in part["words"]:
+            key = entry["word"].lower()
+            held = merged.get(key)
+            if held is None:
+                merged[key] = [entry["word"], entry["count"]]
+            else:
+                held[1] += entry["count"]
+    stages: Dict[str, Dict[str, Any]] = {}
+    for part in parts:
+        for stage in part["stages"]:
+            total = stages.get(stage["stage"])
+            if total is None:
+                stages[stage["stage"]] = dict(stage)
+                continue
+            for key in ("wall_ms", "cpu_ms", "items"):
+                if total.get(key) is not None and stage.get(key) is not None:
+                    total[key] = round(total[key] + stage[key], 3)
+            if stage.get("peak_kb") is not None:
+                total["peak_kb"] = max(total.get("peak_kb") or 0, stage["peak_kb"])
+    first = parts[0]
+    return {
+        "name": first["name"],
+        "path": first["path"],
+        "type": first["type"],
+        **({"characters": sum(part["characters"] for part in parts)} if "characters" in first else {}),
+        "skipped_pages": [p for part in parts for p in part["skipped_pages"]],
+        "total_words": sum(part["total_words"] for part in parts),
+        "unique_words": len(merged),
+        "words": [{"word": w, "count": n} for w, n in merged.values()],
+        "elapsed_ms": round(sum(part["elapsed_ms"] for part in parts), 2),
+        "parts": len(parts),
+        "stages": list(stages.values()),
+    }
+
+
+@dataclass
+class BatchProgress:
+    """Live totals of a batch run.
+
+    Throughput is measured in page equivalents per second over the whole
+    run so far. The ETA divides the remaining estimated cost by it.
+    """
+
+    documents: int = 0
+    cost: float = 0.0
+    documents_done: int = 0
+    failed: int = 0
+    cost_done: float = 0.0
+    started: float = field(default_factory=time.monotonic)
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def throughput(self) -> float:
+        """Page equivalents per second (0 until the first job finishes)."""
+        elapsed = self.elapsed
+        return self.cost_done / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """Estimated seconds left, or None before there is a rate to go by."""
+        rate = self.throughput
+        if rate <= 0:
+            return None
+        return max(self.cost - self.cost_done, 0.0) / rate
+
+    def as_dict(self) -> Dict[str, Any]:
+        eta = self.eta
+        return {
+            "documents": self.documents,
+            "documents_done": self.documents_done,
+            "failed": self.failed,
+            "pages": round(self.cost, 1),
+            "pages_done": round(self.cost_done, 1),
+            "pages_per_second": round(self.throughput, 2),
+            "elapsed_s": round(self.elapsed, 1),
+            "eta_s": round(eta, 1) if eta is not None else None,
+        }
+
+    def summary(self) -> str:
+        """Return a one-line human-readable status."""
+        eta = self.eta
+        left = "--:--" if eta is None else f"{int(eta) // 60:02d}:{int(eta) % 60:02d}"
+        return (
+            f"{self.documents_done}/{self.documents} documents · "
+            f"{self.cost_done:,.0f}/{self.cost:,.0f} pages · "
+            f"{self.throughput:.1f} pages/s · ETA {left}"
+        )
+
+
+class BatchScheduler:
+    """Runs batch extractions longest job first across a worker pool.
+
+    Only ``2 × workers`` jobs are queued in the pool at a time, so the
+    order stays longest first and a stopped run leaves little queued work.
+    Results are yielded per document as soon as its last job finishes.
+
+    Jobs run in an ``IsolatedWorkerPool`` under ``timeout`` seconds and
+    ``memory_limit_mb`` (None disables either), so a document breaking a
+    limit is reported as failed and the batch goes on. ``executor_factory``
+    replaces the pool, e.g. with a ``ProcessPoolExecutor``.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        split_pages: int = SPLIT_PAGES,
+        on_progress: Callable[[BatchProgress], None] | None = None,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        memory_limit_mb: int | None = DEFAULT_MEMORY_LIMIT_MB,
+        executor_factory: Callable[[int], Executor] | None = None,
+    ) -> None:
+        self.workers = workers or os.cpu_count() or 2
+        self.split_pages = split_pages
+        self.on_progress = on_progress
+        self.executor_factory = executor_factory or (
+            lambda workers: IsolatedWorkerPool(workers, timeout, memory_limit_mb)
+        )
+        self.progress = BatchProgress()
+
+    def run(self, paths: Iterable[Path]) -> Iterator[Dict[str, Any]]:
+        """Extract the documents and yield one result per document."""
+        jobs = plan_jobs(paths, self.split_pages)
+        self.progress = progress = BatchProgress(
+            documents=sum(job.part == 0 for job in jobs),
+            cost=sum(job.cost for job in jobs),
+        )
+        self._report()
+        pending_parts: Dict[Path, List[Dict[str, Any] | None]] = {}
+        running: Dict[Future, Job] = {}
+        queue = iter(jobs)
+        executor = self.executor_factory(self.workers)
+        try:
+            while True:
+                for job in queue:
+                    running[executor.submit(run_job, str(job.path), job.pages)] = job
+                    if len(running) >= 2 * self.workers:
+                        break
+                if not running:
+                    break
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = running.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:  # A worker limit was hit, or the worker died
+                        result = {"name": job.path.name, "path": str(job.path), "error": str(e)}
+                    progress.cost_done += job.cost
+                    if job.parts > 1:
+                        parts = pending_parts.setdefault(job.path, [None] * job.parts)
+                        parts[job.part] = result
+                        if any(p is None for p in parts):
+                            self._report()
+                            continue
+                        del pending_parts[job.path]
+                        result = merge_parts(parts)
+                    progress.documents_done += 1
+                    progress.failed += "error" in result
+                    self._report()
+                    yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _report(self) -> None:
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
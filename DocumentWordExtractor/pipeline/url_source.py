@@ -0,0 +1,306 @@
+"""Concurrent download of documents from HTTP servers for extraction.
+
+All downloads share one ``requests.Session``. Its connection pool keeps
+connections alive, so successive documents from the same host skip the
+TCP and TLS handshakes. Bodies are streamed in chunks: small documents
+are kept in memory, larger ones (by ``Content-Length``, or once the
+received bytes pass ``memory_limit``) are written to a file as they
+arrive. Each finished download goes to extraction right away, while the
+others are still transferring.
+
+Failed connections and 429/5xx responses are retried by the session's
+transport with exponential backoff, honouring ``Retry-After``. A body
+that breaks off mid-stream is downloaded again, with the same backoff.
+"""
+
+import mimetypes
+import os
+import shutil
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from email.message import Message
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, Iterator
+from urllib.parse import unquote, urlsplit
+
+from pipeline.extraction import UnsupportedFormatError, extract_bytes, extract_file
+
+# Bodies up to this size stay in memory; larger ones go to a file
+MEMORY_LIMIT = 8 * 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+# Connect and read timeouts in seconds; the read timeout applies per chunk
+TIMEOUT = (5.0, 60.0)
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+# Extensions for servers that send URLs without one
+_CONTENT_TYPES = {
+    "application/pdf": ".pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document": ".docx",
+    "text/plain": ".txt",
+    "application/vnd.oasis.opendocument.text": ".odt",
+    "application/epub+zip": ".epub",
+    "text/html": ".html",
+    "application/xhtml+xml": ".xhtml",
+    "application/rtf": ".rtf",
+    "text/rtf": ".rtf",
+}
+
+
+def make_session(pool_size: int = 8, retries: int = 3, backoff: float = 0.5):
+    """Return a session whose connection pool holds ``pool_size`` connections per host.
+
+    Connection errors and ``RETRY_STATUSES`` responses are retried up to
+    ``retries`` times, waiting ``backoff`` × 2ⁿ seconds (or what
+    ``Retry-After`` asks for) before retry n.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=("GET", "HEAD"),
+        raise_on_status=False,  # Return the last response; raise_for_status reports it
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = "DocumentWordExtractor"
+    return session
+
+
+@dataclass
+class Download:
+    """A downloaded document, held in ``data`` or stored at ``path``.
+
+    ``error`` is set instead when the download failed.
+    """
+
+    url: str
+    name: str = ""
+    data: bytes | None = None
+    path: Path | None = None
+    size: int = 0
+    content_type: str = ""
+    attempts: int = 0
+    elapsed_ms: float = 0.0
+    error: str | None = None
+
+
+def document_name(url: str, headers) -> str:
+    """Name a download after ``Content-Disposition`` or the URL path.
+
+    An extension is added from ``Content-Type`` when the name lacks a
+    known one.
+    """
+    name = ""
+    disposition = headers.get("Content-Disposition")
+    if disposition:
+        header = Message()
+        header["Content-Disposition"] = disposition
+        name = os.path.basename((header.get_filename() or "").replace("\\", "/"))
+    if not name:
+        name = unquote(PurePosixPath(urlsplit(url).path).name)
+    name = name or "document"
+    content_type = headers.get("Content-Type", "").split(";")[0].strip().lower()
+    suffix = _CONTENT_TYPES.get(content_type) or mimetypes.guess_extension(content_type or "-") or ""
+    if suffix and Path(name).suffix.lower() not in _CONTENT_TYPES.values():
+        name += suffix
+    return name
+
+
+class UrlSource:
+    """Downloads documents concurrently over one pooled session.
+
+    ``directory`` receives the documents too large for memory; without
+    it a temporary folder is used and removed by ``close``. Use as a
+    context manager. Downloads of the same host reuse up to ``workers``
+    kept-alive connections.
+    """
+
+    def __init__(
+        self,
+        workers: int = 8,
+        retries: int = 3,
+        backoff: float = 0.5,
+        timeout: tuple[float, float] = TIMEOUT,
+        memory_limit: int = MEMORY_LIMIT,
+        directory: Path | None = None,
+        session=None,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.memory_limit = memory_limit
+        self.directory = Path(directory) if directory else None
+        self._tmpdir: str | None = None
+        self._own_session = session is None
+        self.session = session or make_session(self.workers, retries, backoff)
+
+    def __enter__(self) -> "UrlSource":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the session (if created here) and delete the temporary folder."""
+        if self._own_session:
+            self.session.close()
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+
+    def _target(self, index: int, name: str) -> Path:
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            folder = self.directory
+        else:
+            if self._tmpdir is None:
+                self._tmpdir = tempfile.mkdtemp(prefix="dwe-fetch-")
+            folder = Path(self._tmpdir)
+        # The index keeps documents of the same name apart
+        return folder / f"{index:05d}-{name}"
+
+    def download(self, url: str, index: int = 0) -> Download:
+        """Download one document; failures are reported in ``error``."""
+        import requests
+
+        start = time.perf_counter()
+        download = Download(url, document_name(url, {}))
+        while True:
+            download.attempts += 1
+            streaming = False
+            try:
+                with self.session.get(url, stream=True, timeout=self.timeout) as response:
+                    response.raise_for_status()
+                    download.name = document_name(response.url or url, response.headers)
+                    download.content_type = response.headers.get("Content-Type", "")
+                    streaming = True
+                    self._receive(download, response, index)
+                break
+            except (requests.exceptions.ChunkedEncodingError, requests.exceptions.ConnectionError) as e:
+                # The transport has already retried failures before the body;
+                # only a body broken off mid-stream is downloaded again here.
+                if not streaming or download.attempts > self.retries:
+                    download.error = str(e)
+                    break
+                time.sleep(self.backoff * 2 ** (download.attempts - 1))
+            except (requests.RequestException, OSError) as e:
+                download.error = str(e)
+                break
+        if download.error is not None:
+            self._discard(download)
+        download.elapsed_ms = round((time.perf_counter() - start) * 1000, 2)
+        return download
+
+    def _receive(self, download: Download, response, index: int) -> None:
+        """Stream the body into memory, switching to a file once it is too large."""
+        self._discard(download)
+        length = response.headers.get("Content-Length")
+        chunks: list[bytes] = []
+        size = 0
+        out = None
+        try:
+            if length is not None and length.isdigit() and int(length) > self.memory_limit:
+                download.path = self._target(index, download.name)
+                out = open(download.path, "wb")
+            for chunk in response.iter_content(CHUNK_SIZE):
+                size += len(chunk)
+                if out is not None:
+                    out.write(chunk)
+                    continue
+                chunks.append(chunk)
+                if size > self.memory_limit:
+                    download.path = self._target(index, download.name)
+                    out = open(download.path, "wb")
+                    out.writelines(chunks)
+                    chunks = []
+        finally:
+            if out is not None:
+                out.close()
+        download.size = size
+        if out is None:
+            download.data = b"".join(chunks)
+
+    def _discard(self, download: Download) -> None:
+        """Drop what an earlier, failed attempt received."""
+        download.data = None
+        if download.path is not None:
+            download.path.unlink(missing_ok=True)
+            download.path = None
+
+
+def extract_download(url: str, name: str, data: bytes | None, path: str | None) -> Dict[str, Any]:
+    """Extract one download in a worker process; failures come back as results."""
+    try:
+        if data is not None:
+            return extract_bytes(data, name, path=url)
+        result = extract_file(Path(path), display_name=name)
+        result["path"] = url
+        return result
+    except UnsupportedFormatError as e:
+        return {"name": name, "path": url, "error": str(e), "status": 415}
+    except Exception as e:
+        return {"name": name, "path": url, "error": str(e), "status": 422}
+
+
+def extract_urls(urls: Iterable[str], source: UrlSource, executor: Executor) -> Iterator[Dict[str, Any]]:
+    """Download and extract documents, yielding results as they finish.
+
+    Each download is handed to ``executor`` as soon as it completes, so
+    extraction overlaps the remaining transfers. Downloads are started
+    only while fewer than ``2 × source.workers`` documents are in flight,
+    which bounds the memory held by finished but unextracted documents.
+    Results carry the URL as ``path`` and the download's ``download``
+    metrics; failed downloads yield a result with ``error``.
+    """
+    queue = iter(enumerate(urls))
+    with ThreadPoolExecutor(source.workers, thread_name_prefix="UrlSource") as pool:
+        downloading: Dict[Future, str] = {}
+        extracting: Dict[Future, Download] = {}
+        while True:
+            for index, url in queue:
+                downloading[pool.submit(source.download, url, index)] = url
+                if len(downloading) + len(extracting) >= 2 * source.workers:
+                    break
+            if not downloading and not extracting:
+                break
+            done, _ = wait([*downloading, *extracting], return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in downloading:
+                    url = downloading.pop(future)
+                    download = future.result()
+                    if download.error is not None:
+                        yield {"name": download.name, "path": url, "error": download.error,
+                               "download": _metrics(download)}
+                        continue
+                    path = str(download.path) if download.path else None
+                    job = executor.submit(extract_download, url, download.name, download.data, path)
+                    download.data = None  # Now owned by the job
+                    extracting[job] = download
+                    continue
+                download = extracting.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:  # A worker limit was hit, or the worker died
+                    result = {"name": download.name, "path": download.url, "error": str(e)}
+                if download.path is not None and source.directory is None:
+                    download.path.unlink(missing_ok=True)
+                result["download"] = _metrics(download)
+                yield result
+
+
+def _metrics(download: Download) -> Dict[str, Any]:
+    return {
+        "bytes": download.size,
+        "attempts": download.attempts,
+        "elapsed_ms": download.elapsed_ms,
+        "stored": "disk" if download.path is not None else "memory",
+    }
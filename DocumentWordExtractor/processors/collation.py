@@ -0,0 +1,281 @@
+"""Locale-aware word ordering with precomputed collation keys.
+
+A collation key is an ordinary string whose code point order is the
+language's alphabetical order, so lists sort with plain string
+comparisons. Keys are computed for a whole list at once: the words are
+joined into one buffer that is case-folded, has its digraphs replaced and
+is translated through a per-language table, each in a single C-level
+pass. ``locale.strxfrm`` is not used. It depends on the locales installed
+on the machine, and calling it once per word in Python is slow.
+
+Lists too large to sort in memory go through ``ExternalSorter``. It
+writes sorted runs of encoded keys to temporary files and merges them
+lazily.
+"""
+
+import heapq
+import os
+import re
+import shutil
+import tempfile
+import unicodedata
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+LANGUAGES = ("en", "ru", "uz")
+ORDERS = ("occurrence", "alphabetical", "frequency", "length")
+
+# Words held in memory per run before ExternalSorter spills to disk
+RUN_SIZE = 500_000
+
+_LATIN = list("abcdefghijklmnopqrstuvwxyz")
+_CYRILLIC = list("абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
+APOSTROPHES = "ʻ'‘’`ʼ"
+
+# Collation elements in alphabetical order. Latin comes before Cyrillic in
+# every table, so mixed lists keep one script together.
+ALPHABETS: Dict[str, List[str]] = {
+    "en": _LATIN + _CYRILLIC,
+    "ru": _LATIN + _CYRILLIC,
+    # Uzbek Latin (1995 alphabet, with c and w for loanwords) ends with
+    # oʻ, gʻ, sh, ch, ng and the tutuq belgisi (ʼ). Uzbek Cyrillic puts
+    # ў, қ, ғ and ҳ after я; Russian-only letters keep their Russian place.
+    "uz": _LATIN + ["oʻ", "gʻ", "sh", "ch", "ng", "ʼ"] + _CYRILLIC + ["ў", "қ", "ғ", "ҳ"],
+}
+
+# Primary weights live in supplementary private use planes: the alphabet
+# from _TAILORED, letters of other scripts from _OTHER (in code point
+# order). Digits and punctuation keep their code points and so sort
+# before all letters.
+_TAILORED = 0xF0000
+_OTHER = 0xF4000
+
+
+class _Weights(dict):
+    """Translation table for ``str.translate`` that fills itself on demand.
+
+    Letters missing from the alphabet are looked up the first time they
+    occur. Accented Latin letters take the weight of their base letter, so
+    "é" sorts with "e" and the word itself breaks the tie. Other letters
+    sort after the alphabet.
+    """
+
+    def __missing__(self, code: int) -> int:
+        char = chr(code)
+        if code >= _TAILORED or not char.isalpha():
+            weight = code
+        else:
+            weight = _OTHER + min(code, 0xFFFF)
+            base = unicodedata.normalize("NFD", char)[0]
+            if base != char:
+                weight = self.get(ord(base), weight)
+        self[code] = weight
+        return weight
+
+
+class Collator:
+    """Computes sort keys in the alphabetical order of a language.
+
+    Comparison ignores case and accents first (the primary key) and then
+    falls back to the word's code points, so every order is total and
+    repeatable. In Uzbek, oʻ and gʻ (written with any of the common
+    apostrophe characters) and the digraphs sh, ch and ng are single
+    letters. In Russian and Uzbek Cyrillic, ё follows е.
+    """
+
+    def __init__(self, language: str = "en") -> None:
+        if language not in ALPHABETS:
+            raise ValueError(f"Unsupported collation language: {language}")
+        self.language = language
+        elements = ALPHABETS[language]
+        self._weights = _Weights()
+        digraphs: Dict[str, str] = {}
+        for rank, element in enumerate(elements):
+            weight = _TAILORED + rank
+            if len(element) == 1:
+                self._weights[ord(element)] = weight
+            else:
+                digraphs[element] = chr(weight)
+        self._digraph = None
+        if digraphs:
+            # Every apostrophe spelling of oʻ/gʻ; a lone apostrophe is ʼ
+            for element in [e for e in digraphs if e[1] == "ʻ"]:
+                for mark in APOSTROPHES:
+                    digraphs[element[0] + mark] = digraphs[element]
+            if "ʼ" in elements:
+                for mark in APOSTROPHES:
+                    digraphs.setdefault(mark, chr(self._weights[ord("ʼ")]))
+            alternatives = sorted(digraphs, key=len, reverse=True)
+            self._digraph = re.compile("|".join(map(re.escape, alternatives)))
+            self._digraphs = digraphs
+
+    def primary_keys(self, words: Sequence[str]) -> List[str]:
+        """Return the case- and accent-insensitive keys of a list of words.
+
+        Words must not contain NUL characters, which separate the words in
+        the shared buffer.
+        """
+        if not words:
+            return []
+        buffer = unicodedata.normalize("NFC", "\0".join(words)).casefold()
+        if self._digraph is not None:
+            buffer = self._digraph.sub(lambda m: self._digraphs[m.group()], buffer)
+        return buffer.translate(self._weights).split("\0")
+
+    def sort_keys(self, words: Sequence[str]) -> List[str]:
+        """Return full sort keys: the primary key, NUL, then the word itself."""
+        return [key + "\0" + word for key, word in zip(self.primary_keys(words), words)]
+
+    def sort_key(self, word: str) -> str:
+        return self.sort_keys([word])[0]
+
+
+def sort_order(
+    words: Sequence[str],
+    counts: Sequence[int] | None = None,
+    order: str = "alphabetical",
+    language: str = "en",
+    reverse: bool = False,
+) -> List[int]:
+    """Return the positions of ``words`` in the requested order.
+
+    ``alphabetical`` follows the language's collation, ``frequency`` puts
+    the most frequent words first and ``length`` the shortest. Both break
+    ties alphabetically. ``occurrence`` keeps the list order. Positions
+    let callers reorder parallel lists such as counts.
+    """
+    if order not in ORDERS:
+        raise ValueError(f"Unknown sort order: {order}")
+    positions = list(range(len(words)))
+    if order != "occurrence":
+        keys = Collator(language).sort_keys(words)
+        positions.sort(key=keys.__getitem__)
+        del keys
+        if order == "frequency":
+            if counts is None:
+                raise ValueError("Sorting by frequency needs counts")
+            positions.sort(key=lambda i: -counts[i])
+        elif order == "length":
+            positions.sort(key=lambda i: len(words[i]))
+    if reverse:
+        positions.reverse()
+    return positions
+
+
+def sort_words(
+    words: Sequence[str],
+    counts: Sequence[int] | None = None,
+    order: str = "alphabetical",
+    language: str = "en",
+    reverse: bool = False,
+) -> List[str]:
+    """Return ``words`` in the requested order (see ``sort_order``)."""
+    return [words[i] for i in sort_order(words, counts, order, language, reverse)]
+
+
+class ExternalSorter:
+    """Sorts more words than fit in memory through sorted runs on disk.
+
+    Words are buffered until ``run_size`` of them are held. The buffer is
+    then keyed in one batch, sorted and written to a temporary file as one
+    line per word. Each line starts with its complete sort key, so runs
+    are merged by comparing raw lines. Iterating yields ``(word, count)``
+    in order and reads every run file once. Words must not contain NUL or
+    line breaks. Use as a context manager, or call ``close``, to remove
+    the run files.
+    """
+
+    def __init__(
+        self,
+        language: str = "en",
+        order: str = "alphabetical",
+        run_size: int = RUN_SIZE,
+        directory: Path | None = None,
+    ) -> None:
+        if order not in ("alphabetical", "frequency", "length"):
+            raise ValueError(f"Unknown sort order: {order}")
+        self.collator = Collator(language)
+        self.order = order
+        self.run_size = max(1, run_size)
+        self._directory = directory
+        self._tmpdir: str | None = None
+        self._runs: List[str] = []
+        self._spilled = 0
+        self._words: List[str] = []
+        self._counts: List[int] = []
+
+    def __enter__(self) -> "ExternalSorter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._words) + self._spilled
+
+    def add(self, word: str, count: int = 0) -> None:
+        self._words.append(word)
+        self._counts.append(count)
+        if len(self._words) >= self.run_size:
+            self._spill()
+
+    def extend(self, items: Iterable[Tuple[str, int]]) -> None:
+        for word, count in items:
+            self.add(word, count)
+
+    def _lines(self) -> List[str]:
+        """Encode the buffered words as sortable lines."""
+        words, counts = self._words, self._counts
+        keys = self.collator.primary_keys(words)
+        if self.order == "frequency":
+            # Inverted, fixed-width counts sort the most frequent first
+            prefixes = [f"{0xFFFFFFFF - min(n, 0xFFFFFFFF):08x}" for n in counts]
+        elif self.order == "length":
+            prefixes = [f"{min(len(w), 0xFFFF):04x}" for w in words]
+        else:
+            prefixes = [""] * len(words)
+        lines = [f"{p}{k}\0{w}\0{n}\n" for p, k, w, n in zip(prefixes, keys, words, counts)]
+        lines.sort()
+        return lines
+
+    def _spill(self) -> None:
+        if not self._words:
+            return
+        if self._tmpdir is None:
+            self._tmpdir = tempfile.mkdtemp(prefix="dwe-sort-", dir=self._directory)
+        path = os.path.join(self._tmpdir, f"run{len(self._runs):05d}")
+        with open(path, "w", encoding="utf-8", newline="\n") as f:
+            f.writelines(self._lines())
+        self._runs.append(path)
+        self._spilled += len(self._words)
+        self._words, self._counts = [], []
+
+    def __iter__(self) -> Iterator[Tuple[str, int]]:
+        """Yield the words in order; the sorter is empty afterwards."""
+        if not self._runs:
+            lines: Iterable[str] = self._lines()
+            self._words, self._counts = [], []
+            yield from _decode(lines)
+            return
+        self._spill()
+        files = [open(path, encoding="utf-8", newline="\n", buffering=1 << 20) for path in self._runs]
+        try:
+            yield from _decode(heapq.merge(*files))
+        finally:
+            for f in files:
+                f.close()
+            self.close()
+
+    def close(self) -> None:
+        """Delete the run files."""
+        if self._tmpdir is not None:
+            shutil.rmtree(self._tmpdir, ignore_errors=True)
+            self._tmpdir = None
+        self._runs = []
+        self._spilled = 0
+
+
+def _decode(lines: Iterable[str]) -> Iterator[Tuple[str, int]]:
+    for line in lines:
+        _, word, count = line.rsplit("\0", 2)
+        yield word, int(count)
@@ -0,0 +1,315 @@
+"""Optional stopword filtering and stemming for English, Russian and Uzbek.
+
+Stemmers strip inflectional suffixes by rule, without a dictionary, so
+"kitobni" and "kitoblar" both become "kitob" and "документа" becomes
+"документ". Russian follows the Snowball algorithm. Uzbek, which stacks
+suffixes, peels case, possessive and plural endings off in that order.
+English removes plural, past and progressive endings only.
+
+Word frequencies are Zipfian: a few thousand forms make up most of the
+tokens of any text. ``Normalizer.normalize`` is therefore memoized with a
+bounded ``lru_cache`` that is kept across documents, and most tokens cost
+a single cache lookup. Stopword lists are frozensets of lowercased words.
+Every apostrophe spelling (oʻ, o', o’, ...) is looked up and stemmed as
+the ASCII apostrophe.
+"""
+
+from collections import Counter
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+from processors.collation import APOSTROPHES
+
+LANGUAGES = ("en", "ru", "uz")
+
+# Distinct words whose normalized form is memoized
+CACHE_SIZE = 65_536
+
+_FOLD_APOSTROPHES = str.maketrans(dict.fromkeys(APOSTROPHES, "'"))
+
+STOPWORDS: Dict[str, frozenset] = {
+    "en": frozenset("""
+        a about above after again against all am an and any are as at be because been
+        before being below between both but by can could did do does doing down during
+        each few for from further had has have having he her here hers herself him
+        himself his how i if in into is it its itself just me more most my myself no nor
+        not now of off on once only or other our ours ourselves out over own same she
+        should so some such than that the their theirs them themselves then there these
+        they this those through to too under until up very was we were what when where
+        which while who whom why will with would you your yours yourself yourselves
+    """.split()),
+    "ru": frozenset("""
+        а без более бы был была были было быть в вам вас весь во вот все всего всех вы
+        где да даже для до его ее ей ему если есть еще же за здесь и из или им их к как
+        ко когда кто ли либо мне может мы на надо наш не него нее нет ни них но ну о об
+        однако он она они оно от очень по под при с со так также такой там те тем то
+        того тоже той только том ты у уже хотя чего чей чем что чтобы чье чья эта эти
+        это этот я
+    """.split()),
+    # Latin and Cyrillic spellings
+    "uz": frozenset("""
+        va bilan uchun ham esa lekin ammo yoki bu shu u ular biz siz men sen bir emas edi
+        ekan deb kabi bo'yicha boshqa har hech qaysi qanday nima kim qachon qayerda yana
+        faqat hali endi agar chunki balki hatto ya'ni mana ana o'sha bo'lib bo'lgan
+        ва билан учун ҳам хам эса лекин аммо ёки бу шу у улар биз сиз мен сен бир эмас
+        эди экан деб каби бошқа ҳар ҳеч нима ким қачон яна фақат ҳали энди агар чунки
+        балки ҳатто яъни мана ана
+    """.split()),
+}
+
+
+def _suffixes(words: str) -> Tuple[str, ...]:
+    """Split a suffix list, longest first so the longest match wins."""
+    return tuple(sorted(words.split(), key=len, reverse=True))
+
+
+def _strip(word: str, start: int, suffixes: Tuple[str, ...], after: str = "") -> str:
+    """Return the longest of ``suffixes`` ending ``word`` at or after ``start``.
+
+    With ``after``, the suffix must follow one of its letters, itself at or
+    after ``start``. Returns "" if none matches.
+    """
+    for suffix in suffixes:
+        cut = len(word) - len(suffix)
+        if cut >= start and word.endswith(suffix) and (not after or (cut > start and word[cut - 1] in after)):
+            return suffix
+    return ""
+
+
+# Russian (Snowball)
+
+_RU_VOWELS = "аеиоуыэюя"
+_RU_GERUND_1 = _suffixes("в вши вшись")
+_RU_GERUND_2 = _suffixes("ив ивши ившись ыв ывши ывшись")
+_RU_REFLEXIVE = _suffixes("ся сь")
+_RU_ADJECTIVE = _suffixes(
+    "ее ие ые ое ими ыми ей ий ый ой ем им ым ом его ого ему ому их ых ую юю ая яя ою ею"
+)
+_RU_PARTICIPLE_1 = _suffixes("ем нн вш ющ щ")
+_RU_PARTICIPLE_2 = _suffixes("ивш ывш ующ")
+_RU_VERB_1 = _suffixes("ла на ете йте ли й л ем н ло но ет ют ны ть ешь нно")
+_RU_VERB_2 = _suffixes(
+    "ила ыла ена ейте уйте ите или ыли ей уй ил ыл им ым ен ило ыло ено ят ует уют ит ыт ены "
+    "ить ыть ишь ую ю"
+)
+_RU_NOUN = _suffixes(
+    "а ев ов ие ье е иями ями ами еи ии и ией ей ой ий й иям ям ием ем ам ом о у ах иях ях ы ь "
+    "ию ью ю ия ья я"
+)
+_RU_SUPERLATIVE = _suffixes("ейш ейше")
+_RU_DERIVATIONAL = _suffixes("ост ость")
+
+
+def _ru_regions(word: str) -> Tuple[int, int]:
+    """Return where RV and R2 start."""
+    rv = next((i + 1 for i, c in enumerate(word) if c in _RU_VOWELS), len(word))
+    r1 = next(
+        (i + 1 for i in range(1, len(word)) if word[i] not in _RU_VOWELS and word[i - 1] in _RU_VOWELS),
+        len(word),
+    )
+    r2 = next(
+        (i + 1 for i in range(r1 + 1, len(word)) if word[i] not in _RU_VOWELS and word[i - 1] in _RU_VOWELS),
+        len(word),
+    )
+    return rv, r2
+
+
+def _ru_step1(word: str, rv: int) -> str:
+    suffix = _strip(word, rv, _RU_GERUND_1, "ая") or _strip(word, rv, _RU_GERUND_2)
+    if suffix:
+        return word[:-len(suffix)]
+    suffix = _strip(word, rv, _RU_REFLEXIVE)
+    if suffix:
+        word = word[:-len(suffix)]
+    suffix = _strip(word, rv, _RU_ADJECTIVE)
+    if suffix:
+        word = word[:-len(suffix)]
+        participle = _strip(word, rv, _RU_PARTICIPLE_1, "ая") or _strip(word, rv, _RU_PARTICIPLE_2)
+        return word[:-len(participle)] if participle else word
+    suffix = _strip(word, rv, _RU_VERB_1, "ая") or _strip(word, rv, _RU_VERB_2) or _strip(word, rv, _RU_NOUN)
+    return word[:-len(suffix)] if suffix else word
+
+
+def stem_russian(word: str) -> str:
+    """Return the Snowball stem of a lowercased Russian word."""
+    word = word.replace("ё", "е")
+    rv, r2 = _ru_regions(word)
+    word = _ru_step1(word, rv)
+    if word.endswith("и") and len(word) - 1 >= rv:
+        word = word[:-1]
+    suffix = _strip(word, r2, _RU_DERIVATIONAL)
+    if suffix:
+        word = word[:-len(suffix)]
+    suffix = _strip(word, rv, _RU_SUPERLATIVE)
+    if suffix:
+        word = word[:-len(suffix)]
+    if word.endswith("нн") and len(word) - 2 >= rv:
+        return word[:-1]
+    if not suffix and word.endswith("ь") and len(word) - 1 >= rv:
+        return word[:-1]
+    return word
+
+
+# Uzbek
+
+_UZ_VOWELS = frozenset("aeiouаеёиоуўэюяы")
+# Endings in the reverse of the order they follow the stem. Dative -ka
+# and -qa only follow k and q; possessive endings have one form after
+# vowels (bola-si, bola-miz) and another after consonants (kitob-i,
+# kitob-imiz).
+_UZ_CASE = _suffixes("gacha dagi dan ning ni ga da гача даги дан нинг ни га да")
+_UZ_CASE_AFTER = {"ka": "k", "qa": "q", "ка": "к", "қа": "қ"}
+# (ending, follows a vowel), None where it follows either
+_UZ_POSSESSIVE = sorted(
+    [(e, None) for e in "lari лари".split()]
+    + [(e, True) for e in "miz ngiz si миз нгиз си".split()]
+    + [(e, False) for e in "imiz ingiz im ing i имиз ингиз им инг и".split()],
+    key=lambda entry: len(entry[0]),
+    reverse=True,
+)
+_UZ_PLURAL = ("lar", "лар")
+# Shortest stem left after stripping a suffix
+_UZ_MIN_STEM = 2
+
+
+def _uz_stem_ok(stem: str) -> bool:
+    return len(stem) >= _UZ_MIN_STEM and not _UZ_VOWELS.isdisjoint(stem)
+
+
+def _uz_case(word: str) -> str:
+    suffix = _strip(word, 0, _UZ_CASE)
+    if suffix and _uz_stem_ok(word[:-len(suffix)]):
+        return word[:-len(suffix)]
+    for suffix, letter in _UZ_CASE_AFTER.items():
+        if word.endswith(suffix) and word[:-len(suffix)].endswith(letter) and _uz_stem_ok(word[:-len(suffix)]):
+            return word[:-len(suffix)]
+    return word
+
+
+def _uz_possessive(word: str) -> str:
+    for suffix, vowel in _UZ_POSSESSIVE:
+        stem = word[:-len(suffix)]
+        if word.endswith(suffix) and _uz_stem_ok(stem) and (vowel is None or (stem[-1] in _UZ_VOWELS) == vowel):
+            return stem
+    return word
+
+
+def stem_uzbek(word: str) -> str:
+    """Return a lowercased Uzbek (Latin or Cyrillic) noun without its inflections."""
+    word = _uz_possessive(_uz_case(word))
+    for suffix in _UZ_PLURAL:
+        if word.endswith(suffix) and _uz_stem_ok(word[:-len(suffix)]):
+            return word[:-len(suffix)]
+    return word
+
+
+# English
+
+_EN_VOWELS = frozenset("aeiouy")
+_EN_DOUBLES = ("bb", "dd", "ff", "gg", "mm", "nn", "pp", "rr", "tt")
+_EN_PROGRESSIVE = _suffixes("ing ingly ed edly")
+
+
+def stem_english(word: str) -> str:
+    """Return a lowercased English word without plural, -ed and -ing endings."""
+    if len(word) <= 3:
+        return word
+    if word.endswith("sses"):
+        word = word[:-2]
+    elif word.endswith("ies"):
+        word = word[:-1] if len(word) == 4 else word[:-3] + "y"
+    elif word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        word = word[:-1]
+    if word.endswith(("eed", "eedly")):
+        # Only where "eed" is a suffix (agreed, not speed): after Porter's R1
+        cut = word.rindex("eed")
+        r1 = next(
+            (i + 1 for i in range(1, len(word)) if word[i] not in _EN_VOWELS and word[i - 1] in _EN_VOWELS),
+            len(word),
+        )
+        return word[:cut + 2] if cut >= r1 else word
+    suffix = _strip(word, 0, _EN_PROGRESSIVE)
+    stem = word[:-len(suffix)] if suffix else word
+    if not suffix or len(stem) < 3 or _EN_VOWELS.isdisjoint(stem):
+        return word
+    if stem.endswith(("at", "bl", "iz")):
+        return stem + "e"
+    if stem.endswith(_EN_DOUBLES):
+        return stem[:-1]
+    return stem
+
+
+STEMMERS: Dict[str, Callable[[str], str]] = {
+    "en": stem_english,
+    "ru": stem_russian,
+    "uz": stem_uzbek,
+}
+
+
+@dataclass
+class StemGroup:
+    """The forms of one stem in a word list."""
+
+    stem: str
+    word: str  # The most frequent form
+    forms: List[str] = field(default_factory=list)  # The other forms
+    count: int = 0  # Occurrences of all forms
+
+
+class Normalizer:
+    """Maps words to their stems and drops stopwords, memoizing each word.
+
+    The cache holds up to ``cache_size`` distinct words and evicts the
+    least recently used; reuse one normalizer for a whole batch so common
+    words are computed once.
+    """
+
+    def __init__(
+        self,
+        language: str,
+        stopwords: bool = True,
+        stem: bool = True,
+        cache_size: int = CACHE_SIZE,
+    ) -> None:
+        if language not in LANGUAGES:
+            raise ValueError(f"Unsupported language: {language}")
+        self.language = language
+        self.stopwords = STOPWORDS[language] if stopwords else frozenset()
+        self.stemmer = STEMMERS[language] if stem else None
+        self.normalize = lru_cache(maxsize=cache_size)(self._normalize)
+
+    def _normalize(self, word: str) -> str | None:
+        """Return the stem of ``word`` (any case), or None for a stopword."""
+        key = word.lower().translate(_FOLD_APOSTROPHES)
+        if key in self.stopwords:
+            return None
+        return self.stemmer(key) if self.stemmer else key
+
+    def normalize_tokens(self, tokens: Iterable[str]) -> Iterator[str]:
+        """Yield the stems of a token stream, leaving out stopwords."""
+        return filter(None, map(self.normalize, tokens))
+
+    def group(self, words: Sequence[str], counts: Sequence[int] | None = None) -> List[StemGroup]:
+        """Group a word list by stem, dropping stopwords.
+
+        Groups are in the order of their first form in ``words``; each is
+        shown as its most frequent form (the first one on ties).
+        """
+        counts = counts if counts is not None else [1] * len(words)
+        forms: Dict[str, Counter] = {}
+        for word, stem, count in zip(words, map(self.normalize, words), counts):
+            if stem is not None:
+                forms.setdefault(stem, Counter())[word] += count
+        groups = []
+        for stem, counter in forms.items():
+            # most_common keeps insertion order among equal counts
+            ranked = [w for w, _ in counter.most_common()]
+            groups.append(StemGroup(stem, ranked[0], ranked[1:], sum(counter.values())))
+        return groups
+
+    def hit_rate(self) -> float:
+        """Return the share of lookups answered from the cache."""
+        info = self.normalize.cache_info()
+        lookups = info.hits + info.misses
+        return info.hits / lookups if lookups else 0.0
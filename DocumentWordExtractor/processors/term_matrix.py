@@ -0,0 +1,236 @@
+"""Sparse document-term matrix and TF-IDF rankings across a corpus.
+
+Documents are added one vocabulary at a time. Their words are interned in
+a shared ``Lexicon``, whose ids are the matrix columns, and the column ids
+and counts are appended to flat ``array`` buffers that become the CSR
+matrix's ``indices`` and ``data``. A document costs 8 bytes per distinct
+word and no Python objects, so 10,000 documents of a few thousand
+distinct words each take a few hundred MB; ``build`` hands the buffers to
+NumPy without copying them.
+
+Weights are computed with whole-array operations: document frequencies
+are one ``bincount`` over the column ids, and TF-IDF scores, row norms and
+per-document rankings are computed for blocks of rows at a time, so their
+temporaries stay small however large the corpus is.
+
+NumPy and SciPy are optional; they are imported when a matrix is built.
+"""
+
+import json
+from array import array
+from dataclasses import dataclass
+from itertools import compress
+from typing import Any, Iterator, List, Mapping, TextIO, Tuple
+
+from processors.vocabulary_diff import Lexicon, Vocabulary
+
+# Documents scored at once by ``TermMatrix.top_terms``
+BLOCK_ROWS = 256
+# Column ids counted at once by ``TermMatrix.document_frequencies``
+COUNT_CHUNK = 1 << 20
+
+
+def _numpy():
+    try:
+        import numpy as np
+        import scipy.sparse as sparse
+    except ImportError as e:
+        raise RuntimeError(
+            "NumPy and SciPy are not installed. Install with: pip install numpy scipy"
+        ) from e
+    return np, sparse
+
+
+class TermMatrixBuilder:
+    """Builds a document-term count matrix incrementally.
+
+    Rows are documents in the order they were added; columns are
+    lowercased words in the order they were first seen, displayed in the
+    form they first appeared in.
+    """
+
+    def __init__(self, lexicon: Lexicon | None = None) -> None:
+        self.lexicon = lexicon if lexicon is not None else Lexicon()
+        self.names: List[str] = []
+        self.terms: List[str] = []
+        self._indices = array("I")
+        self._data = array("I")
+        self._indptr = array("q", [0])
+        self._built = False
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def nnz(self) -> int:
+        """Number of stored (document, word) counts."""
+        return len(self._indices)
+
+    def add(self, vocabulary: Vocabulary) -> int:
+        """Append a document's vocabulary as a row and return its index."""
+        if self._built:
+            raise RuntimeError("The matrix has already been built")
+        known = len(self.lexicon)
+        columns = self.lexicon.intern(vocabulary.ids)
+        if len(self.lexicon) > known:
+            # New words get consecutive ids in the order they appear here
+            self.terms.extend(compress(vocabulary.forms, map(known.__le__, columns)))
+        self._indices.extend(columns)
+        counts = vocabulary.counts
+        if not (isinstance(counts, array) and counts.typecode == "I"):
+            counts = array("I", counts)
+        self._data.extend(counts)
+        self._indptr.append(len(self._indices))
+        self.names.append(vocabulary.name)
+        return len(self.names) - 1
+
+    def add_counts(self, name: str, counts: Mapping[str, int]) -> int:
+        """Append ``{word: count}`` (as in extraction results) as a row."""
+        return self.add(Vocabulary.from_counts(name, counts))
+
+    def build(self) -> "TermMatrix":
+        """Return the matrix; the builder's buffers now belong to it.
+
+        Raises:
+            RuntimeError: If NumPy or SciPy is not installed.
+        """
+        np, sparse = _numpy()
+        self._built = True
+        # Read as signed, as SciPy requires; ids stay far below 2**31
+        indices = np.frombuffer(self._indices, dtype=np.int32)
+        indptr = np.frombuffer(self._indptr, dtype=np.int64)
+        if len(indices) < 2**31:
+            indptr = indptr.astype(np.int32)
+        else:
+            indices = indices.astype(np.int64)
+        counts = sparse.csr_matrix(
+            (np.frombuffer(self._data, dtype=np.uint32), indices, indptr),
+            shape=(len(self.names), len(self.terms)),
+            copy=False,
+        )
+        return TermMatrix(self.names, self.terms, counts)
+
+
+@dataclass
+class TermMatrix:
+    """Word counts of a corpus as a CSR matrix, documents by words."""
+
+    names: List[str]
+    terms: List[str]
+    counts: Any  # scipy.sparse.csr_matrix of uint32
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.counts.shape
+
+    def document_frequencies(self):
+        """Return the number of documents containing each word."""
+        np, _ = _numpy()
+        # In chunks: bincount widens its input to 64-bit integers
+        indices = self.counts.indices
+        df = np.zeros(len(self.terms), dtype=np.int64)
+        for start in range(0, len(indices), COUNT_CHUNK):
+            df += np.bincount(indices[start:start + COUNT_CHUNK], minlength=len(self.terms))
+        return df
+
+    def idf(self, smooth: bool = True, df=None):
+        """Return each word's inverse document frequency as float32.
+
+        With ``smooth`` this is ``ln((1 + n) / (1 + df)) + 1``, as if one
+        more document contained every word; otherwise ``ln(n / df) + 1``.
+        Words in every document still weigh 1, never 0. Pass ``df`` if
+        the document frequencies are already computed.
+        """
+        np, _ = _numpy()
+        n = self.shape[0]
+        df = self.document_frequencies() if df is None else df
+        if smooth:
+            idf = np.log((1 + n) / (1 + df)) + 1
+        else:
+            idf = np.log(n / np.maximum(df, 1)) + 1
+        return idf.astype(np.float32)
+
+    def _weights(self, start: int, stop: int, idf, sublinear: bool, normalize: bool):
+        """Return the TF-IDF values of rows ``start..stop`` and their block-relative rows."""
+        np, _ = _numpy()
+        indptr = self.counts.indptr
+        lo, hi = indptr[start], indptr[stop]
+        weights = self.counts.data[lo:hi].astype(np.float32)
+        if sublinear:
+            np.log(weights, out=weights)
+            weights += 1
+        weights *= idf[self.counts.indices[lo:hi]]
+        rows = np.repeat(np.arange(stop - start), np.diff(indptr[start:stop + 1]))
+        if normalize:
+            norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=stop - start))
+            weights /= norms[rows].astype(np.float32)
+        return weights, rows
+
+    def tfidf(self, sublinear: bool = True, normalize: bool = True, smooth: bool = True):
+        """Return the TF-IDF weighted matrix as float32 CSR.
+
+        The term frequency is ``1 + ln(count)`` with ``sublinear``, else the
+        raw count; with ``normalize`` each row has unit Euclidean length.
+        """
+        _, sparse = _numpy()
+        weights, _ = self._weights(0, self.shape[0], self.idf(smooth), sublinear, normalize)
+        return sparse.csr_matrix(
+            (weights, self.counts.indices, self.counts.indptr), shape=self.shape, copy=False
+        )
+
+    def top_terms(
+        self,
+        k: int = 20,
+        min_count: int = 1,
+        sublinear: bool = True,
+        smooth: bool = True,
+    ) -> Iterator[Tuple[str, List[Tuple[str, int, int, float]]]]:
+        """Yield each document's ``k`` most distinctive words, best first.
+
+        Yields ``(name, [(word, count, document frequency, score)])`` in
+        row order; scores are normalized TF-IDF weights. Words occurring
+        fewer than ``min_count`` times in a document are not ranked in it.
+        """
+        np, _ = _numpy()
+        df = self.document_frequencies()
+        idf = self.idf(smooth, df)
+        indptr, indices, data = self.counts.indptr, self.counts.indices, self.counts.data
+        for start in range(0, self.shape[0], BLOCK_ROWS):
+            stop = min(start + BLOCK_ROWS, self.shape[0])
+            lo, hi = indptr[start], indptr[stop]
+            scores, rows = self._weights(start, stop, idf, sublinear, True)
+            counts = data[lo:hi]
+            key = -scores
+            if min_count > 1:
+                key[counts < min_count] = np.inf  # Rank rare words last, then drop them
+            # Sort by row, then by descending score, and keep each row's first k
+            order = np.lexsort((key, rows))
+            rank = np.arange(len(order)) - (indptr[start + rows[order]] - lo)
+            keep = order[rank < k]
+            if min_count > 1:
+                keep = keep[counts[keep] >= min_count]
+            bounds = np.searchsorted(rows[keep], np.arange(stop - start + 1)).tolist()
+            columns = indices[lo:hi][keep]
+            words = [self.terms[c] for c in columns.tolist()]
+            kept_counts = counts[keep].tolist()
+            kept_df = df[columns].tolist()
+            kept_scores = scores[keep].tolist()
+            for row in range(stop - start):
+                a, b = bounds[row], bounds[row + 1]
+                yield self.names[start + row], [
+                    (words[i], kept_counts[i], kept_df[i], round(kept_scores[i], 6)) for i in range(a, b)
+                ]
+
+
+def export_top_terms(matrix: TermMatrix, out: TextIO, k: int = 20, min_count: int = 1, sublinear: bool = True) -> int:
+    """Write each document's top terms to ``out`` as JSON lines; return the documents written."""
+    written = 0
+    for name, terms in matrix.top_terms(k, min_count, sublinear):
+        out.write(json.dumps({
+            "name": name,
+            "terms": [
+                {"word": w, "count": n, "documents": d, "score": s} for w, n, d, s in terms
+            ],
+        }, ensure_ascii=False) + "\n")
+        written += 1
+    return written
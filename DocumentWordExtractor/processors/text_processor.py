@@ -2,18 +2,20 @@
 
 import re
 import string
-from typing import List
+from typing import Iterable, List
 
 
 class TextProcessor:
     """Process document text: extract words, remove punctuation, remove duplicates."""
 
-    # Word boundary pattern: letters (Latin, Cyrillic), digits
+    # Word boundary pattern: letters (Latin, Cyrillic, Uzbek ʻ and ʼ), digits
     WORD_PATTERN = re.compile(
-        r"\b[a-zA-Zа-яА-ЯёЁәөүҮҗҖңӨӘ0-9]+\b"
+        r"\b[a-zA-Zа-яА-ЯёЁәөүҮҗҖңӨӘқҚғҒҳҲўЎʻʼ0-9]+\b"
     )
     # All punctuation to strip (when used as fallback)
     PUNCTUATION = set(string.punctuation + "«»„"",""—…")
+    # Joined once for str.strip; rebuilding it per word dominated the cost
+    _PUNCTUATION_CHARS = "".join(sorted(PUNCTUATION))
 
     @classmethod
     def extract_words(cls, text: str) -> List[str]:
@@ -28,8 +30,9 @@ class TextProcessor:
         Returns:
             List of all words in the document (punctuation removed).
         """
-        if not text or not text.strip():
+        if not text:
             return []
+        # Whitespace-only text simply has no matches; no need to copy it with strip()
         return cls.WORD_PATTERN.findall(text)
 
     @classmethod
@@ -42,7 +45,34 @@ class TextProcessor:
         Returns:
             Word with punctuation stripped.
         """
-        return word.strip("".join(cls.PUNCTUATION))
+        return word.strip(cls._PUNCTUATION_CHARS)
+
+    @classmethod
+    def normalize_words(
+        cls, words: Iterable[str], lowercase: bool = True, drop_empty: bool = True
+    ) -> List[str]:
+        """Strip punctuation from (and lowercase) a whole list of words at once.
+
+        Equivalent to calling remove_punctuation (and str.lower) on each
+        word, but every distinct token is normalized only once, which is
+        much cheaper on real text where most tokens repeat.
+
+        Args:
+            words: Words or raw tokens.
+            lowercase: Also convert words to lowercase.
+            drop_empty: Leave out tokens that were only punctuation.
+
+        Returns:
+            Normalized words in the original order.
+        """
+        words = list(words)
+        chars = cls._PUNCTUATION_CHARS
+        if lowercase:
+            normalized = {w: w.strip(chars).lower() for w in dict.fromkeys(words)}
+        else:
+            normalized = {w: w.strip(chars) for w in dict.fromkeys(words)}
+        result = map(normalized.__getitem__, words)
+        return list(filter(None, result) if drop_empty else result)
 
     @classmethod
     def remove_duplicates(cls, words: List[str], preserve_case: bool = False) -> List[str]:
@@ -56,10 +86,14 @@ class TextProcessor:
         Returns:
             List of unique words in original order.
         """
+        # Collapsing exact repeats first runs in C; real text repeats heavily
+        distinct = dict.fromkeys(words)
+        if preserve_case:
+            return list(distinct)
         seen: set = set()
         result: List[str] = []
-        for w in words:
-            key = w if preserve_case else w.lower()
+        for w in distinct:
+            key = w.lower()
             if key not in seen:
                 seen.add(key)
                 result.append(w)
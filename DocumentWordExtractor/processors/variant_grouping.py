@@ -0,0 +1,255 @@
+"""Fuzzy grouping of word variants (typos, OCR noise) with a deletion index."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Sequence
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """Return the optimal string alignment distance, capped at ``max_distance + 1``.
+
+    Counts insertions, deletions, substitutions and transpositions of
+    adjacent characters. Rows stop early once every cell exceeds the cap.
+    """
+    if a == b:
+        return 0
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    # Only the part between a shared prefix and a shared suffix needs the table
+    start = 0
+    shorter = min(len(a), len(b))
+    while start < shorter and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < shorter - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+    if len(a) > len(b):
+        a, b = b, a
+    over = max_distance + 1
+    if not a:
+        return min(len(b), over)
+    # Cells further than max_distance from the diagonal cost more than that,
+    # so only a band of 2·max_distance + 1 cells per row is computed
+    n, m = len(a), len(b)
+    previous = None
+    row = [j if j < over else over for j in range(m + 1)]
+    for i in range(1, n + 1):
+        ca = a[i - 1]
+        current = [over] * (m + 1)
+        if i < over:
+            current[0] = i
+        best = over
+        for j in range(max(1, i - max_distance), min(m, i + max_distance) + 1):
+            cb = b[j - 1]
+            cost = row[j - 1] + (ca != cb)
+            if row[j] + 1 < cost:
+                cost = row[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            if (
+                previous is not None and j > 1
+                and ca == b[j - 2] and a[i - 2] == cb
+                and previous[j - 2] + 1 < cost
+            ):
+                cost = previous[j - 2] + 1
+            current[j] = cost
+            if cost < best:
+                best = cost
+        if best > max_distance:
+            return over
+        previous, row = row, current
+    return min(row[m], over)
+
+
+class DeletionIndex:
+    """SymSpell-style symmetric deletion index over a growing list of words.
+
+    Every word is stored under each string obtained by deleting up to
+    ``max_distance`` characters from its first ``prefix_length``
+    characters. Two words within ``max_distance`` edits always share one
+    of those keys. A lookup therefore generates the deletes of the query
+    and verifies only the words stored under them, instead of comparing
+    against the whole vocabulary. Matching is case-insensitive.
+    """
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 1, prefix_length: int = 7) -> None:
+        if max_distance < 0:
+            raise ValueError("max_distance must not be negative")
+        self.max_distance = max_distance
+        self.prefix_length = max(prefix_length, max_distance + 1)
+        self._keys: List[str] = []
+        # A key maps to one word id, or to a list once several words share it
+        self._deletes: Dict[str, int | List[int]] = {}
+        for word in words:
+            self.add(word)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def word(self, word_id: int) -> str:
+        """Return the (lowercased) word stored under an id."""
+        return self._keys[word_id]
+
+    def add(self, word: str) -> int:
+        """Index a word and return its id."""
+        key = word.lower()
+        return self._insert(key, self._variants(key, self.max_distance))
+
+    def lookup(self, word: str, max_distance: int | None = None) -> List[tuple[int, int]]:
+        """Return ``(word_id, distance)`` of indexed words within the distance.
+
+        ``max_distance`` may narrow, but not widen, the index's distance.
+        """
+        key = word.lower()
+        limit = self._limit(max_distance)
+        return self._verify(key, self._candidates(self._variants(key, limit)), limit)
+
+    def lookup_or_add(self, word: str, max_distance: int | None = None) -> List[tuple[int, int]]:
+        """Return the matches of a word, indexing it only if there are none.
+
+        The deletes of the word are generated once for both steps, which
+        halves the cost of building an index of cluster leaders.
+        """
+        key = word.lower()
+        limit = self._limit(max_distance)
+        variants = self._variants(key, limit)
+        matches = self._verify(key, self._candidates(variants), limit)
+        if not matches:
+            if limit < self.max_distance:
+                variants = self._variants(key, self.max_distance)
+            self._insert(key, variants)
+        return matches
+
+    def _limit(self, max_distance: int | None) -> int:
+        if max_distance is None:
+            return self.max_distance
+        return max(0, min(max_distance, self.max_distance))
+
+    def _variants(self, key: str, distance: int) -> set:
+        """Return the prefix of ``key`` and its deletes of up to ``distance`` characters."""
+        prefix = key[:self.prefix_length]
+        result = level = {prefix}
+        for _ in range(distance):
+            level = {s[:i] + s[i + 1:] for s in level for i in range(len(s))}
+            result = result | level
+        return result
+
+    def _insert(self, key: str, variants: set) -> int:
+        word_id = len(self._keys)
+        self._keys.append(key)
+        deletes = self._deletes
+        for variant in variants:
+            held = deletes.get(variant)
+            if held is None:
+                deletes[variant] = word_id
+            elif type(held) is int:
+                deletes[variant] = [held, word_id]
+            else:
+                held.append(word_id)
+        return word_id
+
+    def _candidates(self, variants: set) -> set:
+        candidates = set()
+        deletes = self._deletes
+        for variant in variants:
+            held = deletes.get(variant)
+            if held is None:
+                continue
+            if type(held) is int:
+                candidates.add(held)
+            else:
+                candidates.update(held)
+        return candidates
+
+    def _verify(self, key: str, candidates: Iterable[int], limit: int) -> List[tuple[int, int]]:
+        keys = self._keys
+        result = []
+        for word_id in candidates:
+            distance = edit_distance(key, keys[word_id], limit)
+            if distance <= limit:
+                result.append((word_id, distance))
+        return result
+
+
+@dataclass
+class VariantGroup:
+    """A canonical word and the variants merged into it."""
+
+    canonical: str
+    variants: List[str] = field(default_factory=list)
+    count: int = 0  # Occurrences of the canonical word and all its variants
+
+
+def group_variants(
+    words: Sequence[str],
+    counts: Sequence[int] | None = None,
+    max_distance: int = 1,
+    min_length: int = 5,
+    chars_per_edit: int = 4,
+) -> List[VariantGroup]:
+    """Group words that are within a few edits of a more common word.
+
+    Words are visited from most to least frequent (then in list order). A
+    word close enough to an earlier canonical word joins the closest one
+    (the most frequent on ties); otherwise it becomes canonical itself.
+    Only canonical words are indexed. Variants never attract other words,
+    so no chains form through short words. Short words differ from other
+    real words by an edit or two. So words shorter than ``min_length`` are
+    never merged, and a word may only be ``len(word) // chars_per_edit``
+    edits (at least one) from its canonical form.
+
+    Args:
+        words: Unique words (case-insensitively), e.g. in first-occurrence order.
+        counts: Occurrences of each word; without counts the first
+            occurrence wins.
+        max_distance: Most edits (insertions, deletions, substitutions,
+            adjacent transpositions) between a variant and its canonical form.
+        min_length: Shortest word that takes part in grouping.
+        chars_per_edit: Word length per allowed edit; 0 allows
+            ``max_distance`` edits for every word.
+
+    Returns:
+        One group per canonical word, in the order of ``words``.
+    """
+    counts = counts if counts is not None else [1] * len(words)
+    index = DeletionIndex(max_distance=max_distance)
+    leaders: List[int] = []  # Word position of each indexed canonical word
+    canonical_of = list(range(len(words)))
+    order = sorted(
+        (i for i, w in enumerate(words) if len(w) >= min_length),
+        key=lambda i: -counts[i],
+    )
+    for word_id in order:
+        word = words[word_id]
+        limit = max(1, len(word) // chars_per_edit) if chars_per_edit > 0 else max_distance
+        matches = index.lookup_or_add(word, limit)
+        if matches:
+            # Leaders are indexed in frequency order, so a lower id is more common
+            canonical_of[word_id] = leaders[min(matches, key=lambda m: (m[1], m[0]))[0]]
+        else:
+            leaders.append(word_id)
+
+    groups: Dict[int, VariantGroup] = {}
+    for word_id, center in enumerate(canonical_of):
+        if center == word_id:
+            groups[word_id] = VariantGroup(words[word_id], count=counts[word_id])
+    for word_id, center in enumerate(canonical_of):
+        if center != word_id:
+            groups[center].variants.append(words[word_id])
+            groups[center].count += counts[word_id]
+    return list(groups.values())
+
+
+def collapse_variants(
+    words: Sequence[str],
+    counts: Sequence[int] | None = None,
+    max_distance: int = 1,
+    min_length: int = 5,
+    chars_per_edit: int = 4,
+) -> List[str]:
+    """Return the word list with every variant replaced by its canonical word.
+
+    Canonical words keep the position of their own first occurrence.
+    """
+    groups = group_variants(words, counts, max_distance, min_length, chars_per_edit)
+    return [g.canonical for g in groups]
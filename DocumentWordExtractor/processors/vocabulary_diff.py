@@ -0,0 +1,168 @@
+"""Vocabulary comparison between documents or revisions."""
+
+from array import array
+from dataclasses import dataclass
+from itertools import compress
+from operator import not_
+from typing import Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from processors.word_offsets import WordOffsetIndex
+
+
+class Lexicon:
+    """Interns lowercased words as integer ids shared by several vocabularies.
+
+    Comparing vocabularies as sets of small integers avoids hashing and
+    comparing strings on every diff. Each vocabulary is interned once and
+    keeps its id array and id set for later comparisons.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def intern(self, keys: Iterable[str]) -> array:
+        """Return the ids of lowercased words, assigning new ids as needed."""
+        ids = self._ids
+        setdefault = ids.setdefault
+        return array("I", [setdefault(key, len(ids)) for key in keys])
+
+
+class Vocabulary:
+    """The case-insensitive word set of one document with occurrence counts.
+
+    ``ids`` maps each lowercased word to its id and is ordered by id
+    (first occurrence); ``forms`` and ``counts`` are indexed by that id.
+    """
+
+    __slots__ = ("name", "ids", "forms", "counts", "_lexicon", "_global_ids", "_global_set")
+
+    def __init__(self, name: str, ids: Dict[str, int], forms: Sequence[str], counts: Sequence[int]) -> None:
+        self.name = name
+        self.ids = ids
+        self.forms = forms
+        self.counts = counts
+        self._lexicon: Lexicon | None = None
+        self._global_ids: array | None = None
+        self._global_set: frozenset | None = None
+
+    @classmethod
+    def from_offsets(cls, name: str, offsets: WordOffsetIndex) -> "Vocabulary":
+        """Use a loaded document's index; only the counts are computed."""
+        return cls(name, offsets.key_ids(), offsets.unique_words(), offsets.word_counts())
+
+    @classmethod
+    def from_counts(cls, name: str, counts: Mapping[str, int]) -> "Vocabulary":
+        """Build from ``{first form: count}`` as returned by WordExtractor.count_words."""
+        forms = list(counts)
+        return cls(name, {w.lower(): i for i, w in enumerate(forms)}, forms, array("I", counts.values()))
+
+    def __len__(self) -> int:
+        return len(self.forms)
+
+    def __contains__(self, word: str) -> bool:
+        return word.lower() in self.ids
+
+    def count(self, word: str) -> int:
+        """Return the occurrences of a word (case-insensitive), 0 if absent."""
+        word_id = self.ids.get(word.lower())
+        return 0 if word_id is None else self.counts[word_id]
+
+    def global_ids(self, lexicon: Lexicon) -> Tuple[array, frozenset]:
+        """Return this vocabulary's lexicon ids (in ``ids`` order) and their set."""
+        if self._lexicon is not lexicon:
+            self._global_ids = lexicon.intern(self.ids)
+            self._global_set = frozenset(self._global_ids)
+            self._lexicon = lexicon
+        return self._global_ids, self._global_set
+
+
+@dataclass
+class VocabularyDiff:
+    """Words added, removed and kept between a base and a target vocabulary.
+
+    The three groups are stored as sorted id arrays: added ids are target
+    ids, removed and common ids are base ids. Words and counts are looked
+    up only when a group is read.
+    """
+
+    base: Vocabulary
+    target: Vocabulary
+    added_ids: array
+    removed_ids: array
+    common_ids: array
+
+    def added(self) -> List[Tuple[str, int]]:
+        """``(word, target count)`` in the target's first-occurrence order."""
+        forms, counts = self.target.forms, self.target.counts
+        return [(forms[i], counts[i]) for i in self.added_ids]
+
+    def removed(self) -> List[Tuple[str, int]]:
+        """``(word, base count)`` in the base's first-occurrence order."""
+        forms, counts = self.base.forms, self.base.counts
+        return [(forms[i], counts[i]) for i in self.removed_ids]
+
+    def common(self) -> List[Tuple[str, int, int]]:
+        """``(word, base count, target count)`` in the base's order."""
+        forms, counts = self.base.forms, self.base.counts
+        target_ids, target_counts = self.target.ids, self.target.counts
+        return [
+            (forms[i], counts[i], target_counts[target_ids[forms[i].lower()]])
+            for i in self.common_ids
+        ]
+
+    def summary(self) -> Dict[str, int]:
+        return {
+            "added": len(self.added_ids),
+            "removed": len(self.removed_ids),
+            "common": len(self.common_ids),
+        }
+
+    def as_dict(self, words: bool = True) -> dict:
+        result = {"base": self.base.name, "target": self.target.name, **self.summary()}
+        if words:
+            result["added_words"] = [{"word": w, "count": n} for w, n in self.added()]
+            result["removed_words"] = [{"word": w, "count": n} for w, n in self.removed()]
+            result["common_words"] = [
+                {"word": w, "base_count": a, "count": b} for w, a, b in self.common()
+            ]
+        return result
+
+
+def diff_vocabularies(
+    base: Vocabulary, target: Vocabulary, lexicon: Lexicon | None = None
+) -> VocabularyDiff:
+    """Compare two vocabularies case-insensitively.
+
+    Both are interned into ``lexicon`` (a new one if omitted); pass the
+    same lexicon for repeated comparisons so each vocabulary is interned
+    only once. Each group is then one pass of integer set membership
+    tests, chained from ``map`` and ``compress`` so that it runs in C.
+    Results come out in first-occurrence order without sorting.
+    """
+    lexicon = lexicon if lexicon is not None else Lexicon()
+    base_global, base_set = base.global_ids(lexicon)
+    target_global, target_set = target.global_ids(lexicon)
+    in_base, in_target = base_set.__contains__, target_set.__contains__
+    return VocabularyDiff(
+        base,
+        target,
+        array("I", compress(target.ids.values(), map(not_, map(in_base, target_global)))),
+        array("I", compress(base.ids.values(), map(not_, map(in_target, base_global)))),
+        array("I", compress(base.ids.values(), map(in_target, base_global))),
+    )
+
+
+def diff_sequence(
+    vocabularies: Sequence[Vocabulary],
+    against_first: bool = False,
+    lexicon: Lexicon | None = None,
+) -> List[VocabularyDiff]:
+    """Compare each vocabulary with the previous one (revisions), or with the first."""
+    lexicon = lexicon if lexicon is not None else Lexicon()
+    return [
+        diff_vocabularies(vocabularies[0] if against_first else vocabularies[i - 1], vocabularies[i], lexicon)
+        for i in range(1, len(vocabularies))
+    ]
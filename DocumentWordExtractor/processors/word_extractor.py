@@ -1,13 +1,14 @@
 """Word extraction processor."""
 
 import re
-from typing import List
+from collections import Counter
+from typing import Dict, List
 
 
 class WordExtractor:
     """Extracts and processes words from text."""
 
-    WORD_PATTERN = re.compile(r"\b[a-zA-Zа-яА-ЯёЁәөүҮҗҖңӨӘ0-9]+\b")
+    WORD_PATTERN = re.compile(r"\b[a-zA-Zа-яА-ЯёЁәөүҮҗҖңӨӘқҚғҒҳҲўЎʻʼ0-9]+\b")
 
     @classmethod
     def extract_words(cls, text: str) -> List[str]:
@@ -19,18 +20,42 @@ class WordExtractor:
         Returns:
             List of extracted words.
         """
-        if not text or not text.strip():
+        if not text:
             return []
         return cls.WORD_PATTERN.findall(text)
 
     @classmethod
     def extract_unique_words(cls, text: str) -> List[str]:
         """Extract unique words preserving order of first occurrence."""
+        return cls.unique_words(cls.extract_words(text))
+
+    @staticmethod
+    def unique_words(words: List[str]) -> List[str]:
+        """Drop case-insensitive repeats, keeping each first occurrence."""
         seen = set()
         result = []
-        for word in cls.extract_words(text):
+        # dict.fromkeys drops exact repeats at C speed before the Python loop
+        for word in dict.fromkeys(words):
             lower = word.lower()
             if lower not in seen:
                 seen.add(lower)
                 result.append(word)
         return result
+
+    @classmethod
+    def count_words(cls, text: str) -> Dict[str, int]:
+        """Count word occurrences case-insensitively.
+
+        Returns:
+            Mapping of each word (in its first-occurrence form) to its count,
+            ordered by first occurrence.
+        """
+        return cls.count_tokens(cls.extract_words(text))
+
+    @staticmethod
+    def count_tokens(words: List[str]) -> Dict[str, int]:
+        """Count already extracted words, like count_words does for text."""
+        lowered = list(map(str.lower, words))
+        # Walking backwards leaves the earliest form as each key's value
+        first_form = dict(zip(reversed(lowered), reversed(words)))
+        return {first_form[k]: n for k, n in Counter(lowered).items()}
@@ -0,0 +1,246 @@
+"""Substring index for instant filtering of large word lists."""
+
+import threading
+from array import array
+from bisect import bisect_left
+from itertools import compress, repeat
+from operator import add
+from typing import Iterable, List, Sequence
+
+
+class WordIndex:
+    """Case-insensitive search index over an append-only list of words.
+
+    Every word gets an integer id in insertion order. Queries match
+    substrings at any length. The posting lists of every one- and
+    two-character string are built in one pass when the words are indexed,
+    on a background thread for lists of ``BACKGROUND_WORDS`` words or more.
+    A trigram's posting list is built on first use from the words in the
+    shorter posting list of its two bigrams, and kept. Queries of up to
+    ``NGRAM`` characters are answered by their own posting list; longer
+    queries intersect the posting lists of their trigrams. Posting lists are
+    in id order, so results come back in list order without sorting. Until
+    a background build finishes, queries check the words directly.
+
+    Consecutive substring queries are narrowed incrementally: if the new query
+    contains the previous one, only the previous result set is re-checked.
+
+    Removed words are tombstoned rather than renumbered; ``position`` maps an
+    id back to its index in the caller's list with the removed words deleted.
+    """
+
+    NGRAM = 3
+    # Word lists at least this long are indexed on a background thread
+    BACKGROUND_WORDS = 50_000
+
+    def __init__(self, words: Iterable[str] = ()) -> None:
+        self._words: List[str] = list(words)
+        self._keys: List[str] = [w.lower() for w in self._words]
+        self._alive = bytearray(b"\x01") * len(self._words)
+        self._dead: List[int] = []  # Sorted ids of removed words
+        self._key_to_id: dict[str, int] = {}
+        for i, key in enumerate(self._keys):
+            self._key_to_id.setdefault(key, i)
+        self._grams: dict[str, array] = {}  # Trigram posting lists
+        self._short: dict[str, array] | None = None  # One- and two-character ones
+        self._short_built: tuple[dict[str, array], int] | None = None
+        self._short_ready = threading.Event()
+        if len(self._keys) < self.BACKGROUND_WORDS:
+            self._build_short(self._keys)
+        else:
+            threading.Thread(
+                target=self._build_short, args=(self._keys[:],), name="word-index", daemon=True
+            ).start()
+
+        self._last_query = ""
+        self._last_result: List[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._words) - len(self._dead)
+
+    def word(self, word_id: int) -> str:
+        """Return the word stored under the given id."""
+        return self._words[word_id]
+
+    def find(self, word: str) -> int | None:
+        """Return the id of a live word equal to ``word`` ignoring case."""
+        return self._key_to_id.get(word.lower())
+
+    def position(self, word_id: int) -> int:
+        """Return the index of the word in the list with removed words deleted."""
+        return word_id - bisect_left(self._dead, word_id)
+
+    def wait_indexed(self, timeout: float | None = None) -> bool:
+        """Wait for the posting lists built in the background; return whether they are."""
+        return self._short_ready.wait(timeout)
+
+    def add(self, word: str) -> int:
+        """Append a word to the index and return its id."""
+        word_id = len(self._words)
+        key = word.lower()
+        self._words.append(word)
+        self._keys.append(key)
+        self._alive.append(1)
+        self._key_to_id.setdefault(key, word_id)
+
+        # Posting lists still being built get the new id when they are adopted
+        if self._short is not None:
+            _index_short(key, word_id, self._short)
+        # Only trigrams that were already materialized need the new id
+        for i in range(len(key) - self.NGRAM + 1):
+            posting = self._grams.get(key[i:i + self.NGRAM])
+            if posting is not None and (not posting or posting[-1] != word_id):
+                posting.append(word_id)
+
+        if self._last_result is not None and self._matches(word_id, self._last_query):
+            self._last_result.append(word_id)
+        return word_id
+
+    def remove(self, word_ids: Iterable[int]) -> None:
+        """Tombstone words by id; their ids are never reused."""
+        removed = False
+        for word_id in word_ids:
+            if self._alive[word_id]:
+                self._alive[word_id] = 0
+                self._dead.insert(bisect_left(self._dead, word_id), word_id)
+                key = self._keys[word_id]
+                if self._key_to_id.get(key) == word_id:
+                    del self._key_to_id[key]
+                removed = True
+        if removed and self._last_result is not None:
+            alive = self._alive
+            self._last_result = [i for i in self._last_result if alive[i]]
+
+    def search(self, query: str) -> Sequence[int]:
+        """Return ids of live words matching ``query`` in insertion order."""
+        q = query.strip().lower()
+        last = self._last_query
+        if not q:
+            result: Sequence[int] = (
+                range(len(self._words)) if not self._dead
+                else list(compress(range(len(self._words)), self._alive))
+            )
+            self._last_query = ""
+            self._last_result = None
+            return result
+        narrow = self._last_result is not None and bool(last) and last in q
+        indexed = self._adopt_short()
+        alive = self._alive
+        if indexed and len(q) <= self.NGRAM and (len(q) < self.NGRAM or q in self._grams or not narrow):
+            posting = self._gram_posting(q)
+            result = list(posting) if not self._dead else [i for i in posting if alive[i]]
+        elif narrow:
+            # Narrow the previous result set instead of rescanning
+            keys = self._keys
+            result = [i for i in self._last_result if q in keys[i]]
+        elif indexed:
+            result = self._search_grams(q)
+        else:
+            # The posting lists are still being built in the background
+            keys = self._keys
+            found = compress(range(len(keys)), map(str.__contains__, keys, repeat(q)))
+            result = list(found) if not self._dead else [i for i in found if alive[i]]
+        self._last_query = q
+        self._last_result = result
+        return list(result)
+
+    def _matches(self, word_id: int, q: str) -> bool:
+        if not q:
+            return True
+        return q in self._keys[word_id]
+
+    def _build_short(self, keys: List[str]) -> None:
+        """Build the one- and two-character posting lists of ``keys``."""
+        self._short_built = (_short_postings(keys), len(keys))
+        self._short_ready.set()
+
+    def _adopt_short(self) -> bool:
+        """Take over finished short posting lists; return whether they are in place.
+
+        Words added while the lists were built are indexed here, on the
+        thread that owns the index.
+        """
+        if self._short is not None:
+            return True
+        if not self._short_ready.is_set():
+            return False
+        postings, built = self._short_built
+        for word_id in range(built, len(self._keys)):
+            _index_short(self._keys[word_id], word_id, postings)
+        self._short, self._short_built = postings, None
+        return True
+
+    def _gram_posting(self, gram: str) -> Sequence[int]:
+        """Return the id-ordered posting list of a string of up to ``NGRAM`` characters."""
+        if len(gram) < self.NGRAM:
+            return self._short.get(gram, ())
+        posting = self._grams.get(gram)
+        if posting is None:
+            # Check the words of the rarer of the trigram's two bigrams
+            short = self._short
+            pair = min(short.get(gram[:2], ()), short.get(gram[1:], ()), key=len)
+            keys = self._keys
+            posting = self._grams[gram] = array("I", [i for i in pair if gram in keys[i]])
+        return posting
+
+    def _search_grams(self, q: str) -> List[int]:
+        """Intersect n-gram postings, starting from the rarest n-gram."""
+        grams = {q[i:i + self.NGRAM] for i in range(len(q) - self.NGRAM + 1)}
+        postings = sorted((self._gram_posting(g) for g in grams), key=len)
+        alive = self._alive
+        keys = self._keys
+        return [i for i in postings[0] if alive[i] and q in keys[i]]
+
+
+def _index_short(key: str, word_id: int, postings: dict[str, array]) -> None:
+    """Append a word to the posting lists of its one- and two-character strings."""
+    for gram in set(key).union(map(add, key, key[1:])):
+        posting = postings.get(gram)
+        if posting is None:
+            postings[gram] = posting = array("I")
+        posting.append(word_id)
+
+
+def _short_postings(keys: List[str]) -> dict[str, array]:
+    """Return the posting lists of every one- and two-character string in ``keys``.
+
+    Uses NumPy when it is installed: the strings are then encoded as
+    integers and grouped with one sort per length, instead of one dict
+    lookup per string and word.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        np = None
+    postings: dict[str, array] = {}
+    text = "\n".join(keys)
+    # Newlines separate the words, so words containing one take the slow path
+    if np is None or not keys or text.count("\n") != len(keys) - 1:
+        for word_id, key in enumerate(keys):
+            _index_short(key, word_id, postings)
+        return postings
+
+    chars = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    breaks = chars == ord("\n")
+    ids = np.cumsum(breaks, dtype=np.uint32)
+    wide = chars.astype(np.uint64)
+    for n in (1, 2):
+        if n == 1:
+            keep = ~breaks
+            codes = wide[keep]
+        else:
+            keep = ~(breaks[:-1] | breaks[1:])
+            codes = ((wide[:-1] << np.uint64(21)) | wide[1:])[keep]
+        owners = ids[:len(keep)][keep]
+        # A stable sort keeps each string's word ids ascending
+        order = np.argsort(codes, kind="stable")
+        codes, owners = codes[order], owners[order]
+        first = np.ones(len(codes), dtype=bool)
+        first[1:] = (codes[1:] != codes[:-1]) | (owners[1:] != owners[:-1])
+        codes, owners = codes[first], owners[first]
+        starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+        bounds = np.r_[starts, len(codes)].tolist()
+        for code, start, stop in zip(codes[starts].tolist(), bounds, bounds[1:]):
+            gram = chr(code) if n == 1 else chr(code >> 21) + chr(code & 0x1FFFFF)
+            postings[gram] = array("I", owners[start:stop].tobytes())
+    return postings
@@ -0,0 +1,116 @@
+"""Per-document index of word occurrence offsets."""
+
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Sequence
+
+from processors.word_extractor import WordExtractor
+
+
+class WordOffsetIndex:
+    """Offsets of every word occurrence in a document, grouped by word id.
+
+    Words are interned case-insensitively in first-occurrence order, so
+    ``unique_words`` gives the same result as
+    ``WordExtractor.extract_unique_words`` without a second pass.
+
+    Line starts follow the block boundaries Qt uses for plain text (``\\r\\n``,
+    ``\\r``, ``\\n`` and U+2029), so line ``n`` is text block ``n`` in a
+    ``QPlainTextEdit`` showing the same text.
+    """
+
+    LINE_BREAK = re.compile("\r\n|[\r\n\u2029]")
+
+    __slots__ = ("starts", "ids", "line_starts", "_forms", "_key_to_id")
+
+    def __init__(self, text: str) -> None:
+        self.starts = array("I")  # Start offset of each occurrence
+        self.ids = array("I")  # Word id of each occurrence
+        self._forms: List[str] = []  # First-occurrence form per word id
+        self._key_to_id: dict[str, int] = {}
+
+        starts_append = self.starts.append
+        ids_append = self.ids.append
+        key_to_id = self._key_to_id
+        forms = self._forms
+        for m in WordExtractor.WORD_PATTERN.finditer(text):
+            word = m.group()
+            key = word.lower()
+            word_id = key_to_id.get(key)
+            if word_id is None:
+                word_id = key_to_id[key] = len(forms)
+                forms.append(word)
+            starts_append(m.start())
+            ids_append(word_id)
+
+        self.line_starts = array("I", [0])
+        self.line_starts.extend(m.end() for m in self.LINE_BREAK.finditer(text))
+
+    @classmethod
+    def from_arrays(
+        cls,
+        forms: List[str],
+        starts: Sequence[int],
+        ids: Sequence[int],
+        line_starts: Sequence[int],
+    ) -> "WordOffsetIndex":
+        """Rebuild an index from stored tables without rescanning the text.
+
+        The tables may be any integer sequences, including memoryviews over a
+        memory-mapped snapshot.
+        """
+        index = cls.__new__(cls)
+        index.starts = starts
+        index.ids = ids
+        index.line_starts = line_starts
+        index._forms = forms
+        index._key_to_id = {}
+        for i, word in enumerate(forms):
+            index._key_to_id.setdefault(word.lower(), i)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def unique_words(self) -> List[str]:
+        """Return unique words in order of first occurrence."""
+        return list(self._forms)
+
+    def word_id(self, word: str) -> int | None:
+        """Return the id of a word (case-insensitive), or None if absent."""
+        return self._key_to_id.get(word.lower())
+
+    def key_ids(self) -> Dict[str, int]:
+        """Return the mapping of lowercased words to ids (do not modify it)."""
+        return self._key_to_id
+
+    def word_counts(self) -> List[int]:
+        """Return the number of occurrences of each word id."""
+        counts = [0] * len(self._forms)
+        for word_id, count in Counter(self.ids).items():
+            counts[word_id] = count
+        return counts
+
+    def word_length(self, word_id: int) -> int:
+        """Return the length of every occurrence of the given word."""
+        return len(self._forms[word_id])
+
+    def line_span(self, first_line: int, last_line: int) -> tuple[int, int]:
+        """Return the text offsets covering lines ``first_line..last_line``."""
+        start = self.line_starts[first_line] if first_line < len(self.line_starts) else 0
+        end = (
+            self.line_starts[last_line + 1]
+            if last_line + 1 < len(self.line_starts)
+            else 0xFFFFFFFF
+        )
+        return start, end
+
+    def occurrences_between(self, start: int, end: int) -> range:
+        """Return the occurrence indices whose start offset is in [start, end)."""
+        return range(bisect_left(self.starts, start), bisect_left(self.starts, end))
+
+    def line_of(self, offset: int) -> int:
+        """Return the line (text block) number containing an offset."""
+        return bisect_left(self.line_starts, offset + 1) - 1
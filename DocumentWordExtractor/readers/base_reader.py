@@ -1,14 +1,35 @@
 """Base document reader interface."""
 
+import io
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import BinaryIO, Iterator, Union
+
+from readers.document import Document
+
+# A document on disk, or its content already in memory (downloads,
+# archive members). Every reader accepts either.
+Source = Union[Path, bytes]
+
+
+def as_file(source: Source) -> Union[Path, BinaryIO]:
+    """Return a path as is, or in-memory content as a binary file object."""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    return source
 
 
 class BaseReader(ABC):
-    """Abstract base class for document readers."""
+    """Abstract base class for document readers.
+
+    ``file_path`` arguments may also be the document's bytes (``Source``).
+    """
+
+    # Pages in the last document read, for formats that have pages
+    last_page_count: int | None = None
 
     @abstractmethod
-    def read(self, file_path: Path) -> str:
+    def read(self, file_path: Source) -> str:
         """Read document content and return as plain text.
 
         Args:
@@ -19,6 +40,27 @@ class BaseReader(ABC):
         """
         pass
 
+    def read_document(self, file_path: Source) -> Document:
+        """Read the document with its page and block structure.
+
+        ``read_document(path).text`` is exactly what ``read(path)`` returns.
+        Readers that know their structure override this and implement
+        ``read`` on top of it; the default wraps ``read`` as one page of
+        paragraphs.
+        """
+        return Document.from_text(self.read(file_path))
+
+    def iter_text(self, file_path: Source) -> Iterator[str]:
+        """Yield the document text in pieces (pages, paragraphs, chunks).
+
+        For consumers that may stop early, such as signatures computed
+        over the start of a document. Pieces are not separated by
+        whitespace from each other unless the format puts it there, and
+        their concatenation need not equal ``read()``. The default yields
+        the whole text at once.
+        """
+        yield self.read(file_path)
+
     @property
     @abstractmethod
     def supported_extensions(self) -> tuple[str, ...]:
@@ -0,0 +1,225 @@
+"""Structured document model over a single shared text buffer."""
+
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterator, Sequence
+
+# A run of non-blank lines; blank lines separate paragraphs in plain text
+PARAGRAPH = re.compile(r"[^\r\n]*\S[^\r\n]*(?:\r?\n[^\r\n]*\S[^\r\n]*)*")
+
+
+class Document:
+    """A document as one text buffer plus offset tables.
+
+    Pages and blocks (paragraphs, or PyMuPDF text blocks) are not stored as
+    objects or separate strings. Each block is a ``[start, end)`` span of
+    ``text`` in uint32 tables, and pages are the offsets where their first
+    block starts. ``Page`` and ``Block`` are two-slot views created on
+    access, so a document costs its text plus 12 bytes per block (16 more
+    with PDF boxes). ``str(document)`` returns the buffer itself.
+    """
+
+    __slots__ = ("text", "page_starts", "block_starts", "block_ends", "block_pages", "block_boxes")
+
+    def __init__(
+        self,
+        text: str = "",
+        page_starts: Sequence[int] | None = None,
+        block_starts: Sequence[int] | None = None,
+        block_ends: Sequence[int] | None = None,
+        block_pages: Sequence[int] | None = None,
+        block_boxes: Sequence[float] | None = None,
+    ) -> None:
+        self.text = text
+        self.page_starts = page_starts if page_starts is not None else array("I", [0])
+        self.block_starts = block_starts if block_starts is not None else array("I")
+        self.block_ends = block_ends if block_ends is not None else array("I")
+        self.block_pages = block_pages if block_pages is not None else array("I")
+        # x0, y0, x1, y1 per block, or None for formats without geometry
+        self.block_boxes = block_boxes
+
+    @classmethod
+    def from_text(cls, text: str) -> "Document":
+        """Wrap plain text as one page whose blocks are its paragraphs."""
+        starts, ends = array("I"), array("I")
+        for match in PARAGRAPH.finditer(text):
+            starts.append(match.start())
+            ends.append(match.end())
+        return cls(text, array("I", [0]), starts, ends, array("I", bytes(4 * len(starts))))
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    @property
+    def page_count(self) -> int:
+        return len(self.page_starts)
+
+    @property
+    def block_count(self) -> int:
+        return len(self.block_starts)
+
+    def page(self, index: int) -> "Page":
+        if not 0 <= index < len(self.page_starts):
+            raise IndexError(index)
+        return Page(self, index)
+
+    def block(self, index: int) -> "Block":
+        if not 0 <= index < len(self.block_starts):
+            raise IndexError(index)
+        return Block(self, index)
+
+    def pages(self) -> Iterator["Page"]:
+        return (Page(self, i) for i in range(len(self.page_starts)))
+
+    def blocks(self) -> Iterator["Block"]:
+        return (Block(self, i) for i in range(len(self.block_starts)))
+
+    def page_at(self, offset: int) -> int:
+        """Return the index of the page containing a text offset."""
+        return max(bisect_right(self.page_starts, offset) - 1, 0)
+
+    def block_at(self, offset: int) -> int | None:
+        """Return the index of the block containing a text offset, if any."""
+        i = bisect_right(self.block_starts, offset) - 1
+        if i >= 0 and offset < self.block_ends[i]:
+            return i
+        return None
+
+
+class Page:
+    """View of one page of a Document."""
+
+    __slots__ = ("document", "index")
+
+    def __init__(self, document: Document, index: int) -> None:
+        self.document = document
+        self.index = index
+
+    @property
+    def start(self) -> int:
+        return self.document.page_starts[self.index]
+
+    @property
+    def end(self) -> int:
+        """End of the page's last block (its start if it has none)."""
+        first, last = self.block_range()
+        return self.document.block_ends[last - 1] if last > first else self.start
+
+    @property
+    def text(self) -> str:
+        return self.document.text[self.start:self.end]
+
+    def block_range(self) -> tuple[int, int]:
+        """Return the ``[first, last)`` block indexes on this page."""
+        pages = self.document.block_pages
+        return bisect_left(pages, self.index), bisect_right(pages, self.index)
+
+    def blocks(self) -> Iterator["Block"]:
+        first, last = self.block_range()
+        return (Block(self.document, i) for i in range(first, last))
+
+
+class Block:
+    """View of one block (paragraph) of a Document."""
+
+    __slots__ = ("document", "index")
+
+    def __init__(self, document: Document, index: int) -> None:
+        self.document = document
+        self.index = index
+
+    @property
+    def start(self) -> int:
+        return self.document.block_starts[self.index]
+
+    @property
+    def end(self) -> int:
+        return self.document.block_ends[self.index]
+
+    @property
+    def page(self) -> int:
+        return self.document.block_pages[self.index]
+
+    @property
+    def text(self) -> str:
+        return self.document.text[self.start:self.end]
+
+    @property
+    def bbox(self) -> tuple[float, float, float, float] | None:
+        boxes = self.document.block_boxes
+        if boxes is None:
+            return None
+        return tuple(boxes[4 * self.index:4 * self.index + 4])
+
+
+class DocumentBuilder:
+    """Collects blocks page by page and joins them into one Document.
+
+    Block texts are joined once at the end; the pieces are released as soon
+    as the Document holds the joined buffer.
+    """
+
+    def __init__(self, block_separator: str = "", page_separator: str = "\n\n") -> None:
+        self._block_sep = block_separator
+        self._page_sep = page_separator
+        self._parts: list[str] = []
+        self._pos = 0
+        self._page = -1
+        self._page_has_blocks = False
+        self._page_starts = array("I")
+        self._starts = array("I")
+        self._ends = array("I")
+        self._pages = array("I")
+        self._boxes: array | None = None
+
+    def new_page(self) -> None:
+        if self._page >= 0:
+            self._append(self._page_sep)
+        self._page += 1
+        self._page_has_blocks = False
+        self._page_starts.append(self._pos)
+
+    def add_block(self, text: str, bbox: Sequence[float] | None = None) -> None:
+        if self._page < 0:
+            self.new_page()
+        if self._page_has_blocks:
+            self._append(self._block_sep)
+        self._page_has_blocks = True
+        self._starts.append(self._pos)
+        self._append(text)
+        self._ends.append(self._pos)
+        self._pages.append(self._page)
+        if bbox is not None:
+            if self._boxes is None:
+                self._boxes = array("f", bytes(16 * (len(self._starts) - 1)))
+            self._boxes.extend(bbox)
+        elif self._boxes is not None:
+            self._boxes.extend((0.0, 0.0, 0.0, 0.0))
+
+    def _append(self, text: str) -> None:
+        if text:
+            self._parts.append(text)
+            self._pos += len(text)
+
+    def build(self, strip: bool = False) -> Document:
+        """Join the blocks; ``strip`` trims the text and shifts the offsets."""
+        text = "".join(self._parts)
+        self._parts = []
+        page_starts = self._page_starts or array("I", [0])
+        starts, ends = self._starts, self._ends
+        if strip:
+            stripped = text.strip()
+            lead = len(text) - len(text.lstrip())
+            if stripped != text:
+                size = len(stripped)
+                text = stripped
+
+                def shift(values: array) -> array:
+                    return array("I", (min(max(v - lead, 0), size) for v in values))
+
+                page_starts, starts, ends = shift(page_starts), shift(starts), shift(ends)
+        return Document(text, page_starts, starts, ends, self._pages, self._boxes)
@@ -1,33 +1,69 @@
 """Factory for selecting appropriate document reader."""
 
+import threading
 from pathlib import Path
 
 from readers.base_reader import BaseReader
 from readers.text_reader import TextReader
 from readers.docx_reader import DocxReader
 from readers.pdf_reader import PdfReader
+from readers.odt_reader import OdtReader
+from readers.epub_reader import EpubReader
+from readers.html_reader import HtmlReader
+from readers.rtf_reader import RtfReader
 from readers.file_type_detector import detect_file_type
 
 
 class DocumentFactory:
-    """Creates the appropriate reader for a given file."""
+    """Creates the appropriate reader for a given file.
 
-    _readers: list[BaseReader] = [
-        PdfReader(),
-        DocxReader(),
-        TextReader(),
-    ]
+    Reader instances are owned by the calling thread, so worker threads never
+    share PyMuPDF or python-docx handles with each other.
+    """
 
-    _ext_to_reader: dict[str, BaseReader] = {
+    _reader_classes: tuple[type[BaseReader], ...] = (
+        PdfReader,
+        DocxReader,
+        TextReader,
+        OdtReader,
+        EpubReader,
+        HtmlReader,
+        RtfReader,
+    )
+
+    _ext_to_reader_class: dict[str, type[BaseReader]] = {
         ext: r
-        for r in _readers
-        for ext in r.supported_extensions
+        for r in _reader_classes
+        for ext in r().supported_extensions
     }
 
+    _thread_state = threading.local()
+
+    @classmethod
+    def supported_extensions(cls) -> tuple[str, ...]:
+        """Return all file extensions that have a registered reader."""
+        return tuple(cls._ext_to_reader_class)
+
+    @classmethod
+    def _thread_readers(cls) -> dict[str, BaseReader]:
+        """Return the reader instances owned by the current thread."""
+        readers = getattr(cls._thread_state, "readers", None)
+        if readers is None:
+            instances = {r: r() for r in cls._reader_classes}
+            readers = {
+                ext: instances[r] for ext, r in cls._ext_to_reader_class.items()
+            }
+            cls._thread_state.readers = readers
+        return readers
+
     @classmethod
     def get_reader(cls, file_path: Path) -> BaseReader | None:
         """Get reader for the given file path. Detects type by extension or magic bytes."""
-        detected = detect_file_type(file_path)
-        if detected:
-            return cls._ext_to_reader.get(detected)
+        return cls.reader_for_type(detect_file_type(file_path))
+
+    @classmethod
+    def reader_for_type(cls, extension: str | None) -> BaseReader | None:
+        """Get the reader for a detected extension (e.g. from ``detect_bytes``)."""
+        if extension:
+            return cls._thread_readers().get(extension)
         return None
@@ -1,28 +1,63 @@
 """Microsoft Word (.docx) document reader."""
 
-from pathlib import Path
+import zipfile
+from typing import Iterator
+from xml.etree.ElementTree import ParseError, iterparse
 
-from readers.base_reader import BaseReader
+from readers.base_reader import BaseReader, Source, as_file
+from readers.document import Document, DocumentBuilder
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
 
 
 class DocxReader(BaseReader):
     """Reader for Microsoft Word .docx files."""
 
-    def read(self, file_path: Path) -> str:
+    def read(self, file_path: Source) -> str:
         """Read Word document content using python-docx."""
+        return self.read_document(file_path).text
+
+    def read_document(self, file_path: Source) -> Document:
+        """Read the paragraphs as blocks of a single page."""
         try:
-            from docx import Document
+            from docx import Document as DocxDocument
         except ImportError as e:
             raise RuntimeError(
                 "python-docx is not installed. Install with: pip install python-docx"
             ) from e
 
         try:
-            doc = Document(file_path)
-            return "\n".join(para.text for para in doc.paragraphs)
+            doc = DocxDocument(as_file(file_path))
+            builder = DocumentBuilder(block_separator="\n")
+            for para in doc.paragraphs:
+                builder.add_block(para.text)
+            return builder.build()
         except Exception as e:
             raise ValueError(f"Corrupted or invalid DOCX file: {e}") from e
 
+    def iter_text(self, file_path: Source) -> Iterator[str]:
+        """Yield paragraph texts straight from ``word/document.xml``.
+
+        Parses incrementally and clears each paragraph once yielded, so a
+        consumer that stops early never pays for the rest of the document.
+        Tables, headers and notes are read as their paragraphs appear.
+        """
+        try:
+            with zipfile.ZipFile(as_file(file_path)) as archive, archive.open("word/document.xml") as xml:
+                parts: list[str] = []
+                for _, elem in iterparse(xml):
+                    tag = elem.tag
+                    if tag == _W + "t":
+                        parts.append(elem.text or "")
+                    elif tag in (_W + "tab", _W + "br", _W + "cr"):
+                        parts.append("\t" if tag == _W + "tab" else "\n")
+                    elif tag == _W + "p":
+                        yield "".join(parts) + "\n"
+                        parts.clear()
+                        elem.clear()
+        except (OSError, KeyError, zipfile.BadZipFile, ParseError) as e:
+            raise ValueError(f"Corrupted or invalid DOCX file: {e}") from e
+
     @property
     def supported_extensions(self) -> tuple[str, ...]:
         return (".docx",)
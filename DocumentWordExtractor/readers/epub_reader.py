@@ -0,0 +1,86 @@
+"""EPUB e-book (.epub) document reader."""
+
+import posixpath
+import zipfile
+from typing import Iterator
+from urllib.parse import unquote
+from xml.etree.ElementTree import ParseError, iterparse
+
+from readers.base_reader import BaseReader, Source, as_file
+from readers.document import Document, DocumentBuilder
+from readers.html_reader import iter_html_blocks
+
+_CONTAINER = "{urn:oasis:names:tc:opendocument:xmlns:container}"
+_OPF = "{http://www.idpf.org/2007/opf}"
+_CONTENT_TYPES = ("application/xhtml+xml", "text/html")
+
+
+def _package_path(archive: zipfile.ZipFile) -> str:
+    """Return the path of the package document named in ``META-INF/container.xml``."""
+    with archive.open("META-INF/container.xml") as xml:
+        for _, elem in iterparse(xml):
+            if elem.tag == _CONTAINER + "rootfile" and elem.get("full-path"):
+                return elem.get("full-path")
+    raise ValueError("No package document in META-INF/container.xml")
+
+
+def _spine(archive: zipfile.ZipFile, package: str) -> list[str]:
+    """Return the archive paths of the content documents in reading order."""
+    manifest: dict[str, tuple[str, str]] = {}
+    order: list[str] = []
+    with archive.open(package) as xml:
+        for _, elem in iterparse(xml):
+            if elem.tag == _OPF + "item":
+                manifest[elem.get("id", "")] = (elem.get("href", ""), elem.get("media-type", ""))
+            elif elem.tag == _OPF + "itemref" and elem.get("linear", "yes") != "no":
+                order.append(elem.get("idref", ""))
+    base = posixpath.dirname(package)
+    paths = []
+    for idref in order:
+        href, media_type = manifest.get(idref, ("", ""))
+        if href and media_type in _CONTENT_TYPES:
+            paths.append(posixpath.normpath(posixpath.join(base, unquote(href.split("#")[0]))))
+    return paths
+
+
+class EpubReader(BaseReader):
+    """Reader for EPUB 2 and 3 e-books without DRM."""
+
+    def read(self, file_path: Source) -> str:
+        """Read the text of the chapters in reading order."""
+        return self.read_document(file_path).text
+
+    def read_document(self, file_path: Source) -> Document:
+        """Read each chapter (spine document) with text as a page of paragraph blocks."""
+        builder = DocumentBuilder(block_separator="\n")
+        current, chapters = None, 0
+        for chapter, block in self._blocks(file_path):
+            if chapter != current:
+                builder.new_page()
+                current, chapters = chapter, chapters + 1
+            builder.add_block(block)
+        self.last_page_count = chapters
+        return builder.build()
+
+    def iter_text(self, file_path: Source) -> Iterator[str]:
+        """Yield paragraph texts chapter by chapter as they are parsed."""
+        for _, block in self._blocks(file_path):
+            yield block + "\n"
+
+    @staticmethod
+    def _blocks(file_path: Source) -> Iterator[tuple[int, str]]:
+        """Yield ``(chapter index, paragraph)``; one chapter is open at a time."""
+        try:
+            with zipfile.ZipFile(as_file(file_path)) as archive:
+                names = set(archive.namelist())
+                for index, path in enumerate(_spine(archive, _package_path(archive))):
+                    if path in names:
+                        with archive.open(path) as chapter:
+                            for block in iter_html_blocks(chapter):
+                                yield index, block
+        except (OSError, KeyError, ValueError, zipfile.BadZipFile, ParseError) as e:
+            raise ValueError(f"Corrupted or invalid EPUB file: {e}") from e
+
+    @property
+    def supported_extensions(self) -> tuple[str, ...]:
+        return (".epub",)
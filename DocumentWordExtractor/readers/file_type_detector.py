@@ -2,14 +2,32 @@
 
 from pathlib import Path
 
+# Extensions with a registered reader, returned as detected without sniffing
+EXTENSIONS = (".pdf", ".docx", ".txt", ".odt", ".epub", ".html", ".htm", ".xhtml", ".rtf")
+
+# Bytes of content needed by detect_bytes
+HEADER_SIZE = 128
+
 # Magic byte signatures: (bytes to check, extension)
 # PDF: %PDF
+# RTF: {\rtf
 # DOCX: PK (ZIP format - Office Open XML)
 MAGIC_SIGNATURES: list[tuple[bytes, str]] = [
     (b"%PDF", ".pdf"),
+    (b"{\\rtf", ".rtf"),
     (b"PK", ".docx"),  # DOCX is ZIP-based
 ]
 
+# ZIP-based formats whose first member is an uncompressed "mimetype" file
+# (ODF and EPUB), keyed by that file's content
+ZIP_MIMETYPES: dict[bytes, str] = {
+    b"application/vnd.oasis.opendocument.text": ".odt",
+    b"application/epub+zip": ".epub",
+}
+
+# Leading markup of HTML pages, after whitespace and a BOM, lowercased
+HTML_PREFIXES = (b"<!doctype html", b"<html", b"<?xml")
+
 
 def detect_file_type(file_path: Path) -> str | None:
     """Detect file type from extension first, then from magic bytes.
@@ -17,16 +35,37 @@ def detect_file_type(file_path: Path) -> str | None:
     Returns the detected extension (e.g. '.pdf', '.docx') or None if unknown.
     """
     suffix = file_path.suffix.lower()
-    if suffix in (".pdf", ".docx", ".txt"):
+    if suffix in EXTENSIONS:
         return suffix
 
     try:
         with open(file_path, "rb") as f:
-            header = f.read(8)
+            header = f.read(HEADER_SIZE)
     except OSError:
         return None
+    return detect_bytes(header)
 
+
+def detect_bytes(header: bytes, name: str = "") -> str | None:
+    """Detect the type of in-memory content from its name, then its first bytes.
+
+    ``header`` needs only the first ``HEADER_SIZE`` bytes. Returns the
+    extension, or None.
+    """
+    suffix = Path(name).suffix.lower()
+    if suffix in EXTENSIONS:
+        return suffix
+    if header.startswith(b"PK\x03\x04") and header[30:38] == b"mimetype":
+        # The local header's name length is at 26, extra length at 28
+        name_end = 30 + int.from_bytes(header[26:28], "little")
+        content = header[name_end + int.from_bytes(header[28:30], "little"):]
+        for mimetype, ext in ZIP_MIMETYPES.items():
+            if content.startswith(mimetype):
+                return ext
     for magic, ext in MAGIC_SIGNATURES:
         if header.startswith(magic):
             return ext
+    start = header.removeprefix(b"\xef\xbb\xbf").lstrip()[:16].lower()
+    if start.startswith(HTML_PREFIXES) and (not start.startswith(b"<?xml") or b"<html" in header.lower()):
+        return ".html"
     return None
@@ -0,0 +1,154 @@
+"""HTML (.html, .htm, .xhtml) document reader."""
+
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import BinaryIO, Iterator
+
+from readers.base_reader import BaseReader, Source, as_file
+from readers.document import Document, DocumentBuilder
+
+# Bytes decoded and parsed per step
+CHUNK_SIZE = 64 * 1024
+
+# Elements that end the current paragraph where they start and end
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "caption", "dd", "div", "dl", "dt",
+    "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6",
+    "header", "hr", "li", "main", "nav", "ol", "p", "pre", "section", "table", "td",
+    "th", "tr", "ul",
+})
+# Elements whose content is not document text
+SKIP_TAGS = frozenset({"script", "style", "template", "noscript", "title", "svg", "math"})
+
+# Stands for <br> until whitespace is collapsed
+_BREAK = "\0"
+
+_CHARSET = re.compile(
+    rb"""<meta[^>]+charset\s*=\s*["']?([\w.:-]+)|<\?xml[^>]+encoding\s*=\s*["']([\w.:-]+)""",
+    re.IGNORECASE,
+)
+_BOMS = ((codecs.BOM_UTF8, "utf-8-sig"), (codecs.BOM_UTF16_LE, "utf-16"), (codecs.BOM_UTF16_BE, "utf-16"))
+
+
+class HtmlTextParser(HTMLParser):
+    """Incremental HTML parser that collects paragraph texts.
+
+    Feed it decoded text in pieces; finished paragraphs accumulate in
+    ``blocks``, which the caller drains between feeds, so memory does not
+    grow with the document. Whitespace is collapsed as a browser would,
+    except inside ``<pre>``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.blocks: list[str] = []
+        self._parts: list[str] = []
+        self._skip = 0
+        self._pre = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP_TAGS:
+            self._skip += 1
+        elif tag == "br":
+            self._parts.append(_BREAK)
+        elif tag in BLOCK_TAGS:
+            self._flush()
+            self._pre += tag == "pre"
+
+    def handle_endtag(self, tag):
+        if tag in SKIP_TAGS:
+            self._skip = max(self._skip - 1, 0)
+        elif tag in BLOCK_TAGS:
+            self._flush()
+            if tag == "pre":
+                self._pre = max(self._pre - 1, 0)
+
+    def handle_startendtag(self, tag, attrs):
+        if tag == "br":
+            self._parts.append(_BREAK)
+        elif tag in BLOCK_TAGS:
+            self._flush()
+
+    def handle_data(self, data):
+        if not self._skip:
+            self._parts.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+    def _flush(self) -> None:
+        text = "".join(self._parts)
+        self._parts.clear()
+        if self._pre:
+            text = text.strip("\r\n").replace(_BREAK, "\n")
+        else:
+            text = "\n".join(" ".join(line.split()) for line in text.split(_BREAK))
+        if text.strip():
+            self.blocks.append(text)
+
+
+def sniff_encoding(head: bytes, default: str = "utf-8") -> str:
+    """Return the encoding named by a BOM, ``<meta charset>`` or XML declaration."""
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding
+    match = _CHARSET.search(head)
+    if match:
+        name = (match.group(1) or match.group(2)).decode("ascii")
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            pass
+    return default
+
+
+def iter_html_blocks(stream: BinaryIO) -> Iterator[str]:
+    """Yield the paragraph texts of an HTML byte stream as it is read."""
+    head = stream.read(max(CHUNK_SIZE, 4096))  # Charset declarations come early
+    decoder = codecs.getincrementaldecoder(sniff_encoding(head[:4096]))(errors="replace")
+    parser = HtmlTextParser()
+    chunk = head
+    while chunk:
+        parser.feed(decoder.decode(chunk))
+        yield from parser.blocks
+        parser.blocks.clear()
+        chunk = stream.read(CHUNK_SIZE)
+    parser.feed(decoder.decode(b"", final=True))
+    parser.close()
+    yield from parser.blocks
+
+
+class HtmlReader(BaseReader):
+    """Reader for HTML and XHTML pages."""
+
+    def read(self, file_path: Source) -> str:
+        """Read the visible text of the page."""
+        return self.read_document(file_path).text
+
+    def read_document(self, file_path: Source) -> Document:
+        """Read paragraphs, headings, list items and cells as blocks of one page."""
+        builder = DocumentBuilder(block_separator="\n")
+        for block in self._blocks(file_path):
+            builder.add_block(block)
+        return builder.build()
+
+    def iter_text(self, file_path: Source) -> Iterator[str]:
+        """Yield the paragraphs as the page is parsed."""
+        for block in self._blocks(file_path):
+            yield block + "\n"
+
+    @staticmethod
+    def _blocks(file_path: Source) -> Iterator[str]:
+        source = as_file(file_path)
+        try:
+            stream = source if hasattr(source, "read") else open(source, "rb")
+            with stream:
+                yield from iter_html_blocks(stream)
+        except OSError as e:
+            raise ValueError(f"Cannot read file: {e}") from e
+
+    @property
+    def supported_extensions(self) -> tuple[str, ...]:
+        return (".html", ".htm", ".xhtml")
@@ -1,32 +1,163 @@
 """PDF document reader using PyMuPDF."""
 
-from pathlib import Path
+from array import array
+from dataclasses import dataclass, field
+from typing import Iterator
 
-from readers.base_reader import BaseReader
+from readers.base_reader import BaseReader, Source
+from readers.document import Document, DocumentBuilder
+
+SOFT_HYPHEN = "\u00ad"
+
+
+@dataclass
+class PdfWords:
+    """Words of a PDF in reading order with the page and box of each.
+
+    ``boxes`` holds four floats (x0, y0, x1, y1) per word. A PyMuPDF word
+    split into several words (e.g. "long-term") gives each part the box of
+    the whole token; a word joined across a line-break hyphen keeps the box
+    of its first half.
+    """
+
+    words: list[str] = field(default_factory=list)
+    pages: array = field(default_factory=lambda: array("I"))
+    boxes: array = field(default_factory=lambda: array("f"))
+    page_count: int = 0
+    skipped_pages: list[int] = field(default_factory=list)
+
+    def bbox(self, index: int) -> tuple[float, float, float, float]:
+        return tuple(self.boxes[4 * index:4 * index + 4])
 
 
 class PdfReader(BaseReader):
     """Reader for PDF files using PyMuPDF (fitz)."""
 
-    def read(self, file_path: Path) -> str:
-        """Read PDF content and return extracted text."""
+    @staticmethod
+    def _open(file_path: Source):
         try:
             import fitz  # PyMuPDF
         except ImportError as e:
             raise RuntimeError("PyMuPDF is not installed. Install with: pip install PyMuPDF") from e
 
         try:
-            doc = fitz.open(file_path)
+            if isinstance(file_path, (bytes, bytearray, memoryview)):
+                return fitz.open(stream=file_path, filetype="pdf")
+            return fitz.open(file_path)
         except fitz.FileDataError as e:
             raise ValueError(f"Corrupted or invalid PDF file: {e}") from e
         except Exception as e:
             raise ValueError(f"Cannot open PDF file: {e}") from e
 
+    def read(self, file_path: Source) -> str:
+        """Read PDF content and return extracted text."""
+        return self.read_document(file_path).text
+
+    def read_document(self, file_path: Source) -> Document:
+        """Read pages with PyMuPDF's text blocks and their boxes.
+
+        The text blocks of a page concatenate to exactly ``page.get_text()``,
+        so the text is the same as the plain page-by-page extraction.
+        """
+        doc = self._open(file_path)
+        try:
+            self.last_page_count = doc.page_count
+            builder = DocumentBuilder(page_separator="\n\n")
+            for page in doc:
+                builder.new_page()
+                for x0, y0, x1, y1, text, _, kind in page.get_text("blocks", sort=False):
+                    if kind == 0:  # Skip image blocks
+                        builder.add_block(text, (x0, y0, x1, y1))
+            return builder.build(strip=True)
+        finally:
+            doc.close()
+
+    def iter_text(self, file_path: Source) -> Iterator[str]:
+        """Yield the plain text of each page that has a text layer."""
+        doc = self._open(file_path)
         try:
-            text_parts: list[str] = []
+            self.last_page_count = doc.page_count
             for page in doc:
-                text_parts.append(page.get_text())
-            return "\n\n".join(text_parts).strip()
+                if page.get_fonts():
+                    yield page.get_text()
+        finally:
+            doc.close()
+
+    def read_text(
+        self, file_path: Source, page_range: tuple[int, int] | None = None
+    ) -> tuple[str, list[int]]:
+        """Read the plain text of a ``[start, stop)`` page range.
+
+        Returns the text of the pages that have a text layer, separated by
+        blank lines, and the numbers of the pages skipped for having none.
+        Faster than ``read_words``: the word stream costs MuPDF more than
+        the text the word pattern is run over.
+        """
+        doc = self._open(file_path)
+        try:
+            self.last_page_count = doc.page_count
+            start, stop = page_range if page_range is not None else (0, doc.page_count)
+            texts, skipped = [], []
+            for page in doc.pages(start, min(stop, doc.page_count)):
+                if page.get_fonts():
+                    texts.append(page.get_text())
+                else:
+                    skipped.append(page.number)
+            return "\n\n".join(texts), skipped
+        finally:
+            doc.close()
+
+    def read_words(self, file_path: Source, page_range: tuple[int, int] | None = None) -> PdfWords:
+        """Read words straight from PyMuPDF's word stream.
+
+        Skips the full-text pass and the regex over it: each distinct
+        PyMuPDF token is cleaned with the word pattern once. Pages without
+        fonts have no text layer (e.g. scans) and are skipped unread. A
+        word ending in "-" at the end of a line is joined with the first
+        word of the next line when that continues in lowercase. MuPDF's
+        word segmentation makes this about 20% slower than ``read_text``;
+        in return every word has its page and box.
+
+        ``page_range`` limits reading to the ``[start, stop)`` page range.
+        Words are never joined across pages, so the ranges of a split
+        document together give exactly the words of the whole.
+        """
+        from processors.word_extractor import WordExtractor
+
+        find_words = WordExtractor.WORD_PATTERN.findall
+        cleaned: dict[str, list[str]] = {}
+        result = PdfWords()
+        words, pages, boxes = result.words, result.pages, result.boxes
+
+        doc = self._open(file_path)
+        try:
+            result.page_count = self.last_page_count = doc.page_count
+            start, stop = page_range if page_range is not None else (0, doc.page_count)
+            for page in doc.pages(start, min(stop, doc.page_count)):
+                if not page.get_fonts():
+                    result.skipped_pages.append(page.number)
+                    continue
+                tokens = page.get_text("words", sort=False)
+                pending = None  # Hyphenated first half awaiting its line's end
+                for i, (x0, y0, x1, y1, token, block, line, _) in enumerate(tokens):
+                    if pending is not None:
+                        token = pending[0] + token
+                        x0, y0, x1, y1 = pending[1]
+                        pending = None
+                    token = token.replace(SOFT_HYPHEN, "")
+                    if token.endswith("-") and i + 1 < len(tokens):
+                        following = tokens[i + 1]
+                        if (following[5], following[6]) != (block, line) and following[4][:1].islower():
+                            pending = (token[:-1], (x0, y0, x1, y1))
+                            continue
+                    parts = cleaned.get(token)
+                    if parts is None:
+                        parts = cleaned[token] = find_words(token)
+                    for part in parts:
+                        words.append(part)
+                        pages.append(page.number)
+                        boxes.extend((x0, y0, x1, y1))
+            return result
         finally:
             doc.close()
 
@@ -0,0 +1,277 @@
+"""Rich Text Format (.rtf) document reader."""
+
+import codecs
+import re
+from typing import BinaryIO, Iterator
+
+from readers.base_reader import BaseReader, Source, as_file
+from readers.document import Document, DocumentBuilder
+
+# Bytes tokenized per step
+CHUNK_SIZE = 64 * 1024
+
+_TOKEN = re.compile(
+    rb"\\([a-zA-Z]{1,32})(-?\d{1,10})? ?"  # Control word with optional parameter
+    rb"|\\'([0-9a-fA-F]{2})"  # Byte in the current code page
+    rb"|\\([^a-zA-Z'])"  # Control symbol
+    rb"|([{}])"  # Group start or end
+    rb"|[\r\n]+"  # Line breaks in the file are not text
+    rb"|([^\\{}\r\n]+)"  # Text
+)
+# What may still follow a control word without a parameter: "\u-" can be
+# the start of "\u-10179"
+_PARAMETER_START = re.compile(rb"-?\d*")
+
+# Destinations whose content is not document text
+_SKIP = frozenset({
+    "annotation", "author", "background", "bkmkend", "bkmkstart", "colortbl", "datastore",
+    "do", "fldinst", "fonttbl", "footer", "footerf", "footerl", "footerr", "footnote",
+    "generator", "header", "headerf", "headerl", "headerr", "info", "latentstyles",
+    "listoverridetable", "listtable", "mmathPr", "object", "pgdsctbl", "pict", "revtbl",
+    "rsidtbl", "stylesheet", "themedata", "colorschememapping", "xmlnstbl", "filetbl",
+})
+_BREAKS = frozenset({"par", "sect", "page", "row"})
+_CHARACTERS = {
+    "line": "\n", "tab": "\t", "cell": "\t", "emdash": "\u2014", "endash": "\u2013",
+    "bullet": "\u2022", "lquote": "\u2018", "rquote": "\u2019", "ldblquote": "\u201c",
+    "rdblquote": "\u201d", "emspace": " ", "enspace": " ", "qmspace": " ",
+}
+_SYMBOLS = {b"~": "\u00a0", b"_": "\u2011", b"\\": "\\", b"{": "{", b"}": "}", b"\t": "\t"}
+# \fcharset values to code pages
+_CHARSETS = {
+    0: "cp1252", 77: "mac-roman", 128: "cp932", 129: "cp949", 134: "cp936", 136: "cp950",
+    161: "cp1253", 162: "cp1254", 163: "cp1258", 177: "cp1255", 178: "cp1256",
+    186: "cp1257", 204: "cp1251", 222: "cp874", 238: "cp1250",
+}
+_SURROGATES = re.compile("[\ud800-\udfff]")
+
+
+def _codepage(number: int) -> str:
+    name = {65001: "utf-8", 10000: "mac-roman", 437: "cp437", 850: "cp850"}.get(number, f"cp{number}")
+    try:
+        return codecs.lookup(name).name
+    except LookupError:
+        return "cp1252"
+
+
+class _Group:
+    """Formatting state that a group inherits and restores on exit."""
+
+    __slots__ = ("skip", "uc", "codepage")
+
+    def __init__(self, skip: bool = False, uc: int = 1, codepage: str = "cp1252") -> None:
+        self.skip = skip
+        self.uc = uc
+        self.codepage = codepage
+
+    def copy(self) -> "_Group":
+        return _Group(self.skip, self.uc, self.codepage)
+
+
+class RtfParser:
+    """Tokenizing RTF parser that collects paragraph texts.
+
+    ``feed`` takes raw bytes in pieces and returns how many it consumed;
+    the rest (a token cut at the end of the piece) must be fed again with
+    the next one. Finished paragraphs accumulate in ``paragraphs``, which
+    the caller drains between feeds.
+    """
+
+    def __init__(self) -> None:
+        self.paragraphs: list[str] = []
+        self._parts: list[str] = []
+        self._bytes = bytearray()  # Text bytes not yet decoded
+        self._state = _Group()
+        self._stack: list[_Group] = []
+        self._default_codepage = "cp1252"
+        self._font_codepages: dict[int, str] = {}
+        self._font: int | None = None
+        self._in_fonttbl = 0  # Depth of the font table group, 0 outside it
+        self._fallback = 0  # Characters of a \u fallback still to skip
+        self._binary = 0  # Bytes of \bin data still to skip
+
+    def feed(self, data: bytes, final: bool = False) -> int:
+        pos, end = 0, len(data)
+        while pos < end:
+            if self._binary:
+                taken = min(self._binary, end - pos)
+                self._binary -= taken
+                pos += taken
+                continue
+            match = _TOKEN.match(data, pos)
+            if match is None:
+                if not final and end - pos < 64:
+                    break  # A lone backslash; wait for what follows
+                pos += 1
+                continue
+            text = match.group(6)
+            if text is None and not final and (
+                match.end() == end
+                or match.group(1) is not None and match.group(2) is None
+                and data[match.end() - 1] != 0x20
+                and _PARAMETER_START.fullmatch(data, match.end(), end)
+            ):
+                break  # The token may continue in the next piece
+            pos = match.end()
+            if text is not None:
+                self._text(text)
+            elif match.group(1) is not None:
+                self._control(match.group(1).decode("ascii"), match.group(2))
+            elif match.group(3) is not None:
+                if self._fallback:
+                    self._fallback -= 1
+                elif not self._state.skip:
+                    self._bytes.append(int(match.group(3), 16))
+            elif match.group(5) is not None:
+                self._group(match.group(5) == b"{")
+            elif match.group(4) is not None:
+                self._symbol(match.group(4))
+        return pos
+
+    def close(self) -> None:
+        self._end_paragraph()
+
+    def _text(self, text: bytes) -> None:
+        if self._fallback:
+            skipped = min(self._fallback, len(text))
+            self._fallback -= skipped
+            text = text[skipped:]
+        if not self._state.skip:
+            self._bytes += text
+
+    def _decode(self) -> None:
+        if self._bytes:
+            self._parts.append(self._bytes.decode(self._state.codepage, errors="replace"))
+            self._bytes.clear()
+
+    def _end_paragraph(self) -> None:
+        self._decode()
+        text = "".join(self._parts)
+        self._parts.clear()
+        if _SURROGATES.search(text):
+            # Characters outside the BMP arrive as \u surrogate pairs
+            text = text.encode("utf-16-le", "surrogatepass").decode("utf-16-le", "replace")
+        if text.strip():
+            self.paragraphs.append(text)
+
+    def _group(self, start: bool) -> None:
+        self._decode()
+        self._fallback = 0
+        if start:
+            self._stack.append(self._state.copy())
+            if self._in_fonttbl:
+                self._in_fonttbl += 1
+        elif self._stack:
+            self._state = self._stack.pop()
+            if self._in_fonttbl:
+                self._in_fonttbl -= 1
+
+    def _symbol(self, symbol: bytes) -> None:
+        if self._fallback:
+            self._fallback -= 1
+            return
+        if symbol == b"*":
+            self._state.skip = True  # Ignorable destination
+        elif symbol in (b"\n", b"\r"):
+            if not self._state.skip:
+                self._end_paragraph()
+        elif symbol in _SYMBOLS and not self._state.skip:
+            self._decode()
+            self._parts.append(_SYMBOLS[symbol])
+
+    def _control(self, word: str, param: bytes | None) -> None:
+        value = int(param) if param is not None else None
+        if word == "bin":
+            self._binary = value or 0
+            return
+        if self._in_fonttbl:
+            if word == "f":
+                self._font = value
+            elif word == "fcharset" and self._font is not None and value in _CHARSETS:
+                self._font_codepages[self._font] = _CHARSETS[value]
+            elif word == "cpg" and self._font is not None and value:
+                self._font_codepages[self._font] = _codepage(value)
+            return
+        if word in _SKIP:
+            self._decode()
+            self._state.skip = True
+            if word == "fonttbl":
+                self._in_fonttbl = 1
+            return
+        if word == "ansicpg" and value:
+            self._default_codepage = self._state.codepage = _codepage(value)
+        elif word in ("mac", "pc", "pca"):
+            self._default_codepage = self._state.codepage = _codepage(
+                {"mac": 10000, "pc": 437, "pca": 850}[word]
+            )
+        elif word == "f" and value is not None:
+            self._decode()
+            self._state.codepage = self._font_codepages.get(value, self._default_codepage)
+        elif word == "uc" and value is not None:
+            self._state.uc = max(value, 0)
+        elif word == "u" and value is not None:
+            if not self._state.skip:
+                self._decode()
+                self._parts.append(chr(value + 65536 if value < 0 else value))
+            self._fallback = self._state.uc
+        elif self._state.skip:
+            return
+        elif word in _BREAKS:
+            self._end_paragraph()
+        elif word in _CHARACTERS:
+            self._decode()
+            self._parts.append(_CHARACTERS[word])
+
+
+def iter_rtf_paragraphs(stream: BinaryIO) -> Iterator[str]:
+    """Yield the paragraph texts of an RTF byte stream as it is read."""
+    parser = RtfParser()
+    pending = b""
+    while True:
+        chunk = stream.read(CHUNK_SIZE)
+        data = pending + chunk
+        used = parser.feed(data, final=not chunk)
+        pending = data[used:]
+        yield from parser.paragraphs
+        parser.paragraphs.clear()
+        if not chunk:
+            break
+    parser.close()
+    yield from parser.paragraphs
+
+
+class RtfReader(BaseReader):
+    """Reader for Rich Text Format documents (WordPad, Word, TextEdit)."""
+
+    def read(self, file_path: Source) -> str:
+        """Read the document text without formatting."""
+        return self.read_document(file_path).text
+
+    def read_document(self, file_path: Source) -> Document:
+        """Read the paragraphs as blocks of a single page."""
+        builder = DocumentBuilder(block_separator="\n")
+        for paragraph in self._paragraphs(file_path):
+            builder.add_block(paragraph)
+        return builder.build()
+
+    def iter_text(self, file_path: Source) -> Iterator[str]:
+        """Yield paragraph texts as the file is tokenized."""
+        for paragraph in self._paragraphs(file_path):
+            yield paragraph + "\n"
+
+    @staticmethod
+    def _paragraphs(file_path: Source) -> Iterator[str]:
+        source = as_file(file_path)
+        try:
+            stream = source if hasattr(source, "read") else open(source, "rb")
+            with stream:
+                if stream.read(5) != b"{\\rtf":
+                    raise ValueError("Missing {\\rtf header")
+                stream.seek(0)
+                yield from iter_rtf_paragraphs(stream)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Corrupted or invalid RTF file: {e}") from e
+
+    @property
+    def supported_extensions(self) -> tuple[str, ...]:
+        return (".rtf",)
@@ -1,21 +1,54 @@
 """Plain text and basic document reader."""
 
-from pathlib import Path
+import io
+from typing import Iterator, TextIO
 
-from readers.base_reader import BaseReader
+from readers.base_reader import BaseReader, Source
+from readers.document import Document
+
+# Characters per piece yielded by iter_text
+CHUNK_SIZE = 64 * 1024
 
 
 class TextReader(BaseReader):
     """Reader for plain text files (.txt) and fallback for other formats."""
 
-    def read(self, file_path: Path) -> str:
+    @staticmethod
+    def _open(file_path: Source) -> TextIO:
+        if isinstance(file_path, (bytes, bytearray, memoryview)):
+            return io.TextIOWrapper(io.BytesIO(file_path), encoding="utf-8", errors="replace")
+        return open(file_path, encoding="utf-8", errors="replace")
+
+    def read(self, file_path: Source) -> str:
         """Read plain text file content."""
         try:
-            with open(file_path, encoding="utf-8", errors="replace") as f:
+            with self._open(file_path) as f:
                 return f.read()
         except OSError as e:
             raise ValueError(f"Cannot read file: {e}") from e
 
+    def read_document(self, file_path: Source) -> Document:
+        """Read the file as one page whose blocks are its paragraphs."""
+        return Document.from_text(self.read(file_path))
+
+    def iter_text(self, file_path: Source) -> Iterator[str]:
+        """Yield the file in chunks that end on whitespace, so no word is split."""
+        try:
+            with self._open(file_path) as f:
+                carry = ""
+                for chunk in iter(lambda: f.read(CHUNK_SIZE), ""):
+                    chunk = carry + chunk
+                    cut = max(chunk.rfind(" "), chunk.rfind("\n")) + 1
+                    if cut:
+                        carry = chunk[cut:]
+                        yield chunk[:cut]
+                    else:
+                        carry = chunk
+                if carry:
+                    yield carry
+        except OSError as e:
+            raise ValueError(f"Cannot read file: {e}") from e
+
     @property
     def supported_extensions(self) -> tuple[str, ...]:
         return (".txt",)
@@ -0,0 +1 @@
+"""Headless service modes (HTTP server, watch daemon)."""
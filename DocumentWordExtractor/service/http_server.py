@@ -0,0 +1,390 @@
+"""Asyncio HTTP extraction service backed by a process pool.
+
+Endpoints:
+    GET  /health    Service status and queue depth.
+    POST /extract   Raw document bytes (name via ``?name=`` or the
+                    ``X-Filename`` header), or a JSON body
+                    ``{"path": ...}`` / ``{"paths": [...]}``.
+
+The event loop only parses HTTP and streams uploads to temporary files;
+reading and tokenization run in an ``IsolatedWorkerPool`` under the
+``timeout`` and ``memory_limit_mb`` limits, so a document that hangs or
+exhausts memory fails on its own without stalling or breaking the pool.
+Jobs arriving within a short window are sent to a worker together in one
+batch; a batch that breaks a limit is retried one document at a time, so
+only the offending upload fails. When
+more than ``max_queue`` documents are waiting the server answers 429.
+Large results are sent with chunked transfer encoding.
+"""
+
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+from pipeline.extraction import extract_batch
+from pipeline.isolation import DEFAULT_MEMORY_LIMIT_MB, DEFAULT_TIMEOUT, IsolatedWorkerPool, WorkerLimitError
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    411: "Length Required",
+    413: "Payload Too Large",
+    415: "Unsupported Media Type",
+    422: "Unprocessable Entity",
+    429: "Too Many Requests",
+    500: "Internal Server Error",
+}
+
+# Word lists longer than this are streamed in chunks
+STREAM_THRESHOLD = 5000
+STREAM_CHUNK_WORDS = 2000
+
+
+class HttpError(Exception):
+    """Error that maps directly to an HTTP status response."""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class _Batcher:
+    """Groups extraction jobs into batches for the process pool."""
+
+    def __init__(self, executor: Executor, batch_size: int, window: float):
+        self._executor = executor
+        self._batch_size = batch_size
+        self._window = window
+        self._items: list[tuple[tuple[str, str | None], asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+
+    def submit(self, path: str, name: str | None) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._items.append(((path, name), future))
+        if len(self._items) >= self._batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        items, self._items = self._items, []
+        if items:
+            self._run(items)
+
+    def _run(self, items: list[tuple[tuple[str, str | None], asyncio.Future]]) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            batch = loop.run_in_executor(self._executor, extract_batch, [i for i, _ in items])
+        except Exception as e:  # The pool is shut down or broken
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        def deliver(done: asyncio.Future) -> None:
+            try:
+                results = done.result()
+            except WorkerLimitError as e:
+                if len(items) > 1:
+                    # Find the document that broke the limit; the others succeed
+                    for item in items:
+                        self._run([item])
+                    return
+                (path, name), future = items[0]
+                if not future.done():
+                    future.set_result({"name": name or Path(path).name, "error": str(e), "status": 422})
+                return
+            except Exception as e:
+                for _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            for (_, future), result in zip(items, results):
+                if not future.done():
+                    future.set_result(result)
+
+        batch.add_done_callback(deliver)
+
+
+class ExtractionServer:
+    """HTTP front end dispatching extraction to a bounded process pool.
+
+    ``timeout`` (seconds) and ``memory_limit_mb`` limit each job in the
+    worker processes; None disables either.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+        workers: int | None = None,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        memory_limit_mb: int | None = DEFAULT_MEMORY_LIMIT_MB,
+        max_queue: int = 64,
+        batch_size: int = 8,
+        batch_window: float = 0.01,
+        max_upload: int = 256 * 1024 * 1024,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.workers = workers or os.cpu_count() or 2
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_upload = max_upload
+        self._pending = 0
+        self._executor: IsolatedWorkerPool | None = None
+        self._batcher: _Batcher | None = None
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        """Start the process pool and begin listening."""
+        # Forked workers would inherit the sockets of open connections and
+        # keep them open after the server closes them
+        methods = multiprocessing.get_all_start_methods()
+        context = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+        self._executor = IsolatedWorkerPool(
+            self.workers, self.timeout, self.memory_limit_mb, mp_context=context
+        )
+        self._batcher = _Batcher(self._executor, self.batch_size, self.batch_window)
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # Report the real port when started with port 0
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        """Serve until cancelled, starting the server if needed."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    # -- connection handling --------------------------------------------
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            keep_alive = True
+            while keep_alive:
+                try:
+                    request_line = await reader.readline()
+                except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+                    break
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    await self._send_json(writer, 400, {"error": "Malformed request line"}, False)
+                    break
+                headers = await self._read_headers(reader)
+                keep_alive = (
+                    version == "HTTP/1.1"
+                    and headers.get("connection", "").lower() != "close"
+                )
+                try:
+                    await self._route(method, target, headers, reader, writer, keep_alive)
+                except HttpError as e:
+                    # The body may be unread; do not reuse the connection
+                    keep_alive = False
+                    await self._send_json(writer, e.status, {"error": str(e)}, False)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    raise
+                except Exception as e:  # E.g. a broken worker pool
+                    keep_alive = False
+                    await self._send_json(writer, 500, {"error": f"{type(e).__name__}: {e}"}, False)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    @staticmethod
+    async def _read_headers(reader: asyncio.StreamReader) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                return headers
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+    async def _route(self, method, target, headers, reader, writer, keep_alive) -> None:
+        url = urlsplit(target)
+        if url.path == "/health":
+            if method != "GET":
+                raise HttpError(405, "Use GET")
+            await self._send_json(writer, 200, {
+                "status": "ok",
+                "workers": self.workers,
+                "pending": self._pending,
+                "max_queue": self.max_queue,
+            }, keep_alive)
+        elif url.path == "/extract":
+            if method != "POST":
+                raise HttpError(405, "Use POST")
+            await self._extract(url, headers, reader, writer, keep_alive)
+        else:
+            raise HttpError(404, f"No route for {url.path}")
+
+    async def _extract(self, url, headers, reader, writer, keep_alive) -> None:
+        if "transfer-encoding" in headers or "content-length" not in headers:
+            raise HttpError(411, "Send the body with a Content-Length; chunked uploads are not supported")
+        length = headers["content-length"]
+        if not (length.isascii() and length.isdigit()):
+            raise HttpError(400, "Invalid Content-Length")
+        length = int(length)
+        if length > self.max_upload:
+            raise HttpError(413, f"Upload exceeds {self.max_upload} bytes")
+        params = parse_qs(url.query)
+        temp_files: list[str] = []
+        try:
+            if headers.get("content-type", "").startswith("application/json"):
+                body = await reader.readexactly(length)
+                items, multiple = self._parse_path_request(body)
+            else:
+                name = params.get("name", [headers.get("x-filename", "")])[0]
+                if not name:
+                    raise HttpError(400, "Name the upload with ?name= or X-Filename")
+                if self._pending >= self.max_queue:
+                    # Refuse before accepting the upload body
+                    raise HttpError(429, "Extraction queue is full, retry later")
+                fd, upload = tempfile.mkstemp(prefix="dwe-upload-", suffix=Path(name).suffix)
+                temp_files.append(upload)
+                await self._receive_upload(reader, length, fd)
+                items, multiple = [(upload, Path(name).name)], False
+
+            if self._pending + len(items) > self.max_queue:
+                raise HttpError(429, "Extraction queue is full, retry later")
+            self._pending += len(items)
+            try:
+                futures = [self._batcher.submit(path, name) for path, name in items]
+                results = await asyncio.gather(*futures)
+            finally:
+                self._pending -= len(items)
+        finally:
+            for path in temp_files:
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+
+        if multiple:
+            await self._send_results(writer, 200, {"results": results}, keep_alive)
+        else:
+            result = results[0]
+            if temp_files:
+                result.pop("path", None)  # Temporary upload location is meaningless
+                if "error" in result:
+                    result["error"] = result["error"].replace(temp_files[0], result["name"])
+            status = result.pop("status", 200) if "error" in result else 200
+            await self._send_results(writer, status, result, keep_alive)
+
+    @staticmethod
+    def _parse_path_request(body: bytes) -> tuple[list[tuple[str, None]], bool]:
+        try:
+            payload = json.loads(body)
+        except ValueError:
+            raise HttpError(400, "Invalid JSON body")
+        if isinstance(payload, dict) and isinstance(payload.get("path"), str):
+            return [(payload["path"], None)], False
+        if isinstance(payload, dict) and isinstance(payload.get("paths"), list):
+            return [(str(p), None) for p in payload["paths"]], True
+        raise HttpError(400, 'Expected {"path": ...} or {"paths": [...]}')
+
+    async def _receive_upload(self, reader: asyncio.StreamReader, length: int, fd: int) -> None:
+        """Stream the request body into an open temporary file, closing it."""
+        with os.fdopen(fd, "wb") as f:
+            remaining = length
+            while remaining:
+                chunk = await reader.read(min(remaining, 1024 * 1024))
+                if not chunk:
+                    raise HttpError(400, "Upload ended early")
+                f.write(chunk)
+                remaining -= len(chunk)
+
+    # -- responses -------------------------------------------------------
+
+    @staticmethod
+    def _head(status: int, extra: dict[str, str], keep_alive: bool) -> bytes:
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}"]
+        headers = {"Content-Type": "application/json; charset=utf-8", **extra}
+        headers["Connection"] = "keep-alive" if keep_alive else "close"
+        lines += [f"{k}: {v}" for k, v in headers.items()]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+    async def _send_json(self, writer, status: int, payload: Any, keep_alive: bool) -> None:
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        extra = {"Content-Length": str(len(body))}
+        if status == 429:
+            extra["Retry-After"] = "1"
+        writer.write(self._head(status, extra, keep_alive) + body)
+        await writer.drain()
+
+    async def _send_results(self, writer, status: int, payload: dict, keep_alive: bool) -> None:
+        """Send a result, streaming word lists that are too large to buffer."""
+        results = payload["results"] if "results" in payload else [payload]
+        if sum(len(r.get("words", ())) for r in results) <= STREAM_THRESHOLD:
+            await self._send_json(writer, status, payload, keep_alive)
+            return
+
+        writer.write(self._head(status, {"Transfer-Encoding": "chunked"}, keep_alive))
+
+        async def chunk(text: str) -> None:
+            data = text.encode("utf-8")
+            writer.write(f"{len(data):x}\r\n".encode("latin-1") + data + b"\r\n")
+            await writer.drain()
+
+        multiple = "results" in payload
+        if multiple:
+            await chunk('{"results": [')
+        for n, result in enumerate(results):
+            words = result.get("words", [])
+            meta = {k: v for k, v in result.items() if k != "words"}
+            # Emit metadata first, then the word array in slices
+            head = json.dumps(meta, ensure_ascii=False)[:-1] + (", " if meta else "")
+            await chunk(("," if n else "") + head + '"words": [')
+            for i in range(0, len(words), STREAM_CHUNK_WORDS):
+                part = json.dumps(words[i:i + STREAM_CHUNK_WORDS], ensure_ascii=False)[1:-1]
+                await chunk(("," if i else "") + part)
+            await chunk("]}")
+        if multiple:
+            await chunk("]}")
+        writer.write(b"0\r\n\r\n")
+        await writer.drain()
+
+
+def run_server(**options) -> None:
+    """Run the extraction service until interrupted."""
+    server = ExtractionServer(**options)
+
+    async def main() -> None:
+        await server.start()
+        print(f"Serving on http://{server.host}:{server.port}", flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,268 @@
+"""Watch-folder daemon that extracts new or changed documents.
+
+Folders are watched with inotify on Linux and by periodic scanning
+elsewhere. A file is only processed once its size and mtime have stayed
+the same for ``settle`` seconds, so files that are still being written
+are skipped. Each result is appended to a JSON lines corpus. The content
+fingerprint of every processed file is appended to a state file, so a
+restart skips anything already done, including the backlog found on the
+first scan.
+"""
+
+import ctypes
+import ctypes.util
+import json
+import os
+import select
+import struct
+import sys
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Iterable
+
+from pipeline.extraction import extract_batch
+from pipeline.isolation import DEFAULT_MEMORY_LIMIT_MB, DEFAULT_TIMEOUT, IsolatedWorkerPool
+from readers.document_factory import DocumentFactory
+from utils.fingerprint import fingerprint_file, stat_signature
+
+
+class PollingWatcher:
+    """Reports files whose size or mtime changed since the previous scan."""
+
+    def __init__(self, folders: list[Path], interval: float = 2.0) -> None:
+        self._folders = folders
+        self._interval = interval
+        self._seen: dict[Path, tuple[int, int]] = {}
+
+    def scan(self) -> list[Path]:
+        changed = []
+        for folder in self._folders:
+            try:
+                entries = list(os.scandir(folder))
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                path = Path(entry.path)
+                st = entry.stat()
+                signature = (st.st_size, st.st_mtime_ns)
+                if self._seen.get(path) != signature:
+                    self._seen[path] = signature
+                    changed.append(path)
+        return changed
+
+    def wait(self, timeout: float) -> list[Path]:
+        time.sleep(min(timeout, self._interval))
+        return self.scan()
+
+    def close(self) -> None:
+        pass
+
+
+class InotifyWatcher:
+    """Linux inotify watcher reporting files written, created or moved in."""
+
+    IN_MODIFY = 0x00000002
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_NONBLOCK = 0o4000
+    _EVENT = struct.Struct("iIII")
+
+    def __init__(self, folders: list[Path]) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if sys.platform != "linux" or not libc_name:
+            raise OSError("inotify is only available on Linux")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._dirs: dict[int, Path] = {}
+        mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+        for folder in folders:
+            wd = self._libc.inotify_add_watch(self._fd, os.fsencode(folder), mask)
+            if wd < 0:
+                self.close()
+                raise OSError(ctypes.get_errno(), f"Cannot watch {folder}")
+            self._dirs[wd] = folder
+        self._folders = folders
+
+    def scan(self) -> list[Path]:
+        """List existing files once (inotify only reports later changes)."""
+        return PollingWatcher(self._folders).scan()
+
+    def wait(self, timeout: float) -> list[Path]:
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return []
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return []
+        changed = []
+        pos = 0
+        while pos + self._EVENT.size <= len(data):
+            wd, _mask, _cookie, length = self._EVENT.unpack_from(data, pos)
+            pos += self._EVENT.size
+            name = data[pos:pos + length].rstrip(b"\0")
+            pos += length
+            folder = self._dirs.get(wd)
+            if folder is not None and name:
+                changed.append(folder / os.fsdecode(name))
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class ProcessedState:
+    """Append-only record of processed content fingerprints."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.fingerprints: set[str] = set()
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        self.fingerprints.add(json.loads(line)["fingerprint"])
+                    except (ValueError, KeyError, TypeError):
+                        continue  # Torn last line after a crash
+        except FileNotFoundError:
+            pass
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return fingerprint in self.fingerprints
+
+    def add(self, fingerprint: str, file_path: Path) -> None:
+        self.fingerprints.add(fingerprint)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({
+                "fingerprint": fingerprint,
+                "path": str(file_path),
+                "processed_at": time.time(),
+            }) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+class WatchDaemon:
+    """Watches folders and extracts settled, unseen documents.
+
+    Documents are extracted in isolated worker processes, so one that
+    hangs past ``timeout`` seconds or exceeds ``memory_limit_mb`` is
+    recorded as failed without stopping the daemon.
+    """
+
+    def __init__(
+        self,
+        folders: Iterable[Path],
+        output: Path,
+        state: Path,
+        settle: float = 2.0,
+        poll_interval: float = 2.0,
+        force_polling: bool = False,
+        workers: int | None = None,
+        timeout: float | None = DEFAULT_TIMEOUT,
+        memory_limit_mb: int | None = DEFAULT_MEMORY_LIMIT_MB,
+    ) -> None:
+        self.folders = [Path(f) for f in folders]
+        self.output = output
+        self.state = ProcessedState(state)
+        self.settle = settle
+        self.workers = workers or os.cpu_count() or 2
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._extensions = set(DocumentFactory.supported_extensions())
+        self._candidates: dict[Path, tuple[tuple[int, int], float]] = {}
+        self._running: dict[Future, tuple[Path, str]] = {}
+        self.watcher = None
+        if not force_polling:
+            try:
+                self.watcher = InotifyWatcher(self.folders)
+            except OSError:
+                self.watcher = None
+        if self.watcher is None:
+            self.watcher = PollingWatcher(self.folders, poll_interval)
+
+    def _note(self, paths: Iterable[Path]) -> None:
+        """Start (or restart) the settle timer of changed files."""
+        now = time.monotonic()
+        for path in paths:
+            if path.suffix.lower() not in self._extensions:
+                continue
+            signature = stat_signature(path)
+            if signature is None:
+                self._candidates.pop(path, None)
+                continue
+            previous = self._candidates.get(path)
+            if previous is None or previous[0] != signature:
+                self._candidates[path] = (signature, now)
+
+    def _settled(self) -> list[Path]:
+        """Return candidates unchanged for ``settle`` seconds."""
+        now = time.monotonic()
+        ready = []
+        for path, (signature, since) in list(self._candidates.items()):
+            current = stat_signature(path)
+            if current is None:
+                del self._candidates[path]
+            elif current != signature:
+                self._candidates[path] = (current, now)
+            elif now - since >= self.settle:
+                del self._candidates[path]
+                ready.append(path)
+        return ready
+
+    def _write_result(self, result: dict, file_path: Path, fingerprint: str) -> None:
+        result = dict(result, fingerprint=fingerprint, source=str(file_path))
+        with open(self.output, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        # Record only after the output is durable: a crash in between
+        # reprocesses the file instead of losing it
+        self.state.add(fingerprint, file_path)
+
+    def _collect(self, block: bool = False) -> None:
+        for future in list(self._running):
+            if not (block or future.done()):
+                continue
+            file_path, fingerprint = self._running.pop(future)
+            try:
+                (result,) = future.result()
+            except Exception as e:
+                result = {"name": file_path.name, "error": str(e)}
+            self._write_result(result, file_path, fingerprint)
+            print(f"{'failed' if 'error' in result else 'extracted'}: {file_path}", flush=True)
+
+    def run(self, max_cycles: int | None = None) -> None:
+        """Watch until interrupted (or for ``max_cycles`` wake-ups)."""
+        executor = IsolatedWorkerPool(self.workers, self.timeout, self.memory_limit_mb)
+        self._note(self.watcher.scan())
+        cycles = 0
+        try:
+            while max_cycles is None or cycles < max_cycles:
+                cycles += 1
+                self._note(self.watcher.wait(min(self.settle, 1.0) or 0.5))
+                for path in self._settled():
+                    try:
+                        fingerprint = fingerprint_file(path, full=True)
+                    except OSError:
+                        continue
+                    if fingerprint in self.state or fingerprint in {
+                        fp for _, fp in self._running.values()
+                    }:
+                        continue
+                    future = executor.submit(extract_batch, [(str(path), None)])
+                    self._running[future] = (path, fingerprint)
+                self._collect()
+            self._collect(block=True)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self.watcher.close()
+
@@ -0,0 +1,137 @@
+"""The extraction service over real sockets, with one worker process."""
+
+import asyncio
+import http.client
+import json
+import socket
+import tempfile
+import threading
+
+import pytest
+
+from service.http_server import ExtractionServer
+
+
+@pytest.fixture
+def serve(tmp_path, monkeypatch):
+    """Start ``ExtractionServer`` instances on free ports in a background loop.
+
+    Uploads are spooled under ``tmp_path``, so tests can check for leaks.
+    """
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    servers = []
+
+    def start(**options) -> ExtractionServer:
+        server = ExtractionServer(port=0, workers=1, **options)
+        asyncio.run_coroutine_threadsafe(server.start(), loop).result(timeout=60)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        asyncio.run_coroutine_threadsafe(server.close(), loop).result(timeout=60)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=10)
+    loop.close()
+
+
+def _post(server, body: bytes, headers: dict) -> tuple[int, dict, dict]:
+    connection = http.client.HTTPConnection("127.0.0.1", server.port, timeout=60)
+    try:
+        connection.request("POST", "/extract", body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def _send_raw(server, request: bytes) -> tuple[bytes, dict]:
+    """Send bytes as they are, close the sending side and return the status line and body."""
+    with socket.create_connection(("127.0.0.1", server.port), timeout=60) as sock:
+        sock.sendall(request)
+        sock.shutdown(socket.SHUT_WR)
+        response = b""
+        while chunk := sock.recv(65536):
+            response += chunk
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.split(b"\r\n")[0], json.loads(body)
+
+
+def _uploads(tmp_path) -> list:
+    return list(tmp_path.glob("dwe-upload-*"))
+
+
+def test_upload_is_extracted(serve, tmp_path):
+    server = serve()
+    status, _, result = _post(server, b"Hello world, hello again", {"X-Filename": "note.txt"})
+    assert status == 200
+    assert result["name"] == "note.txt"
+    assert "path" not in result
+    assert {entry["word"].lower() for entry in result["words"]} >= {"hello", "world", "again"}
+    assert _uploads(tmp_path) == []
+
+
+def test_upload_that_stops_partway_is_refused_and_removed(serve, tmp_path):
+    server = serve()
+    status, body = _send_raw(
+        server,
+        b"POST /extract?name=cut.txt HTTP/1.1\r\n"
+        b"Host: localhost\r\nContent-Length: 100000\r\n\r\n" + b"word " * 100,
+    )
+    assert status.startswith(b"HTTP/1.1 400 ")
+    error = body["error"]
+    assert error == "Upload ended early"
+    assert str(tmp_path) not in error
+    assert _uploads(tmp_path) == []
+
+
+def test_full_queue_answers_429(serve, tmp_path):
+    server = serve(max_queue=1)
+    server._pending = 1  # One document is already waiting
+    status, headers, result = _post(server, b"text", {"X-Filename": "late.txt"})
+    assert status == 429
+    assert headers["Retry-After"] == "1"
+    assert "queue is full" in result["error"]
+    assert _uploads(tmp_path) == []
+
+    server._pending = 0
+    body = json.dumps({"paths": ["a.txt", "b.txt"]}).encode()
+    status, _, _ = _post(server, body, {"Content-Type": "application/json"})
+    assert status == 429
+
+
+def test_unexpected_errors_answer_500(serve, tmp_path):
+    server = serve()
+    server._executor.shutdown(wait=True)
+    status, _, result = _post(server, b"text", {"X-Filename": "note.txt"})
+    assert status == 500
+    assert result["error"].startswith("RuntimeError")
+    assert str(tmp_path) not in result["error"]
+    assert _uploads(tmp_path) == []
+
+
+@pytest.mark.parametrize("length, status", [
+    ("12abc", b"400"), ("-5", b"400"), ("+5", b"400"), ("", b"400"), (None, b"411"),
+])
+def test_content_length_is_validated(serve, length, status):
+    server = serve()
+    header = b"" if length is None else f"Content-Length: {length}\r\n".encode()
+    line, body = _send_raw(
+        server, b"POST /extract?name=a.txt HTTP/1.1\r\nHost: localhost\r\n" + header + b"\r\nhello",
+    )
+    assert line.split()[1] == status
+    assert "error" in body
+
+
+def test_chunked_uploads_are_refused(serve):
+    server = serve()
+    line, body = _send_raw(
+        server,
+        b"POST /extract?name=a.txt HTTP/1.1\r\nHost: localhost\r\n"
+        b"Transfer-Encoding: chunked\r\n\r\n5\r\nhello\r\n0\r\n\r\n",
+    )
+    assert line.split()[1] == b"411"
+    assert "chunked" in body["error"]
@@ -0,0 +1,42 @@
+"""Starting workers in the isolated pool."""
+
+import threading
+
+import pipeline.isolation as isolation
+from pipeline.isolation import IsolatedWorkerPool
+
+
+def test_a_failed_worker_start_fails_only_its_job(monkeypatch):
+    start = isolation._Worker
+    failures = [OSError(11, "Resource temporarily unavailable")]
+
+    def flaky_start(*args):
+        if failures:
+            raise failures.pop()
+        return start(*args)
+
+    monkeypatch.setattr(isolation, "_Worker", flaky_start)
+    with IsolatedWorkerPool(max_workers=1, memory_limit_mb=None) as pool:
+        first = pool.submit(abs, -1)
+        assert isinstance(first.exception(timeout=60), OSError)
+        assert pool.submit(abs, -2).result(timeout=60) == 2
+
+
+def test_submit_does_not_wait_for_a_worker_to_start(monkeypatch):
+    start = isolation._Worker
+    starting, release = threading.Event(), threading.Event()
+
+    def slow_start(*args):
+        starting.set()
+        release.wait(60)
+        return start(*args)
+
+    monkeypatch.setattr(isolation, "_Worker", slow_start)
+    with IsolatedWorkerPool(max_workers=1, memory_limit_mb=None) as pool:
+        first = pool.submit(abs, -1)
+        assert starting.wait(60)
+        submitted = threading.Event()
+        threading.Thread(target=lambda: (pool.submit(abs, -2), submitted.set()), daemon=True).start()
+        assert submitted.wait(10)
+        release.set()
+        assert first.result(timeout=60) == 1
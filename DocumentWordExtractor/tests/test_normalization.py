@@ -0,0 +1,34 @@
+"""Stopword filtering and stemming, alone and on extraction output."""
+
+import json
+
+import pytest
+
+import cli
+from processors.normalization import Normalizer
+
+
+@pytest.mark.parametrize("word", ["boʻyicha", "bo'yicha", "bo’yicha", "bo‘yicha", "BOʻYICHA", "yaʼni", "ya'ni"])
+def test_uzbek_stopwords_match_every_apostrophe_spelling(word):
+    assert Normalizer("uz").normalize(word) is None
+
+
+def test_apostrophe_spellings_share_a_stem():
+    normalizer = Normalizer("uz")
+    assert normalizer.normalize("oʻgʻillarni") == normalizer.normalize("o’g’illar") == "o'g'il"
+
+
+def test_extract_normalizes_uzbek_documents(tmp_path, capsys):
+    document = tmp_path / "matn.txt"
+    document.write_text(
+        "Kitoblar va kitobni oʻqidim. Oʻgʻillar boʻyicha yaʼni oʻsha kitob.\n"
+        "Китоблар ва китобни ҳам бошқа китоб.\n",
+        encoding="utf-8",
+    )
+    assert cli.run(["extract", str(document), "--normalize", "uz"]) == 0
+    result = json.loads(capsys.readouterr().out)
+    groups = {entry["stem"]: entry for entry in result["words"]}
+    assert set(groups) == {"kitob", "o'qid", "o'g'il", "китоб"}
+    assert groups["kitob"]["count"] == 3
+    assert sorted(groups["kitob"]["forms"]) == ["kitob", "kitobni"]
+    assert groups["китоб"]["count"] == 3
@@ -0,0 +1,30 @@
+"""RTF tokenizing that does not depend on where the input is cut."""
+
+import io
+
+import pytest
+
+from readers import rtf_reader
+from readers.rtf_reader import RtfReader, iter_rtf_paragraphs
+
+DOCUMENT = (
+    rb"{\rtf1\ansi\ansicpg1252\deff0{\fonttbl{\f0 Arial;}{\f1\fcharset204 Times;}}"
+    rb"{\*\generator Test;}\uc1\pard\f0\fs24 Emoji d\u-10179?\u-8704? and caf\'e9\par"
+    rb"{\f1 \'cf\'f0\'e8\'e2\'e5\'f2}\par"
+    rb"\'97 dash\tab x\bin2 {}y\fs-5-5\line z\par}"
+)
+EXPECTED = ["Emoji d\U0001f600 and café", "Привет", "— dash\txy-5\nz"]
+
+
+def test_whole_document():
+    assert list(iter_rtf_paragraphs(io.BytesIO(DOCUMENT))) == EXPECTED
+
+
+@pytest.mark.parametrize("chunk_size", range(1, 9))
+def test_every_cut_gives_the_same_paragraphs(chunk_size, monkeypatch):
+    monkeypatch.setattr(rtf_reader, "CHUNK_SIZE", chunk_size)
+    assert list(iter_rtf_paragraphs(io.BytesIO(DOCUMENT))) == EXPECTED
+
+
+def test_reader_reads_bytes():
+    assert RtfReader().read(DOCUMENT) == "\n".join(EXPECTED)
@@ -0,0 +1,40 @@
+"""Batch planning and scheduling of split PDFs."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pipeline.scheduler import BatchScheduler, plan_jobs
+
+fitz = pytest.importorskip("fitz")
+
+
+@pytest.fixture
+def pdf(tmp_path):
+    path = tmp_path / "book.pdf"
+    with fitz.open() as doc:
+        for n in range(5):
+            doc.new_page().insert_text((72, 72), f"page{n} shared")
+        doc.save(path)
+    return path
+
+
+def test_a_document_given_twice_is_planned_once(pdf, monkeypatch):
+    monkeypatch.chdir(pdf.parent)
+    jobs = plan_jobs([pdf, pdf.name, pdf], split_pages=2)
+    assert len(jobs) == 3
+    assert sorted(job.part for job in jobs) == [0, 1, 2]
+    assert {job.path for job in jobs} == {pdf}
+
+
+def test_a_document_given_twice_yields_one_result(pdf):
+    scheduler = BatchScheduler(
+        workers=1, split_pages=2, executor_factory=lambda workers: ThreadPoolExecutor(workers),
+    )
+    results = list(scheduler.run([pdf, os.path.join(pdf.parent, ".", pdf.name)]))
+    assert len(results) == 1
+    assert results[0]["parts"] == 3
+    words = {entry["word"] for entry in results[0]["words"]}
+    assert {f"page{n}" for n in range(5)} <= words
+    assert scheduler.progress.documents == scheduler.progress.documents_done == 1
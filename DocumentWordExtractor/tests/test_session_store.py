@@ -0,0 +1,50 @@
+"""Restoring session snapshots only while their source is unchanged."""
+
+import os
+
+from processors.word_offsets import WordOffsetIndex
+from utils.session_store import SessionStore
+
+# Large enough that a sampled fingerprint skips most of the file
+TEXT = "alpha " * (1024 * 1024 // 6)
+
+
+def _save(tmp_path, source):
+    store = SessionStore(tmp_path / "session")
+    store.save_document(source, TEXT, WordOffsetIndex(TEXT))
+    store.save_manifest([source], 0)
+    assert store.flush(30)
+    return store
+
+
+def _touch(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_same_size_edit_between_samples_marks_the_source_changed(tmp_path):
+    source = tmp_path / "doc.txt"
+    source.write_text(TEXT)
+    store = _save(tmp_path, source)
+    with open(source, "r+b") as f:
+        f.seek(300_000)
+        f.write(b"omega")
+    _touch(source)
+
+    (doc,), _ = store.load()
+    assert doc.source_changed
+    assert doc.text is None and doc.offsets is None
+
+
+def test_touched_or_missing_source_restores_the_snapshot(tmp_path):
+    source = tmp_path / "doc.txt"
+    source.write_text(TEXT)
+    store = _save(tmp_path, source)
+
+    _touch(source)
+    (doc,), _ = store.load()
+    assert not doc.source_changed and doc.text == TEXT
+
+    source.unlink()
+    (doc,), _ = store.load()
+    assert not doc.source_changed and doc.text == TEXT
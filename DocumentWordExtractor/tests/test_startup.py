@@ -0,0 +1,39 @@
+"""Time-to-first-paint regression test for the desktop app."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+MAIN = Path(__file__).resolve().parent.parent / "main.py"
+
+# Milliseconds from launch to the first paint of the main window. Slow CI
+# machines can raise it with DWE_STARTUP_BUDGET_MS.
+STARTUP_BUDGET_MS = float(os.environ.get("DWE_STARTUP_BUDGET_MS", 1500))
+
+
+def test_first_paint_within_budget(tmp_path):
+    env = dict(
+        os.environ,
+        QT_QPA_PLATFORM="offscreen",
+        # Keep the user's settings and saved session out of the measurement
+        HOME=str(tmp_path),
+        XDG_CONFIG_HOME=str(tmp_path / "config"),
+        XDG_DATA_HOME=str(tmp_path / "data"),
+        XDG_CACHE_HOME=str(tmp_path / "cache"),
+        APPDATA=str(tmp_path / "appdata"),
+        LOCALAPPDATA=str(tmp_path / "localappdata"),
+    )
+    process = subprocess.run(
+        [sys.executable, str(MAIN), "--startup-exit", "--startup-budget", str(STARTUP_BUDGET_MS)],
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert process.returncode == 0, process.stderr[-2000:]
+    assert "first paint" in process.stderr
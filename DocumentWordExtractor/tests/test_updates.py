@@ -0,0 +1,167 @@
+"""Update checks and installer downloads against a local stand-in for GitHub."""
+
+import hashlib
+import json
+import os
+import socket
+
+import pytest
+
+from tests.conftest import QuietHandler
+from utils.updates import CHUNK_SIZE, ChecksumMismatchError, Release, UpdateChecker, UpdateError, download_installer
+
+INSTALLER = os.urandom(3 * CHUNK_SIZE)
+ETAG = '"installer-v2"'
+
+
+class ReleaseServer(QuietHandler):
+    """``/latest`` answers like the releases API; ``/installer`` supports ranges.
+
+    ``cut_after`` makes the next full download stop after that many bytes.
+    """
+
+    requests: list = []
+    cut_after: int | None = None
+    base = ""
+
+    def do_GET(self):
+        type(self).requests.append((self.path, dict(self.headers)))
+        if self.path == "/latest":
+            self._latest()
+        else:
+            self._installer()
+
+    def _latest(self):
+        if self.headers.get("If-None-Match") == '"release-v2"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({
+            "tag_name": "v2.0.0",
+            "assets": [{
+                "name": "setup.exe",
+                "size": len(INSTALLER),
+                "digest": "sha256:" + hashlib.sha256(INSTALLER).hexdigest(),
+                "browser_download_url": self.base + "/installer",
+            }],
+        }).encode()
+        self.send_response(200)
+        self.send_header("ETag", '"release-v2"')
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _installer(self):
+        start = 0
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == ETAG:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            if start >= len(INSTALLER):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(INSTALLER)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(INSTALLER) - 1}/{len(INSTALLER)}")
+        else:
+            self.send_response(200)
+        body = INSTALLER[start:]
+        self.send_header("ETag", ETAG)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        cut = type(self).cut_after
+        if cut is not None and start == 0:
+            type(self).cut_after = None
+            self.wfile.write(body[:cut])
+            self.wfile.flush()
+            self.connection.shutdown(socket.SHUT_RDWR)
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server(http_server):
+    handler = type("Handler", (ReleaseServer,), {"requests": [], "cut_after": None})
+    handler.base = http_server(handler)
+    return handler
+
+
+def _release(server) -> Release:
+    return Release(
+        "2.0.0", server.base + "/installer", "setup.exe", len(INSTALLER),
+        hashlib.sha256(INSTALLER).hexdigest(),
+    )
+
+
+def test_check_is_cached_then_conditional(server, tmp_path):
+    checker = UpdateChecker(server.base + "/latest", tmp_path / "update.json")
+    release = checker.check()
+    assert (release.version, checker.last_source) == ("2.0.0", "fetched")
+    assert release.sha256 == hashlib.sha256(INSTALLER).hexdigest()
+
+    assert checker.check() == release
+    assert checker.last_source == "cache"
+    assert len(server.requests) == 1
+
+    assert checker.check(force=True) == release
+    assert checker.last_source == "not-modified"
+    assert server.requests[-1][1]["If-None-Match"] == '"release-v2"'
+
+
+def test_cache_with_other_fields_is_ignored(server, tmp_path):
+    cache = tmp_path / "update.json"
+    cache.write_text(json.dumps({
+        "url": server.base + "/latest",
+        "checked_at": 4e9,
+        "release": {"version": "1.0.0", "removed_field": 1},
+    }))
+    checker = UpdateChecker(server.base + "/latest", cache)
+    assert checker.check().version == "2.0.0"
+    assert checker.last_source == "fetched"
+
+
+def test_interrupted_download_resumes(server, tmp_path):
+    server.cut_after = CHUNK_SIZE + 1000
+    with pytest.raises(UpdateError):
+        download_installer(_release(server), tmp_path)
+    # The whole chunks received before the cut are kept
+    assert (tmp_path / "setup.exe.part").stat().st_size == CHUNK_SIZE
+
+    progress = []
+    target = download_installer(_release(server), tmp_path, on_progress=lambda done, total: progress.append(done))
+    assert target.read_bytes() == INSTALLER
+    assert server.requests[-1][1]["Range"] == f"bytes={CHUNK_SIZE}-"
+    assert progress[0] == CHUNK_SIZE and progress[-1] == len(INSTALLER)
+    assert not (tmp_path / "setup.exe.part").exists()
+    assert not (tmp_path / "setup.exe.part.json").exists()
+
+
+def test_complete_part_file_is_finished_after_416(server, tmp_path):
+    (tmp_path / "setup.exe.part").write_bytes(INSTALLER)
+    (tmp_path / "setup.exe.part.json").write_text(
+        json.dumps({"url": server.base + "/installer", "validator": ETAG})
+    )
+    target = download_installer(_release(server), tmp_path)
+    assert target.read_bytes() == INSTALLER
+    assert server.requests[-1][1]["Range"] == f"bytes={len(INSTALLER)}-"
+
+
+def test_corrupt_part_file_is_downloaded_again_after_416(server, tmp_path):
+    (tmp_path / "setup.exe.part").write_bytes(b"x" * len(INSTALLER))
+    (tmp_path / "setup.exe.part.json").write_text(
+        json.dumps({"url": server.base + "/installer", "validator": ETAG})
+    )
+    target = download_installer(_release(server), tmp_path)
+    assert target.read_bytes() == INSTALLER
+    assert "Range" not in server.requests[-1][1]
+
+
+def test_checksum_mismatch_discards_the_download(server, tmp_path):
+    release = _release(server)
+    release.sha256 = "0" * 64
+    with pytest.raises(ChecksumMismatchError):
+        download_installer(release, tmp_path)
+    assert list(tmp_path.iterdir()) == []
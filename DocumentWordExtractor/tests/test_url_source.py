@@ -0,0 +1,110 @@
+"""Downloads and extraction of URLs from a local stand-in server."""
+
+import socket
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pipeline.url_source import UrlSource, extract_urls
+from tests.conftest import QuietHandler
+
+TEXT = ("alpha beta gamma " * 2000).encode()
+
+
+class DocumentServer(QuietHandler):
+    """Serves ``/doc.txt``; ``/flaky`` fails as ``failures`` says, then serves it too."""
+
+    failures: list = []
+
+    def do_GET(self):
+        if self.path == "/flaky" and type(self).failures:
+            failure = type(self).failures.pop(0)
+            if failure == "cut":
+                self._send(TEXT, cut=len(TEXT) // 2)
+            else:
+                self._send(b"busy", status=failure)
+        elif self.path in ("/doc.txt", "/flaky"):
+            self._send(TEXT)
+        else:
+            self._send(b"not here", status=404)
+
+    def _send(self, body, status=200, cut=None):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        if status == 503:
+            self.send_header("Retry-After", "0")
+        self.end_headers()
+        if cut is None:
+            self.wfile.write(body)
+            return
+        self.wfile.write(body[:cut])
+        self.wfile.flush()
+        self.connection.shutdown(socket.SHUT_RDWR)
+        self.close_connection = True
+
+
+@pytest.fixture
+def server(http_server):
+    handler = type("Handler", (DocumentServer,), {"failures": []})
+    handler.base = http_server(handler)
+    return handler
+
+
+def _closed_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _extract(urls, **options):
+    with UrlSource(workers=2, backoff=0, **options) as source, ThreadPoolExecutor(2) as executor:
+        return {result["path"]: result for result in extract_urls(urls, source, executor)}
+
+
+def test_documents_and_failures_each_get_a_result(server):
+    refused = f"http://127.0.0.1:{_closed_port()}/doc.txt"
+    results = _extract([server.base + "/doc.txt", server.base + "/missing.pdf", refused], retries=0)
+    assert len(results) == 3
+
+    document = results[server.base + "/doc.txt"]
+    assert "error" not in document
+    assert {entry["word"] for entry in document["words"]} == {"alpha", "beta", "gamma"}
+    assert document["download"]["bytes"] == len(TEXT)
+    assert document["download"]["stored"] == "memory"
+
+    missing = results[server.base + "/missing.pdf"]
+    assert "404" in missing["error"]
+    assert missing["name"] == "missing.pdf"
+    assert "error" in results[refused]
+
+
+def test_large_documents_are_spooled_to_disk_and_removed(server, tmp_path):
+    results = _extract([server.base + "/doc.txt"], memory_limit=1000)
+    document = results[server.base + "/doc.txt"]
+    assert "error" not in document
+    assert document["download"]["stored"] == "disk"
+
+    with UrlSource(memory_limit=1000, directory=tmp_path) as source:
+        download = source.download(server.base + "/doc.txt", 3)
+    assert download.path == tmp_path / "00003-doc.txt"
+    assert download.path.read_bytes() == TEXT
+
+
+def test_busy_responses_and_broken_bodies_are_retried(server):
+    server.failures = [503, "cut", 503]
+    with UrlSource(retries=3, backoff=0) as source:
+        download = source.download(server.base + "/flaky")
+    assert download.error is None
+    assert download.data == TEXT
+    assert download.attempts == 2  # The broken body; 503s are retried by the transport
+    assert server.failures == []
+
+
+def test_retries_give_up(server):
+    server.failures = ["cut", "cut"]
+    with UrlSource(retries=1, backoff=0) as source:
+        download = source.download(server.base + "/flaky")
+    assert download.error is not None
+    assert download.data is None and download.path is None
+    assert download.attempts == 2
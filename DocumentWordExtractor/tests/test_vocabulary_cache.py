@@ -0,0 +1,40 @@
+"""Cached vocabularies are used only while their source is unchanged."""
+
+import os
+
+from processors.vocabulary_diff import Vocabulary
+from utils.vocabulary_cache import VocabularyCache
+
+
+def _source(tmp_path):
+    path = tmp_path / "doc.txt"
+    path.write_bytes(b"alpha " * (1024 * 1024 // 6))
+    return path
+
+
+def _touch(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+
+def test_same_size_edit_between_samples_invalidates_the_entry(tmp_path):
+    source = _source(tmp_path)
+    cache = VocabularyCache(tmp_path / "cache")
+    cache.save(source, Vocabulary.from_counts(source.name, {"alpha": 174762}))
+    assert list(cache.load(source).forms) == ["alpha"]
+
+    with open(source, "r+b") as f:
+        f.seek(300_000)
+        f.write(b"omega")
+    _touch(source)
+    assert cache.load(source) is None
+
+
+def test_touched_source_keeps_the_entry(tmp_path):
+    source = _source(tmp_path)
+    cache = VocabularyCache(tmp_path / "cache")
+    cache.save(source, Vocabulary.from_counts(source.name, {"alpha": 174762}))
+    _touch(source)
+    assert list(cache.load(source).forms) == ["alpha"]
+    source.unlink()
+    assert cache.load(source) is None
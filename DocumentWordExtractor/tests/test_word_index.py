@@ -0,0 +1,84 @@
+"""WordIndex search results against a brute-force substring filter."""
+
+import random
+import sys
+import threading
+
+import pytest
+
+from processors import word_index
+from processors.word_index import WordIndex
+
+
+@pytest.fixture(params=["inline", "background", "background-pure-python"])
+def finish_indexing(request, monkeypatch):
+    """Index inline, or on the background thread, with NumPy or without.
+
+    Background builds are held until the returned function is called, so
+    searches before that run while the posting lists are being built.
+    """
+    gate = threading.Event()
+    if request.param != "inline":
+        monkeypatch.setattr(WordIndex, "BACKGROUND_WORDS", 0)
+        build = word_index._short_postings
+
+        def held(keys):
+            gate.wait(30)
+            return build(keys)
+
+        monkeypatch.setattr(word_index, "_short_postings", held)
+    if request.param.endswith("pure-python"):
+        monkeypatch.setitem(sys.modules, "numpy", None)
+    yield gate.set
+    gate.set()
+
+
+def _expected(words, removed, query):
+    q = query.strip().lower()
+    return [i for i, w in enumerate(words) if i not in removed and q in w.lower()]
+
+
+def test_queries_of_every_length_match_substrings(finish_indexing):
+    words = ["Apple", "pineapple", "grape", "Papaya", "ap", "a", "banana", "Ёлка"]
+    index = WordIndex(words)
+    finish_indexing()
+    assert index.wait_indexed(30)
+    for query in ("a", "p", "ap", "AP", "pp", "app", "apple", "nan", " ple ", "x", "ё", "ЁЛ", ""):
+        assert list(index.search(query)) == _expected(words, set(), query), query
+
+
+def test_random_edits_and_queries_match_brute_force(finish_indexing):
+    rng = random.Random(7)
+    alphabet = "abcdeé"
+    words = ["".join(rng.choices(alphabet, k=rng.randint(1, 6))) for _ in range(300)]
+    index = WordIndex(words)
+    removed = set()
+    query = ""
+    for step in range(400):
+        if step == 200:
+            finish_indexing()
+            assert index.wait_indexed(30)
+        action = rng.random()
+        if action < 0.15:
+            word = "".join(rng.choices(alphabet, k=rng.randint(1, 6)))
+            assert index.add(word) == len(words)
+            words.append(word)
+        elif action < 0.25:
+            victims = rng.sample(range(len(words)), 3)
+            index.remove(victims)
+            removed.update(victims)
+        # Type, extend and shorten the query as a user filtering the list would
+        if action < 0.6 and len(query) < 5:
+            query += rng.choice(alphabet.upper() + alphabet)
+        elif query:
+            query = query[:-1]
+        assert list(index.search(query)) == _expected(words, removed, query), query
+
+
+def test_numpy_and_python_builds_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(3)
+    keys = ["".join(rng.choices("abéя\U0001f600", k=rng.randint(1, 5))) for _ in range(500)]
+    with_numpy = word_index._short_postings(keys)
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    assert word_index._short_postings(keys) == with_numpy
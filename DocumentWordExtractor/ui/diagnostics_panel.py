@@ -0,0 +1,75 @@
+"""Diagnostics panel listing per-stage metrics of recent loads and exports."""
+
+from collections import deque
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QPushButton,
+    QTableWidget,
+    QTableWidgetItem,
+    QVBoxLayout,
+)
+
+from utils.instrumentation import StageRecorder
+
+COLUMNS = ("Document", "Stage", "Wall ms", "CPU ms", "Peak memory", "Processed")
+
+
+class DiagnosticsPanel(QDialog):
+    """Non-modal table of the stages recorded for recent documents."""
+
+    def __init__(self, history: deque[StageRecorder], parent=None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Diagnostics")
+        self.resize(720, 360)
+        self._history = history
+
+        layout = QVBoxLayout(self)
+        self._table = QTableWidget(0, len(COLUMNS))
+        self._table.setHorizontalHeaderLabels(COLUMNS)
+        self._table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self._table.verticalHeader().setVisible(False)
+        self._table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        layout.addWidget(self._table)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+        clear_btn = QPushButton("Clear")
+        clear_btn.clicked.connect(self._on_clear)
+        buttons.addWidget(clear_btn)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def refresh(self) -> None:
+        """Rebuild the table from the history, newest document first."""
+        rows = [
+            (recorder.document, stage)
+            for recorder in reversed(self._history)
+            for stage in recorder.stages
+        ]
+        self._table.setRowCount(len(rows))
+        for row, (document, s) in enumerate(rows):
+            memory = ""
+            if s.peak_kb is not None:
+                memory = f"{s.peak_kb / 1024:.1f} MB ({s.memory_source})"
+            processed = f"{s.items:,} {s.unit}" if s.items is not None else ""
+            values = (document, s.stage, f"{s.wall_ms:.1f}", f"{s.cpu_ms:.1f}", memory, processed)
+            for col, value in enumerate(values):
+                item = QTableWidgetItem(value)
+                if 2 <= col <= 3:
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                self._table.setItem(row, col, item)
+
+    def showEvent(self, event) -> None:
+        self.refresh()
+        super().showEvent(event)
+
+    def _on_clear(self) -> None:
+        self._history.clear()
+        self.refresh()
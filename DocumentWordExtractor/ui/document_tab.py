@@ -0,0 +1,145 @@
+"""Tabbed document view holding one loaded document and its word selection."""
+
+from pathlib import Path
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QPlainTextEdit,
+    QStackedWidget,
+    QFrame,
+    QLabel,
+    QProgressBar,
+    QSizePolicy,
+)
+
+from processors.word_index import WordIndex
+from processors.vocabulary_diff import Vocabulary
+from processors.word_offsets import WordOffsetIndex
+from ui.occurrence_highlighter import OccurrenceHighlighter
+from utils.instrumentation import StageRecorder
+
+
+class DocumentViewer(QPlainTextEdit):
+    """Custom text viewer that emits a signal when mouse selection is finished."""
+
+    selectionFinished = Signal()
+
+    def mouseReleaseEvent(self, event):
+        """Emit selectionFinished only after the mouse button is released."""
+        super().mouseReleaseEvent(event)
+        self.selectionFinished.emit()
+
+
+class DocumentTab(QWidget):
+    """One open document: viewer, loading overlay and per-document word state."""
+
+    selectionChanged = Signal()
+
+    def __init__(self, file_path: Path, parent=None) -> None:
+        super().__init__(parent)
+        self.file_path = file_path
+        self.job_id: int | None = None
+        self.all_words: list[str] = []
+        self.selected_words: list[str] = []
+        self.selected_index = WordIndex()
+        self.offsets: WordOffsetIndex | None = None
+        self.loaded = False
+        # Selection to apply once the document has loaded (session restore)
+        self.pending_selection: list[str] | None = None
+        # Stage metrics of the last load (None for restored snapshots)
+        self.metrics: StageRecorder | None = None
+        # Word set with counts, built on first comparison
+        self._vocabulary: Vocabulary | None = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        self._stack = QStackedWidget()
+        self._stack.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+
+        self.viewer = DocumentViewer()
+        self.viewer.setReadOnly(True)
+        self._stack.addWidget(self.viewer)
+        self.highlighter = OccurrenceHighlighter(self.viewer)
+
+        # Loading / error overlay
+        loading_frame = QFrame()
+        loading_frame.setObjectName("loadingOverlay")
+        loading_layout = QVBoxLayout(loading_frame)
+        loading_layout.setAlignment(Qt.AlignCenter)
+        loading_layout.setSpacing(12)
+        self._loading_label = QLabel()
+        self._loading_label.setObjectName("loadingLabel")
+        self._loading_label.setWordWrap(True)
+        self._loading_label.setAlignment(Qt.AlignCenter)
+        loading_layout.addWidget(self._loading_label)
+        self._loading_bar = QProgressBar()
+        self._loading_bar.setRange(0, 0)  # Indeterminate
+        self._loading_bar.setFixedWidth(200)
+        loading_layout.addWidget(self._loading_bar, 0, Qt.AlignHCenter)
+        self._stack.addWidget(loading_frame)
+
+        layout.addWidget(self._stack)
+
+    def show_loading(self, message: str) -> None:
+        """Show the loading overlay with the given status message."""
+        self._loading_label.setText(message)
+        self._loading_bar.setVisible(True)
+        self._stack.setCurrentIndex(1)
+
+    def show_error(self, message: str) -> None:
+        """Replace the overlay with an error message."""
+        self._loading_label.setText(message)
+        self._loading_bar.setVisible(False)
+        self._stack.setCurrentIndex(1)
+
+    def set_document(self, text: str, offsets: WordOffsetIndex) -> None:
+        """Display loaded text and reset the word state."""
+        self.viewer.setPlainText(text)
+        self.offsets = offsets
+        self._vocabulary = None
+        self.all_words = offsets.unique_words()
+        self.loaded = True
+        self._stack.setCurrentIndex(0)
+        self.set_selected_words(self.pending_selection or [])
+        self.pending_selection = None
+
+    def vocabulary(self) -> Vocabulary:
+        """Return the document's vocabulary, built from the word index once."""
+        if self._vocabulary is None:
+            if self.offsets is None:
+                raise ValueError("Document is not loaded")
+            self._vocabulary = Vocabulary.from_offsets(self.file_path.name, self.offsets)
+        return self._vocabulary
+
+    def set_selected_words(self, words: list[str]) -> None:
+        """Replace the selection and rebuild its search index."""
+        self.selected_words = list(words)
+        self.selected_index = WordIndex(self.selected_words)
+        self.highlighter.set_index(self.offsets, self.selected_words)
+        self.selectionChanged.emit()
+
+    def add_selected_word(self, word: str) -> bool:
+        """Append a word unless it is already selected (case-insensitive)."""
+        if self.selected_index.find(word) is not None:
+            return False
+        self.selected_words.append(word)
+        self.selected_index.add(word)
+        self.highlighter.words_added([word])
+        self.selectionChanged.emit()
+        return True
+
+    def remove_selected_ids(self, word_ids: list[int]) -> None:
+        """Remove words from the selection by their index ids."""
+        positions = sorted(
+            (self.selected_index.position(i) for i in set(word_ids)),
+            reverse=True,
+        )
+        removed = [self.selected_index.word(i) for i in set(word_ids)]
+        for pos in positions:
+            del self.selected_words[pos]
+        self.selected_index.remove(word_ids)
+        self.highlighter.words_removed(removed)
+        self.selectionChanged.emit()
@@ -0,0 +1,184 @@
+"""Shared, bounded worker pool for loading documents in the background."""
+
+import os
+from collections import deque
+from enum import Enum
+from itertools import count
+from pathlib import Path
+
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from pipeline.extraction import load_document
+from pipeline.isolation import IsolatedWorkerPool
+from processors.word_offsets import WordOffsetIndex
+from utils.instrumentation import StageRecorder
+
+
+class JobStatus(Enum):
+    """Lifecycle state of a single load job."""
+
+    QUEUED = "Queued"
+    RUNNING = "Loading"
+    DONE = "Done"
+    FAILED = "Failed"
+    CANCELLED = "Cancelled"
+
+
+class _JobSignals(QObject):
+    """Signals emitted by a FileLoadJob (QRunnable cannot emit signals itself)."""
+
+    started = Signal(int)
+    finished = Signal(int, object, str, object, object)  # (job_id, file_path, text, offsets, metrics)
+    error = Signal(int, str)
+
+
+class FileLoadJob(QRunnable):
+    """Read a document and index its word occurrences on a pool thread.
+
+    With an isolation pool the work runs in a worker process under its
+    time and memory limits, and the pool thread only waits for the result.
+    """
+
+    def __init__(
+        self,
+        job_id: int,
+        file_path: Path,
+        signals: _JobSignals,
+        isolation: IsolatedWorkerPool | None = None,
+    ):
+        super().__init__()
+        self.job_id = job_id
+        self.file_path = file_path
+        self._signals = signals
+        self._isolation = isolation
+        self.setAutoDelete(False)
+
+    def run(self):
+        self._signals.started.emit(self.job_id)
+        try:
+            if self._isolation is not None:
+                text, offsets, metrics = self._isolation.submit(load_document, self.file_path).result()
+            else:
+                # Readers are per-thread, so pool threads never share handles
+                text, offsets, metrics = load_document(self.file_path)
+            self._signals.finished.emit(self.job_id, self.file_path, text, offsets, metrics)
+        except Exception as e:
+            self._signals.error.emit(self.job_id, str(e))
+
+
+class LoadQueue(QObject):
+    """Schedules FileLoadJobs on a bounded QThreadPool with per-job status.
+
+    At most ``max_workers`` jobs run at once; the rest wait in a FIFO queue
+    owned by this object so they can be cancelled before they start. With
+    an ``isolation`` pool, documents are read in its worker processes, so
+    a document that hangs or exhausts memory fails alone.
+    """
+
+    jobStarted = Signal(int)
+    jobFinished = Signal(int, object, str, object, object)  # (job_id, file_path, text, offsets, metrics)
+    jobFailed = Signal(int, str)
+    statusChanged = Signal()
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        parent=None,
+        isolation: IsolatedWorkerPool | None = None,
+    ):
+        super().__init__(parent)
+        self._isolation = isolation
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max_workers or os.cpu_count() or 2)
+        self._ids = count(1)
+        self._pending: deque[FileLoadJob] = deque()
+        self._running: dict[int, FileLoadJob] = {}
+        self._status: dict[int, JobStatus] = {}
+        self._signals = _JobSignals(self)
+        self._signals.started.connect(self._on_job_started)
+        self._signals.finished.connect(self._on_job_finished)
+        self._signals.error.connect(self._on_job_error)
+
+    @property
+    def max_workers(self) -> int:
+        return self._pool.maxThreadCount()
+
+    def submit(self, file_path: Path) -> int:
+        """Queue a file for loading and return its job id."""
+        job_id = next(self._ids)
+        self._pending.append(FileLoadJob(job_id, file_path, self._signals, self._isolation))
+        self._status[job_id] = JobStatus.QUEUED
+        self._dispatch()
+        self.statusChanged.emit()
+        return job_id
+
+    def cancel(self, job_id: int) -> None:
+        """Cancel a queued job. Running jobs finish but their result is dropped."""
+        for job in self._pending:
+            if job.job_id == job_id:
+                self._pending.remove(job)
+                break
+        if self._status.get(job_id) in (JobStatus.QUEUED, JobStatus.RUNNING):
+            self._status[job_id] = JobStatus.CANCELLED
+            self.statusChanged.emit()
+
+    def status(self, job_id: int) -> JobStatus | None:
+        return self._status.get(job_id)
+
+    def counts(self) -> dict[JobStatus, int]:
+        """Return the number of jobs in each state."""
+        result = {s: 0 for s in JobStatus}
+        for s in self._status.values():
+            result[s] += 1
+        return result
+
+    def is_idle(self) -> bool:
+        return not self._pending and not self._running
+
+    def wait_for_done(self, msecs: int = -1) -> bool:
+        """Block until running jobs finish (used on shutdown).
+
+        Isolated loads still running are killed rather than waited for.
+        """
+        self._pending.clear()
+        if self._isolation is not None:
+            self._isolation.terminate()
+        return self._pool.waitForDone(msecs)
+
+    def _dispatch(self) -> None:
+        """Move queued jobs into the pool while worker slots are free."""
+        while self._pending and len(self._running) < self.max_workers:
+            job = self._pending.popleft()
+            self._running[job.job_id] = job
+            self._pool.start(job)
+
+    def _finish(self, job_id: int, status: JobStatus) -> bool:
+        """Record completion; return False if the job was cancelled meanwhile."""
+        self._running.pop(job_id, None)
+        cancelled = self._status.get(job_id) is JobStatus.CANCELLED
+        if not cancelled:
+            self._status[job_id] = status
+        self._dispatch()
+        self.statusChanged.emit()
+        return not cancelled
+
+    def _on_job_started(self, job_id: int) -> None:
+        if self._status.get(job_id) is JobStatus.QUEUED:
+            self._status[job_id] = JobStatus.RUNNING
+            self.jobStarted.emit(job_id)
+            self.statusChanged.emit()
+
+    def _on_job_finished(
+        self,
+        job_id: int,
+        file_path: Path,
+        text: str,
+        offsets: WordOffsetIndex,
+        metrics: StageRecorder,
+    ) -> None:
+        if self._finish(job_id, JobStatus.DONE):
+            self.jobFinished.emit(job_id, file_path, text, offsets, metrics)
+
+    def _on_job_error(self, job_id: int, error_msg: str) -> None:
+        if self._finish(job_id, JobStatus.FAILED):
+            self.jobFailed.emit(job_id, error_msg)
@@ -1,11 +1,23 @@
 """Main application window."""
 
-import webbrowser
+import threading
+from collections import deque
 from pathlib import Path
 
-import requests
-from PySide6.QtCore import Qt, Slot, QThread, Signal, QSettings, QEvent, QObject
-from PySide6.QtGui import QDragEnterEvent, QDropEvent
+from PySide6.QtCore import (
+    Qt,
+    Slot,
+    QThread,
+    Signal,
+    QSettings,
+    QEvent,
+    QObject,
+    QModelIndex,
+    QStandardPaths,
+    QTimer,
+    QUrl,
+)
+from PySide6.QtGui import QActionGroup, QDesktopServices, QDragEnterEvent, QDropEvent
 from PySide6.QtWidgets import (
     QMainWindow,
     QWidget,
@@ -14,110 +26,125 @@ from PySide6.QtWidgets import (
     QToolBar,
     QPushButton,
     QPlainTextEdit,
-    QListWidget,
-    QListWidgetItem,
+    QTabWidget,
+    QLineEdit,
+    QListView,
     QStatusBar,
     QSplitter,
     QFrame,
     QLabel,
     QFileDialog,
+    QInputDialog,
+    QMenu,
     QMessageBox,
     QStackedWidget,
     QSizePolicy,
     QApplication,
-    QProgressBar,
 )
 
 from readers.document_factory import DocumentFactory
-from processors.word_extractor import WordExtractor
-from exporters.excel_exporter import ExcelExporter
+from processors.word_offsets import WordOffsetIndex
+from ui.document_tab import DocumentTab
+from ui.load_queue import JobStatus, LoadQueue
+from ui.word_list_model import WordListModel
+from utils.instrumentation import StageRecorder
+from utils.session_store import SessionStore
 from utils.styles import DARK_THEME, LIGHT_THEME
 
 
-class FileLoadWorker(QThread):
-    """Background worker for loading documents without blocking the UI."""
+GITHUB_API = "https://api.github.com/repos/Abdusalom0v/PDF-Word-/releases/latest"
+
+
+class UpdateCheckWorker(QThread):
+    """Background worker for checking GitHub releases.
+
+    Checks go through an ``UpdateChecker``, so repeated clicks are answered
+    from its cache or with a conditional request. The full release is left
+    in ``release`` for the installer download.
+    """
 
-    finished = Signal(object, str)  # (file_path, text)
+    # (latest_version, download_url) or (None, error_msg). Not named "finished",
+    # which would shadow QThread.finished, and typed object since Signal
+    # cannot take "str | None".
+    checkFinished = Signal(object, object)
     error = Signal(str)
 
-    def __init__(self, file_path: Path, parent=None):
+    def __init__(self, cache_path: Path, parent=None):
         super().__init__(parent)
-        self._file_path = file_path
+        self._cache_path = cache_path
+        self.release = None
 
     def run(self):
         try:
-            reader = DocumentFactory.get_reader(self._file_path)
-            if not reader:
-                self.error.emit(f"Unsupported format: {self._file_path.suffix}")
-                return
-            text = reader.read(self._file_path)
-            self.finished.emit(self._file_path, text)
+            from utils.updates import UpdateChecker
+
+            self.release = UpdateChecker(GITHUB_API, self._cache_path).check()
+            self.checkFinished.emit(self.release.version, self.release.download_url)
         except Exception as e:
-            self.error.emit(str(e))
+            self.checkFinished.emit(None, str(e))
 
 
-GITHUB_API = "https://api.github.com/repos/Abdusalom0v/PDF-Word-/releases/latest"
+class InstallerDownloadWorker(QThread):
+    """Background worker downloading and verifying an installer."""
 
+    progress = Signal(object, object)  # (bytes received, total bytes or None)
+    downloadFinished = Signal(object, object)  # (installer path, None) or (None, error_msg)
 
-class UpdateCheckWorker(QThread):
-    """Background worker for checking GitHub releases."""
+    def __init__(self, release, directory: Path, parent=None):
+        super().__init__(parent)
+        self._release = release
+        self._directory = directory
+        self._cancel = threading.Event()
 
-    finished = Signal(str | None, str | None)  # (latest_version, download_url) or (None, error_msg)
-    error = Signal(str)
+    def cancel(self) -> None:
+        """Stop the download; the partial file is kept and resumed next time."""
+        self._cancel.set()
 
     def run(self):
         try:
-            response = requests.get(GITHUB_API, timeout=5)
-            response.raise_for_status()
-            release = response.json()
-            version = release.get("tag_name", "").lstrip("v")
-            assets = release.get("assets", [])
-            url = assets[0]["browser_download_url"] if assets else ""
-            self.finished.emit(version, url)
+            from utils.updates import download_installer
+
+            path = download_installer(self._release, self._directory, self.progress.emit, self._cancel)
+            self.downloadFinished.emit(str(path), None)
         except Exception as e:
-            self.finished.emit(None, str(e))
+            self.downloadFinished.emit(None, str(e))
 
 
 class DropFilter(QObject):
-    """Event filter that accepts file drops and forwards to a callback."""
+    """Event filter that accepts file drops and forwards them to a callback."""
 
-    def __init__(self, on_file_dropped):
+    def __init__(self, on_files_dropped):
         super().__init__()
-        self._on_file_dropped = on_file_dropped
+        self._on_files_dropped = on_files_dropped
+
+    @staticmethod
+    def _supported_paths(event) -> list[Path]:
+        """Return the dropped local files that have a registered reader."""
+        if not event.mimeData().hasUrls():
+            return []
+        extensions = DocumentFactory.supported_extensions()
+        return [
+            Path(url.toLocalFile())
+            for url in event.mimeData().urls()
+            if url.isLocalFile() and Path(url.toLocalFile()).suffix.lower() in extensions
+        ]
 
     def eventFilter(self, obj, event):
         if event.type() == QEvent.DragEnter:
-            if event.mimeData().hasUrls():
-                urls = event.mimeData().urls()
-                if urls and urls[0].isLocalFile():
-                    path = Path(urls[0].toLocalFile())
-                    if path.suffix.lower() in (".pdf", ".docx", ".txt"):
-                        event.acceptProposedAction()
-                        return True
+            if self._supported_paths(event):
+                event.acceptProposedAction()
+                return True
         elif event.type() == QEvent.Drop:
-            urls = event.mimeData().urls()
-            if urls and urls[0].isLocalFile():
-                path = Path(urls[0].toLocalFile())
-                if path.is_file() and path.suffix.lower() in (".pdf", ".docx", ".txt"):
-                    event.acceptProposedAction()
-                    self._on_file_dropped(path)
-                    return True
+            paths = [p for p in self._supported_paths(event) if p.is_file()]
+            if paths:
+                event.acceptProposedAction()
+                self._on_files_dropped(paths)
+                return True
         return super().eventFilter(obj, event)
 
 
-class DocumentViewer(QPlainTextEdit):
-    """Custom text viewer that emits a signal when mouse selection is finished."""
-
-    selectionFinished = Signal()
-
-    def mouseReleaseEvent(self, event):
-        """Emit selectionFinished only after the mouse button is released."""
-        super().mouseReleaseEvent(event)
-        self.selectionFinished.emit()
-
-
-class PhraseListWidget(QListWidget):
-    """List widget that supports deleting items with the Delete key."""
+class PhraseListView(QListView):
+    """List view that supports deleting items with the Delete key."""
 
     deletePressed = Signal()
 
@@ -129,22 +156,41 @@ class PhraseListWidget(QListWidget):
 
 
 class MainWindow(QMainWindow):
-    """Main application window with document viewer and word selection."""
+    """Main application window with tabbed document viewers and word selection.
+
+    Heavy modules (requests, openpyxl, webbrowser) are imported on first use
+    so nothing beyond Qt is loaded before the window paints.
+    """
+
+    firstPainted = Signal()
 
     def __init__(self) -> None:
         super().__init__()
-        self._current_file: Path | None = None
-        self._all_words: list[str] = []
-        self._selected_words: list[str] = []
-        self._load_worker: FileLoadWorker | None = None
+        self._tabs_by_job: dict[int, DocumentTab] = {}
         self._update_worker: UpdateCheckWorker | None = None
+        self._download_worker: InstallerDownloadWorker | None = None
+        self._update_release = None
         self._update_download_url: str = ""
         self._update_latest_version: str = ""
         self._settings = QSettings("DocumentWordExtractor", "DocumentWordExtractor")
+        self._load_queue = LoadQueue(parent=self, isolation=self._create_isolation_pool())
         self._dark_theme = self._settings.value("darkTheme", True, type=bool)
+        self._painted = False
+        self._session = SessionStore(
+            Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
+            / "session"
+        )
+        self._restoring = False
+        # Stage metrics of recent loads and exports, shown in diagnostics
+        self._metrics_history: deque[StageRecorder] = deque(maxlen=50)
+        self._diagnostics = None
+        # Word ids shared by all vocabulary comparisons of this session
+        self._lexicon = None
         self._setup_ui()
         self._connect_signals()
         self._apply_theme()
+        # Restore after the first paint so the window shows immediately
+        QTimer.singleShot(0, self._restore_session)
 
     def _setup_ui(self) -> None:
         """Initialize the user interface."""
@@ -169,34 +215,25 @@ class MainWindow(QMainWindow):
         viewer_layout = QVBoxLayout(viewer_container)
         viewer_layout.setContentsMargins(12, 12, 6, 12)
 
-        # Stacked widget: document viewer + loading overlay
+        # Stacked widget: empty placeholder + document tabs
         self._viewer_stack = QStackedWidget()
         self._viewer_stack.setSizePolicy(
             QSizePolicy.Expanding,
             QSizePolicy.Expanding,
         )
 
-        self._document_viewer = DocumentViewer()
-        self._document_viewer.setPlaceholderText(
-            "Open a document or drag and drop a file here..."
+        self._placeholder_viewer = QPlainTextEdit()
+        self._placeholder_viewer.setPlaceholderText(
+            "Open documents or drag and drop files here..."
         )
-        self._document_viewer.setReadOnly(True)
-        self._viewer_stack.addWidget(self._document_viewer)
-
-        # Loading overlay
-        loading_frame = QFrame()
-        loading_frame.setObjectName("loadingOverlay")
-        loading_layout = QVBoxLayout(loading_frame)
-        loading_layout.setAlignment(Qt.AlignCenter)
-        loading_layout.setSpacing(12)
-        self._loading_label = QLabel("Loading document...")
-        self._loading_label.setObjectName("loadingLabel")
-        loading_layout.addWidget(self._loading_label)
-        self._loading_bar = QProgressBar()
-        self._loading_bar.setRange(0, 0)  # Indeterminate
-        self._loading_bar.setFixedWidth(200)
-        loading_layout.addWidget(self._loading_bar, 0, Qt.AlignHCenter)
-        self._viewer_stack.addWidget(loading_frame)
+        self._placeholder_viewer.setReadOnly(True)
+        self._viewer_stack.addWidget(self._placeholder_viewer)
+
+        self._tabs = QTabWidget()
+        self._tabs.setTabsClosable(True)
+        self._tabs.setMovable(True)
+        self._tabs.setDocumentMode(True)
+        self._viewer_stack.addWidget(self._tabs)
 
         viewer_layout.addWidget(self._viewer_stack)
         splitter.addWidget(viewer_container)
@@ -218,15 +255,56 @@ class MainWindow(QMainWindow):
         panel_title.setObjectName("panelTitle")
         words_layout.addWidget(panel_title)
 
-        self._words_list = PhraseListWidget()
-        self._words_list.setSelectionMode(QListWidget.ExtendedSelection)
-        self._words_list.setDragDropMode(QListWidget.NoDragDrop)
+        self._word_filter = QLineEdit()
+        self._word_filter.setObjectName("wordFilter")
+        self._word_filter.setPlaceholderText("Filter words...")
+        self._word_filter.setClearButtonEnabled(True)
+        words_layout.addWidget(self._word_filter)
+
+        self._words_model = WordListModel(self)
+        self._words_list = PhraseListView()
+        self._words_list.setModel(self._words_model)
+        self._words_list.setUniformItemSizes(True)
+        self._words_list.setSelectionMode(QListView.ExtendedSelection)
+        self._words_list.setDragDropMode(QListView.NoDragDrop)
         self._words_list.setSizePolicy(
             QSizePolicy.Expanding,
             QSizePolicy.Expanding,
         )
         words_layout.addWidget(self._words_list)
 
+        merge_variants_btn = QPushButton("Merge Variants…")
+        merge_variants_btn.setObjectName("mergeVariantsButton")
+        merge_variants_btn.setToolTip(
+            "Collapse misspelled and OCR-damaged variants into their most frequent form"
+        )
+        merge_variants_btn.clicked.connect(self._on_merge_variants)
+        words_layout.addWidget(merge_variants_btn)
+
+        sort_btn = QPushButton("Sort")
+        sort_btn.setObjectName("sortWordsButton")
+        sort_btn.setToolTip("Reorder the selected words; exports keep this order")
+        sort_menu = QMenu(sort_btn)
+        for label, order in (
+            ("Alphabetical", "alphabetical"),
+            ("By Frequency", "frequency"),
+            ("By Length", "length"),
+            ("By First Occurrence", "occurrence"),
+        ):
+            sort_menu.addAction(label, lambda order=order: self._on_sort_words(order))
+        sort_menu.addSeparator()
+        alphabet_menu = sort_menu.addMenu("Alphabet")
+        alphabet_group = QActionGroup(alphabet_menu)
+        collation = self._settings.value("collation", "en", type=str)
+        for label, language in (("English", "en"), ("Russian", "ru"), ("Uzbek", "uz")):
+            action = alphabet_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(language == collation)
+            action.triggered.connect(lambda _=False, language=language: self._settings.setValue("collation", language))
+            alphabet_group.addAction(action)
+        sort_btn.setMenu(sort_menu)
+        words_layout.addWidget(sort_btn)
+
         remove_selected_btn = QPushButton("Remove Selected")
         remove_selected_btn.setObjectName("removeSelectedButton")
         remove_selected_btn.clicked.connect(self._on_remove_selected_words)
@@ -243,22 +321,34 @@ class MainWindow(QMainWindow):
         layout.addWidget(splitter)
 
         # Install drop filter on widgets that can receive drops
-        drop_filter = DropFilter(self._load_file_sync)
-        for w in (central, splitter, viewer_container, self._document_viewer, words_panel, self._words_list):
-            w.setAcceptDrops(True)
-            w.installEventFilter(drop_filter)
+        drop_filter = DropFilter(self._open_files)
         self._drop_filter = drop_filter  # Keep reference
+        for w in (
+            central,
+            splitter,
+            viewer_container,
+            self._placeholder_viewer,
+            self._tabs,
+            words_panel,
+            self._words_list,
+        ):
+            self._accept_drops(w)
 
         self._create_toolbar()
         self._create_status_bar()
 
+    def _accept_drops(self, widget: QWidget) -> None:
+        """Let the widget accept file drops via the shared drop filter."""
+        widget.setAcceptDrops(True)
+        widget.installEventFilter(self._drop_filter)
+
     def _create_toolbar(self) -> None:
         """Create the main toolbar."""
         toolbar = QToolBar()
         toolbar.setMovable(False)
         self.addToolBar(toolbar)
 
-        open_btn = QPushButton("Open File")
+        open_btn = QPushButton("Open Files")
         open_btn.setObjectName("openButton")
         open_btn.clicked.connect(self._on_open_file)
         toolbar.addWidget(open_btn)
@@ -273,6 +363,12 @@ class MainWindow(QMainWindow):
         export_btn.clicked.connect(self._on_export_excel)
         toolbar.addWidget(export_btn)
 
+        compare_btn = QPushButton("Compare…")
+        compare_btn.setObjectName("compareButton")
+        compare_btn.setToolTip("Compare the vocabularies of two open documents")
+        compare_btn.clicked.connect(self._on_compare_vocabulary)
+        toolbar.addWidget(compare_btn)
+
         toolbar.addSeparator()
 
         # Theme toggle
@@ -301,18 +397,40 @@ class MainWindow(QMainWindow):
         self._status_bar = QStatusBar()
         self.setStatusBar(self._status_bar)
         self._status_file = QLabel("No file loaded")
+        self._status_jobs = QLabel("")
         self._status_counter = QLabel("Selected: 0")
+        self._status_metrics = QPushButton("")
+        self._status_metrics.setObjectName("metricsButton")
+        self._status_metrics.setFlat(True)
+        self._status_metrics.setToolTip("Open the diagnostics panel")
+        self._status_metrics.clicked.connect(self._on_show_diagnostics)
         self._status_bar.addWidget(self._status_file, 1)
+        self._status_bar.addPermanentWidget(self._status_metrics)
+        self._status_bar.addPermanentWidget(self._status_jobs)
         self._status_bar.addPermanentWidget(self._status_counter)
 
     def _connect_signals(self) -> None:
         """Connect widget signals."""
-        self._document_viewer.selectionFinished.connect(self._on_selection_finished)
-        self._words_list.itemSelectionChanged.connect(
+        self._words_list.selectionModel().selectionChanged.connect(
             self._on_word_list_selection_changed
         )
-        self._words_list.itemDoubleClicked.connect(self._on_word_double_clicked)
+        self._words_list.doubleClicked.connect(self._on_word_double_clicked)
+        self._word_filter.textChanged.connect(self._update_words_list)
         self._words_list.deletePressed.connect(self._on_remove_selected_words)
+        self._tabs.currentChanged.connect(self._on_current_tab_changed)
+        self._tabs.tabCloseRequested.connect(self._on_tab_close_requested)
+        self._tabs.tabBar().tabMoved.connect(self._save_manifest)
+        self._load_queue.jobStarted.connect(self._on_job_started)
+        self._load_queue.jobFinished.connect(self._on_file_loaded)
+        self._load_queue.jobFailed.connect(self._on_load_error)
+        self._load_queue.statusChanged.connect(self._update_job_status)
+
+    def paintEvent(self, event) -> None:
+        """Emit firstPainted once, after the first frame is drawn."""
+        super().paintEvent(event)
+        if not self._painted:
+            self._painted = True
+            self.firstPainted.emit()
 
     def _apply_theme(self) -> None:
         """Apply the current theme."""
@@ -327,35 +445,38 @@ class MainWindow(QMainWindow):
         self._apply_theme()
 
     def _on_update_button_clicked(self) -> None:
-        """Handle update button click: Check for update or Install."""
+        """Handle update button click: Check for update, Install, or cancel a download."""
+        if self._download_worker is not None:
+            self._download_worker.cancel()
+            return
         if self._update_download_url:
-            # Currently showing Install - open download URL
-            webbrowser.open(self._update_download_url)
-            self._update_download_url = ""
-            self._update_latest_version = ""
-            self._update_btn.setText("Check for Update")
-            self._update_btn.setToolTip("Check for new version")
+            self._start_installer_download()
             return
         self._start_update_check()
 
+    def _app_data_dir(self) -> Path:
+        return Path(QStandardPaths.writableLocation(QStandardPaths.AppDataLocation))
+
     def _start_update_check(self) -> None:
         """Start background update check."""
         if self._update_worker and self._update_worker.isRunning():
             return
         self._update_btn.setText("Checking...")
         self._update_btn.setEnabled(False)
-        self._update_worker = UpdateCheckWorker(self)
-        self._update_worker.finished.connect(self._on_update_check_finished)
+        self._update_worker = UpdateCheckWorker(self._app_data_dir() / "update_check.json", self)
+        self._update_worker.checkFinished.connect(self._on_update_check_finished)
         self._update_worker.start()
 
     def _on_update_check_finished(self, latest_version: str | None, result: str | None) -> None:
         """Handle update check result."""
+        release = self._update_worker.release if self._update_worker else None
         self._update_worker = None
         self._update_btn.setEnabled(True)
         current = QApplication.applicationVersion()
         if latest_version is not None and result:
             # Success: new version available
             if latest_version != current:
+                self._update_release = release
                 self._update_download_url = result
                 self._update_latest_version = latest_version
                 self._update_btn.setText(f"Install v{latest_version}")
@@ -372,6 +493,15 @@ class MainWindow(QMainWindow):
                     "Up to Date",
                     "You are using the latest version.",
                 )
+        elif latest_version is not None:
+            # The release has no installer attached
+            self._update_btn.setText("Check for Update")
+            QMessageBox.information(
+                self,
+                "Up to Date" if latest_version == current else "Update Available",
+                "You are using the latest version." if latest_version == current
+                else f"Version v{latest_version} is available but has no installer to download.",
+            )
         else:
             # Error
             self._update_btn.setText("Check for Update")
@@ -381,64 +511,321 @@ class MainWindow(QMainWindow):
                 f"Could not check for updates.\n{result or 'Unknown error'}",
             )
 
-    def _show_loading(self, message: str = "Loading document...") -> None:
-        """Show the loading overlay."""
-        self._loading_label.setText(message)
+    def _start_installer_download(self) -> None:
+        """Download the installer in the background; clicking again cancels."""
+        directory = QStandardPaths.writableLocation(QStandardPaths.DownloadLocation)
+        directory = Path(directory) if directory else self._app_data_dir() / "updates"
+        self._download_worker = InstallerDownloadWorker(self._update_release, directory, self)
+        self._download_worker.progress.connect(self._on_installer_progress)
+        self._download_worker.downloadFinished.connect(self._on_installer_downloaded)
+        self._update_btn.setText("Downloading...")
+        self._update_btn.setToolTip("Click to cancel; the download resumes next time")
+        self._download_worker.start()
+
+    def _on_installer_progress(self, done: int, total: int | None) -> None:
+        if total:
+            self._update_btn.setText(f"Downloading {done * 100 // total}%")
+        else:
+            self._update_btn.setText(f"Downloading {done / (1024 * 1024):.1f} MB")
+
+    def _on_installer_downloaded(self, path: str | None, error: str | None) -> None:
+        self._download_worker = None
+        if path is None:
+            # Keep the Install button, so a retry resumes the download
+            self._update_btn.setText(f"Install v{self._update_latest_version}")
+            self._update_btn.setToolTip(f"Download version {self._update_latest_version}")
+            if error != "Download cancelled":
+                QMessageBox.warning(self, "Download Failed", f"Could not download the update.\n{error}")
+            return
+        self._update_release = None
+        self._update_download_url = ""
+        self._update_latest_version = ""
+        self._update_btn.setText("Check for Update")
+        self._update_btn.setToolTip("Check for new version")
+        answer = QMessageBox.question(
+            self,
+            "Update Downloaded",
+            f"The installer was downloaded and verified:\n{path}\n\nRun it now?",
+        )
+        if answer == QMessageBox.Yes:
+            QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+
+    def _current_tab(self) -> DocumentTab | None:
+        """Return the document tab currently shown, if any."""
+        tab = self._tabs.currentWidget()
+        return tab if isinstance(tab, DocumentTab) else None
+
+    def _find_tab(self, file_path: Path) -> DocumentTab | None:
+        """Return the open tab for the given file, if any."""
+        for i in range(self._tabs.count()):
+            tab = self._tabs.widget(i)
+            if isinstance(tab, DocumentTab) and tab.file_path == file_path:
+                return tab
+        return None
+
+    def _set_tab_title(self, tab: DocumentTab, status: JobStatus) -> None:
+        """Show the job status as a tab title prefix."""
+        index = self._tabs.indexOf(tab)
+        if index < 0:
+            return
+        prefix = {
+            JobStatus.QUEUED: "… ",
+            JobStatus.RUNNING: "⟳ ",
+            JobStatus.FAILED: "⚠ ",
+        }.get(status, "")
+        self._tabs.setTabText(index, prefix + tab.file_path.name)
+        self._tabs.setTabToolTip(index, f"{tab.file_path}\n{status.value}")
+
+    def _add_tab(self, file_path: Path) -> DocumentTab:
+        """Create an empty tab for a document."""
+        tab = DocumentTab(file_path)
+        tab.viewer.selectionFinished.connect(self._on_selection_finished)
+        tab.selectionChanged.connect(lambda t=tab: self._save_selection(t))
+        self._accept_drops(tab.viewer)
+        self._tabs.addTab(tab, file_path.name)
         self._viewer_stack.setCurrentIndex(1)
-        self._open_btn.setEnabled(False)
-        QApplication.processEvents()
-
-    def _hide_loading(self) -> None:
-        """Hide the loading overlay."""
-        self._viewer_stack.setCurrentIndex(0)
-        self._open_btn.setEnabled(True)
-
-    def _load_file_sync(self, file_path: Path) -> None:
-        """Load a file in the main thread (used for drop/open)."""
-        self._show_loading()
-        worker = FileLoadWorker(file_path, self)
-        worker.finished.connect(self._on_file_loaded)
-        worker.error.connect(self._on_load_error)
-        worker.finished.connect(worker.deleteLater)
-        worker.error.connect(worker.deleteLater)
-        worker.start()
-        self._load_worker = worker
-
-    def _on_file_loaded(self, file_path: Path, text: str) -> None:
+        return tab
+
+    def _queue_load(self, tab: DocumentTab) -> None:
+        """Queue a tab's document on the shared pool."""
+        tab.show_loading(f"Queued: {tab.file_path.name}")
+        tab.job_id = self._load_queue.submit(tab.file_path)
+        self._tabs_by_job[tab.job_id] = tab
+        self._set_tab_title(tab, JobStatus.QUEUED)
+
+    def _open_files(self, file_paths: list[Path]) -> None:
+        """Open each file in its own tab and queue it on the shared pool."""
+        first_tab: DocumentTab | None = None
+        for file_path in file_paths:
+            tab = self._find_tab(file_path)
+            if tab is None:
+                tab = self._add_tab(file_path)
+                self._queue_load(tab)
+            if first_tab is None:
+                first_tab = tab
+        if first_tab is not None:
+            self._tabs.setCurrentWidget(first_tab)
+        self._save_manifest()
+
+    def _restore_session(self) -> None:
+        """Reopen the tabs of the previous session from their snapshots."""
+        documents, current = self._session.load()
+        self._restoring = True
+        try:
+            for doc in documents:
+                if self._find_tab(doc.path):
+                    continue
+                tab = self._add_tab(doc.path)
+                tab.pending_selection = doc.selected_words
+                if doc.text is not None and doc.offsets is not None:
+                    tab.set_document(doc.text, doc.offsets)
+                    self._set_tab_title(tab, JobStatus.DONE)
+                else:
+                    # Never loaded or changed on disk: read it again
+                    self._queue_load(tab)
+        finally:
+            self._restoring = False
+        if 0 <= current < self._tabs.count():
+            self._tabs.setCurrentIndex(current)
+        self._on_current_tab_changed()
+
+    def _save_manifest(self) -> None:
+        """Record open tabs and the active tab in the session."""
+        if self._restoring:
+            return
+        paths = [self._tabs.widget(i).file_path for i in range(self._tabs.count())]
+        self._session.save_manifest(paths, self._tabs.currentIndex())
+
+    def _save_selection(self, tab: DocumentTab) -> None:
+        """Persist a tab's selection after every change."""
+        if not self._restoring and tab.loaded:
+            self._session.save_selection(tab.file_path, tab.selected_words, tab.offsets)
+
+    def _on_job_started(self, job_id: int) -> None:
+        """Mark a tab as loading once its job reaches a worker thread."""
+        tab = self._tabs_by_job.get(job_id)
+        if tab:
+            tab.show_loading(f"Loading {tab.file_path.name}...")
+            self._set_tab_title(tab, JobStatus.RUNNING)
+
+    def _on_file_loaded(
+        self,
+        job_id: int,
+        file_path: Path,
+        text: str,
+        offsets: WordOffsetIndex,
+        metrics: StageRecorder,
+    ) -> None:
         """Handle successful file load."""
-        self._hide_loading()
-        self._load_worker = None
-        self._current_file = file_path
-        self._document_viewer.setPlainText(text)
-        self._all_words = WordExtractor.extract_unique_words(text)
-        self._selected_words = []
-        self._update_words_list()
-        self._status_file.setText(file_path.name)
-        self._export_btn.setEnabled(True)
-
-    def _on_load_error(self, error_msg: str) -> None:
+        tab = self._tabs_by_job.pop(job_id, None)
+        if tab is None:
+            return
+        with metrics.stage("display", "characters") as stage:
+            tab.set_document(text, offsets)
+            stage.items = len(text)
+        tab.metrics = metrics
+        self._record_metrics(metrics)
+        self._set_tab_title(tab, JobStatus.DONE)
+        self._session.save_document(file_path, text, offsets)
+        if tab is self._current_tab():
+            self._on_current_tab_changed()
+
+    def _on_load_error(self, job_id: int, error_msg: str) -> None:
         """Handle file load error."""
-        self._hide_loading()
-        self._load_worker = None
+        tab = self._tabs_by_job.pop(job_id, None)
+        if tab is None:
+            return
+        self._set_tab_title(tab, JobStatus.FAILED)
         if "Unsupported format" in error_msg:
-            QMessageBox.warning(
-                self,
-                "Unsupported Format",
-                f"Cannot open file.\nSupported: .pdf, .docx, .txt",
-            )
+            supported = ", ".join(DocumentFactory.supported_extensions())
+            tab.show_error(f"Cannot open file.\nSupported: {supported}")
         else:
-            QMessageBox.critical(
+            tab.show_error(
+                "Failed to read file. The file may be corrupted or invalid."
+                f"\n\n{error_msg}"
+            )
+        self._status_bar.showMessage(f"Failed to load {tab.file_path.name}", 5000)
+
+    def _record_metrics(self, metrics: StageRecorder) -> None:
+        """Keep a document's stage metrics and show the total in the status bar."""
+        if metrics in self._metrics_history:
+            self._metrics_history.remove(metrics)
+        self._metrics_history.append(metrics)
+        self._status_metrics.setText(f"{metrics.document}: {metrics.total_wall_ms():.0f} ms")
+        self._status_metrics.setToolTip(metrics.summary() + "\nClick for diagnostics")
+        if self._diagnostics is not None and self._diagnostics.isVisible():
+            self._diagnostics.refresh()
+
+    @Slot()
+    def _on_show_diagnostics(self) -> None:
+        """Open the per-stage diagnostics panel."""
+        if self._diagnostics is None:
+            from ui.diagnostics_panel import DiagnosticsPanel
+
+            self._diagnostics = DiagnosticsPanel(self._metrics_history, self)
+        self._diagnostics.show()
+        self._diagnostics.raise_()
+
+    @Slot()
+    def _on_compare_vocabulary(self) -> None:
+        """Open the vocabulary comparison of the loaded documents."""
+        tabs = [
+            tab for tab in (self._tabs.widget(i) for i in range(self._tabs.count()))
+            if tab.loaded and tab.offsets is not None
+        ]
+        if len(tabs) < 2:
+            QMessageBox.information(
                 self,
-                "Error",
-                f"Failed to read file. The file may be corrupted or invalid.\n\n{error_msg}",
+                "Compare Vocabulary",
+                "Open at least two documents to compare their vocabularies.",
             )
+            return
+        from processors.vocabulary_diff import Lexicon
+        from ui.vocabulary_diff_dialog import VocabularyDiffDialog
+
+        if self._lexicon is None:
+            self._lexicon = Lexicon()
+        dialog = VocabularyDiffDialog(
+            tabs, self._current_tab(), DocumentTab.vocabulary, self._lexicon, self
+        )
+        dialog.setAttribute(Qt.WA_DeleteOnClose)
+        dialog.show()
+
+    def _update_job_status(self) -> None:
+        """Show queue progress in the status bar."""
+        counts = self._load_queue.counts()
+        running = counts[JobStatus.RUNNING]
+        queued = counts[JobStatus.QUEUED]
+        if running or queued:
+            self._status_jobs.setText(f"Loading: {running} running, {queued} queued")
+        else:
+            self._status_jobs.setText("")
 
+    @Slot()
+    def _on_current_tab_changed(self) -> None:
+        """Show the word list and file name of the active tab."""
+        tab = self._current_tab()
+        if tab is None:
+            self._viewer_stack.setCurrentIndex(0)
+            self._status_file.setText("No file loaded")
+        else:
+            self._status_file.setText(tab.file_path.name)
+        self._export_btn.setEnabled(bool(tab and tab.loaded))
+        self._update_words_list()
+        self._save_manifest()
+
+    @Slot(int)
+    def _on_tab_close_requested(self, index: int) -> None:
+        """Close a tab, cancelling its load job if still pending."""
+        tab = self._tabs.widget(index)
+        if not isinstance(tab, DocumentTab):
+            return
+        if tab.job_id is not None and self._tabs_by_job.pop(tab.job_id, None):
+            self._load_queue.cancel(tab.job_id)
+        self._tabs.removeTab(index)
+        self._session.forget(tab.file_path)
+        self._save_manifest()
+        tab.deleteLater()
+
+    def closeEvent(self, event) -> None:
+        """Drop queued jobs and let running ones finish before exiting."""
+        if self._download_worker is not None:
+            self._download_worker.cancel()
+            self._download_worker.wait(3000)
+        self._load_queue.wait_for_done(3000)
+        self._save_manifest()
+        self._session.flush(5.0)
+        super().closeEvent(event)
+
+    @Slot()
     def _update_words_list(self) -> None:
-        """Refresh the selected phrases list from current selection."""
-        self._words_list.clear()
-        for phrase in self._selected_words:
-            self._words_list.addItem(QListWidgetItem(phrase))
-        self._status_counter.setText(f"Selected: {len(self._selected_words)}")
+        """Refresh the selected phrases list, applying the filter box."""
+        tab = self._current_tab()
+        if tab is None:
+            self._words_model.set_results(None, ())
+            self._status_counter.setText("Selected: 0")
+            return
+        ids = tab.selected_index.search(self._word_filter.text())
+        self._words_model.set_results(tab.selected_index, ids)
+        self._update_counter()
+
+    def _create_isolation_pool(self):
+        """Return the worker pool documents are loaded in, or None to load in-process.
+
+        A document that hangs or exhausts memory then fails alone instead of
+        taking the application down. Workers are spawned, not forked, since
+        forking a process running Qt threads is unsafe.
+        """
+        if not self._settings.value("isolatedLoading", True, type=bool):
+            return None
+        import multiprocessing
+
+        from pipeline.isolation import DEFAULT_MEMORY_LIMIT_MB, IsolatedWorkerPool
+
+        timeout = self._settings.value("loadTimeout", 120.0, type=float)
+        memory_limit = self._settings.value("loadMemoryLimitMb", DEFAULT_MEMORY_LIMIT_MB, type=int)
+        return IsolatedWorkerPool(
+            timeout=timeout or None,
+            memory_limit_mb=memory_limit or None,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+
+    def _update_counter(self) -> None:
+        """Show the selection size and, while filtering, the visible count."""
+        tab = self._current_tab()
+        total = len(tab.selected_words) if tab else 0
+        if self._word_filter.text().strip():
+            shown = self._words_model.rowCount()
+            self._status_counter.setText(f"Selected: {total} (showing {shown})")
+        else:
+            self._status_counter.setText(f"Selected: {total}")
+
+    def _selected_word_ids(self) -> list[int]:
+        """Return the index ids of the rows selected in the words list."""
+        return [
+            self._words_model.word_id(index.row())
+            for index in self._words_list.selectionModel().selectedRows()
+        ]
 
     def _extract_selected_phrase(self) -> None:
         """
@@ -453,7 +840,10 @@ class MainWindow(QMainWindow):
         - Ignore selections shorter than 2 characters
         - Prevent duplicates (case-insensitive)
         """
-        cursor = self._document_viewer.textCursor()
+        tab = self._current_tab()
+        if tab is None or not tab.loaded:
+            return
+        cursor = tab.viewer.textCursor()
         if not cursor.hasSelection():
             return
 
@@ -470,11 +860,9 @@ class MainWindow(QMainWindow):
             return
 
         # Prevent duplicates (case-insensitive)
-        lower_existing = {p.lower() for p in self._selected_words}
-        if normalized.lower() in lower_existing:
+        if not tab.add_selected_word(normalized):
             return
 
-        self._selected_words.append(normalized)
         self._update_words_list()
 
     @Slot()
@@ -484,80 +872,146 @@ class MainWindow(QMainWindow):
 
     def _on_word_list_selection_changed(self) -> None:
         """Handle selection change in words list - update counter if needed."""
-        self._status_counter.setText(f"Selected: {len(self._selected_words)}")
+        self._update_counter()
 
     @Slot()
     def _on_remove_selected_words(self) -> None:
         """Remove currently selected item(s) from the words list."""
-        selected = self._words_list.selectedItems()
-        if not selected:
+        tab = self._current_tab()
+        word_ids = self._selected_word_ids()
+        if tab is None or not word_ids:
             return
-        indices = sorted(
-            (self._words_list.row(item) for item in selected),
-            reverse=True,
-        )
-        for i in indices:
-            if 0 <= i < len(self._selected_words):
-                del self._selected_words[i]
+        tab.remove_selected_ids(word_ids)
         self._update_words_list()
 
     @Slot()
     def _on_clear_all_words(self) -> None:
         """Clear all stored phrases."""
-        if not self._selected_words:
+        tab = self._current_tab()
+        if tab is None or not tab.selected_words:
             return
-        self._selected_words.clear()
+        tab.set_selected_words([])
         self._update_words_list()
 
-    @Slot(QListWidgetItem)
-    def _on_word_double_clicked(self, item: QListWidgetItem) -> None:
+    @Slot()
+    def _on_merge_variants(self) -> None:
+        """Replace near-identical selected words (typos, OCR noise) by one form."""
+        tab = self._current_tab()
+        if tab is None or not tab.selected_words:
+            return
+        max_distance, ok = QInputDialog.getInt(
+            self,
+            "Merge Variants",
+            "Maximum edits between a variant and its main form\n"
+            "(words are allowed one edit per four letters, up to this):",
+            self._settings.value("variantDistance", 1, type=int),
+            1,
+            3,
+        )
+        if not ok:
+            return
+        self._settings.setValue("variantDistance", max_distance)
+        from processors.variant_grouping import group_variants
+
+        # The most frequent form in the document becomes the main form
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            groups = group_variants(tab.selected_words, self._selected_counts(tab), max_distance)
+        finally:
+            QApplication.restoreOverrideCursor()
+        merged = len(tab.selected_words) - len(groups)
+        if not merged:
+            self._status_bar.showMessage("No variants found", 5000)
+            return
+        tab.set_selected_words([g.canonical for g in groups])
+        self._update_words_list()
+        self._status_bar.showMessage(
+            f"Merged {merged} variants into {sum(1 for g in groups if g.variants)} words", 5000
+        )
+
+    @staticmethod
+    def _selected_counts(tab: DocumentTab) -> list[int]:
+        """Return each selected word's occurrences in the document (0 for phrases)."""
+        counts = tab.offsets.word_counts() if tab.offsets else []
+        result = []
+        for word in tab.selected_words:
+            word_id = tab.offsets.word_id(word) if tab.offsets else None
+            result.append(counts[word_id] if word_id is not None else 0)
+        return result
+
+    def _on_sort_words(self, order: str) -> None:
+        """Reorder the selected words alphabetically, by frequency, length or position."""
+        tab = self._current_tab()
+        if tab is None or not tab.selected_words:
+            return
+        from processors.collation import sort_order
+
+        words = tab.selected_words
+        QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            if order == "occurrence":
+                # Vocabulary ids follow first occurrence; phrases go last
+                ids = [tab.offsets.word_id(w) if tab.offsets else None for w in words]
+                last = len(ids)
+                positions = sorted(range(len(words)), key=lambda i: last if ids[i] is None else ids[i])
+            else:
+                language = self._settings.value("collation", "en", type=str)
+                positions = sort_order(words, self._selected_counts(tab), order, language)
+            tab.set_selected_words([words[i] for i in positions])
+        finally:
+            QApplication.restoreOverrideCursor()
+        self._update_words_list()
+
+    @Slot(QModelIndex)
+    def _on_word_double_clicked(self, index: QModelIndex) -> None:
         """Remove the double-clicked word from the list."""
-        row = self._words_list.row(item)
-        if 0 <= row < len(self._selected_words):
-            del self._selected_words[row]
+        tab = self._current_tab()
+        if tab and index.isValid():
+            tab.remove_selected_ids([self._words_model.word_id(index.row())])
             self._update_words_list()
 
     @Slot()
     def _on_open_file(self) -> None:
-        """Open file dialog and load document."""
-        path, _ = QFileDialog.getOpenFileName(
+        """Open file dialog and load the chosen documents into tabs."""
+        patterns = " ".join(f"*{ext}" for ext in DocumentFactory.supported_extensions())
+        paths, _ = QFileDialog.getOpenFileNames(
             self,
-            "Open Document",
+            "Open Documents",
             "",
-            "Documents (*.pdf *.docx *.txt);;PDF (*.pdf);;Word (*.docx);;Text (*.txt);;All (*.*)",
+            f"Documents ({patterns});;PDF (*.pdf);;Word (*.docx);;OpenDocument (*.odt);;"
+            "EPUB (*.epub);;HTML (*.html *.htm *.xhtml);;Rich Text (*.rtf);;Text (*.txt);;All (*.*)",
         )
-        if not path:
+        if not paths:
             return
-        file_path = Path(path)
-        self._load_file_sync(file_path)
+        self._open_files([Path(p) for p in paths])
 
     @Slot()
     def _on_select_all_words(self) -> None:
         """Add all unique words from document to selected list."""
-        if not self._all_words:
+        tab = self._current_tab()
+        if tab is None or not tab.all_words:
             QMessageBox.information(
                 self,
                 "No Content",
                 "Open a document first, or the document has no extractable words.",
             )
             return
-        self._selected_words = list(self._all_words)
+        tab.set_selected_words(tab.all_words)
         self._update_words_list()
         self._words_list.selectAll()
 
     @Slot()
     def _on_export_excel(self) -> None:
         """Export selected words to Excel file."""
-        if not self._selected_words:
+        tab = self._current_tab()
+        if tab is None or not tab.selected_words:
             QMessageBox.warning(
                 self,
                 "No Words",
                 "No words selected. Select text in the document or use 'Select All Words'.",
             )
             return
-        default_name = "words.xlsx"
-        if self._current_file:
-            default_name = self._current_file.stem + "_words.xlsx"
+        default_name = tab.file_path.stem + "_words.xlsx"
         path, _ = QFileDialog.getSaveFileName(
             self,
             "Export to Excel",
@@ -566,11 +1020,18 @@ class MainWindow(QMainWindow):
         )
         if not path:
             return
-        if ExcelExporter.export(self._selected_words, Path(path)):
+        from exporters.excel_exporter import ExcelExporter
+
+        metrics = tab.metrics or StageRecorder(tab.file_path.name)
+        with metrics.stage("export", "words") as stage:
+            stage.items = len(tab.selected_words)
+            exported = ExcelExporter.export(tab.selected_words, Path(path))
+        self._record_metrics(metrics)
+        if exported:
             QMessageBox.information(
                 self,
                 "Export Complete",
-                f"Exported {len(self._selected_words)} words to:\n{path}",
+                f"Exported {len(tab.selected_words)} words to:\n{path}",
             )
         else:
             QMessageBox.critical(
@@ -0,0 +1,144 @@
+"""Viewport-bound highlighting of selected word occurrences."""
+
+from typing import Iterable
+
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtGui import QColor, QTextCharFormat, QTextCursor
+from PySide6.QtWidgets import QPlainTextEdit, QTextEdit
+
+from processors.word_offsets import WordOffsetIndex
+
+
+class OccurrenceHighlighter(QObject):
+    """Highlights occurrences of selected words in a QPlainTextEdit.
+
+    Only the blocks currently on screen are styled, using the document's
+    WordOffsetIndex to find occurrences by offset instead of searching text.
+    Scrolling or resizing restyles the new viewport. Adding or removing a
+    word restyles only if that word occurs in the visible blocks; it never
+    touches the rest of the document.
+    """
+
+    HIGHLIGHT_COLOR = QColor(249, 226, 175, 110)
+
+    def __init__(self, viewer: QPlainTextEdit, parent=None) -> None:
+        super().__init__(parent or viewer)
+        self._viewer = viewer
+        self._index: WordOffsetIndex | None = None
+        self._selected_ids: set[int] = set()
+        self._visible_ids: set[int] = set()
+        self._format = QTextCharFormat()
+        self._format.setBackground(self.HIGHLIGHT_COLOR)
+
+        # Coalesce bursts of scroll/resize events into one restyle
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.refresh)
+        viewer.verticalScrollBar().valueChanged.connect(self._timer.start)
+        viewer.updateRequest.connect(self._on_update_request)
+        viewer.viewport().installEventFilter(self)
+
+    def set_index(self, index: WordOffsetIndex | None, words: Iterable[str] = ()) -> None:
+        """Attach the offset index of the shown text and the selected words."""
+        self._index = index
+        self._selected_ids = set()
+        self.words_added(words, refresh=False)
+        self.refresh()
+
+    def words_added(self, words: Iterable[str], refresh: bool = True) -> None:
+        """Highlight additional words."""
+        self._apply(words, self._selected_ids.add, refresh)
+
+    def words_removed(self, words: Iterable[str]) -> None:
+        """Stop highlighting the given words."""
+        self._apply(words, self._selected_ids.discard, True)
+
+    def _apply(self, words: Iterable[str], op, refresh: bool) -> None:
+        if self._index is None:
+            return
+        changed_visible = False
+        for word in words:
+            word_id = self._index.word_id(word)
+            if word_id is None:
+                continue  # Phrases and unknown words have no occurrences
+            op(word_id)
+            changed_visible = changed_visible or word_id in self._visible_ids
+        if refresh and changed_visible:
+            self.refresh()
+
+    def _on_update_request(self, _rect, dy: int) -> None:
+        if dy:
+            self._timer.start()
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Resize:
+            self._timer.start()
+        return super().eventFilter(obj, event)
+
+    def _visible_block_span(self) -> tuple[int, int] | None:
+        """Return the first and last text block numbers on screen."""
+        viewer = self._viewer
+        block = viewer.firstVisibleBlock()
+        if not block.isValid():
+            return None
+        first = block.blockNumber()
+        bottom = viewer.viewport().height()
+        offset = viewer.contentOffset()
+        last = first
+        while block.isValid():
+            if viewer.blockBoundingGeometry(block).translated(offset).top() > bottom:
+                break
+            last = block.blockNumber()
+            block = block.next()
+        return first, last
+
+    def refresh(self) -> None:
+        """Restyle the occurrences inside the visible blocks."""
+        index = self._index
+        if index is None or not len(index):
+            self._visible_ids = set()
+            self._viewer.setExtraSelections([])
+            return
+        span = self._visible_block_span()
+        if span is None:
+            return
+        first, last = span
+        start, end = index.line_span(first, last)
+        occurrences = index.occurrences_between(start, end)
+
+        document = self._viewer.document()
+        selected = self._selected_ids
+        visible_ids: set[int] = set()
+        selections = []
+        block = None
+        block_line = -1
+        text = ""
+        astral = False
+        for i in occurrences:
+            word_id = index.ids[i]
+            visible_ids.add(word_id)
+            if word_id not in selected:
+                continue
+            offset = index.starts[i]
+            line = index.line_of(offset)
+            if line != block_line:
+                block = document.findBlockByNumber(line)
+                block_line = line
+                text = block.text()
+                astral = len(text.encode("utf-16-le")) != 2 * len(text)
+            column = offset - index.line_starts[line]
+            length = index.word_length(word_id)
+            if astral:
+                # Qt positions count UTF-16 units; adjust for astral characters
+                length = len(text[column:column + length].encode("utf-16-le")) // 2
+                column = len(text[:column].encode("utf-16-le")) // 2
+            cursor = QTextCursor(block)
+            cursor.setPosition(block.position() + column)
+            cursor.setPosition(block.position() + column + length, QTextCursor.KeepAnchor)
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = cursor
+            selection.format = self._format
+            selections.append(selection)
+        self._visible_ids = visible_ids
+        self._viewer.setExtraSelections(selections)
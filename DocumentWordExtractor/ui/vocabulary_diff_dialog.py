@@ -0,0 +1,197 @@
+"""Dialog comparing the vocabularies of two open documents."""
+
+import time
+from pathlib import Path
+from typing import Callable, Sequence
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QComboBox,
+    QDialog,
+    QFileDialog,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QMessageBox,
+    QPushButton,
+    QTableView,
+    QTabWidget,
+    QVBoxLayout,
+)
+
+from processors.vocabulary_diff import Lexicon, Vocabulary, VocabularyDiff, diff_vocabularies
+from ui.document_tab import DocumentTab
+
+
+class DiffTableModel(QAbstractTableModel):
+    """Rows of one diff group, read from the vocabularies on demand.
+
+    ``ids`` index ``vocabulary``; ``other`` (for common words) supplies the
+    second count column.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._ids: Sequence[int] = ()
+        self._vocabulary: Vocabulary | None = None
+        self._other: Vocabulary | None = None
+        self._headers: tuple[str, ...] = ("Word", "Count")
+
+    def set_group(
+        self,
+        ids: Sequence[int],
+        vocabulary: Vocabulary,
+        headers: tuple[str, ...],
+        other: Vocabulary | None = None,
+    ) -> None:
+        self.beginResetModel()
+        self._ids, self._vocabulary, self._other, self._headers = ids, vocabulary, other, headers
+        self.endResetModel()
+
+    def words(self) -> list[str]:
+        forms = self._vocabulary.forms if self._vocabulary else []
+        return [forms[i] for i in self._ids]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._ids)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._headers)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return None
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if not index.isValid() or self._vocabulary is None:
+            return None
+        if role == Qt.TextAlignmentRole and index.column() > 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        if role != Qt.DisplayRole:
+            return None
+        word_id = self._ids[index.row()]
+        if index.column() == 0:
+            return self._vocabulary.forms[word_id]
+        if index.column() == 1:
+            return f"{self._vocabulary.counts[word_id]:,}"
+        return f"{self._other.count(self._vocabulary.forms[word_id]):,}"
+
+
+class VocabularyDiffDialog(QDialog):
+    """Shows the words added, removed and kept between two open documents."""
+
+    def __init__(
+        self,
+        tabs: list[DocumentTab],
+        current: DocumentTab | None,
+        vocabulary_of: Callable[[DocumentTab], Vocabulary],
+        lexicon: Lexicon,
+        parent=None,
+    ) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("Compare Vocabulary")
+        self.resize(640, 520)
+        self._tabs = tabs
+        self._vocabulary_of = vocabulary_of
+        self._lexicon = lexicon
+        self._diff: VocabularyDiff | None = None
+
+        layout = QVBoxLayout(self)
+        pick = QHBoxLayout()
+        self._base = QComboBox()
+        self._target = QComboBox()
+        for tab in tabs:
+            self._base.addItem(tab.file_path.name)
+            self._target.addItem(tab.file_path.name)
+        swap_btn = QPushButton("⇄")
+        swap_btn.setToolTip("Swap the documents")
+        swap_btn.clicked.connect(self._on_swap)
+        pick.addWidget(QLabel("Base:"))
+        pick.addWidget(self._base, 1)
+        pick.addWidget(swap_btn)
+        pick.addWidget(QLabel("Compared:"))
+        pick.addWidget(self._target, 1)
+        layout.addLayout(pick)
+
+        self._summary = QLabel()
+        layout.addWidget(self._summary)
+
+        self._groups = QTabWidget()
+        self._models = []
+        for title in ("Added", "Removed", "Common"):
+            model = DiffTableModel(self)
+            view = QTableView()
+            view.setModel(model)
+            view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+            view.setSelectionBehavior(QAbstractItemView.SelectRows)
+            view.verticalHeader().setVisible(False)
+            view.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+            self._groups.addTab(view, title)
+            self._models.append(model)
+        layout.addWidget(self._groups, 1)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch(1)
+        export_btn = QPushButton("Export List…")
+        export_btn.setToolTip("Export the words of the shown list to Excel")
+        export_btn.clicked.connect(self._on_export)
+        buttons.addWidget(export_btn)
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.close)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+        target = tabs.index(current) if current in tabs else len(tabs) - 1
+        self._target.setCurrentIndex(target)
+        self._base.setCurrentIndex(target - 1 if target > 0 else min(1, len(tabs) - 1))
+        self._base.currentIndexChanged.connect(self._compare)
+        self._target.currentIndexChanged.connect(self._compare)
+        self._compare()
+
+    def _on_swap(self) -> None:
+        base, target = self._base.currentIndex(), self._target.currentIndex()
+        self._base.blockSignals(True)
+        self._base.setCurrentIndex(target)
+        self._base.blockSignals(False)
+        self._target.setCurrentIndex(base)
+        self._compare()
+
+    def _compare(self) -> None:
+        base_tab = self._tabs[self._base.currentIndex()]
+        target_tab = self._tabs[self._target.currentIndex()]
+        start = time.perf_counter()
+        base, target = self._vocabulary_of(base_tab), self._vocabulary_of(target_tab)
+        self._diff = diff = diff_vocabularies(base, target, self._lexicon)
+        elapsed = (time.perf_counter() - start) * 1000
+        added, removed, common = self._models
+        added.set_group(diff.added_ids, target, ("Word", "Count"))
+        removed.set_group(diff.removed_ids, base, ("Word", "Count"))
+        common.set_group(diff.common_ids, base, ("Word", "Base", "Compared"), target)
+        counts = diff.summary()
+        for i, key in enumerate(("added", "removed", "common")):
+            self._groups.setTabText(i, f"{key.capitalize()} ({counts[key]:,})")
+        self._summary.setText(
+            f"{len(base):,} → {len(target):,} unique words, compared in {elapsed:.0f} ms"
+        )
+
+    def _on_export(self) -> None:
+        model = self._models[self._groups.currentIndex()]
+        words = model.words()
+        if not words:
+            return
+        group = ("added", "removed", "common")[self._groups.currentIndex()]
+        target = self._tabs[self._target.currentIndex()]
+        path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export List",
+            f"{target.file_path.stem}_{group}_words.xlsx",
+            "Excel (*.xlsx);;All (*.*)",
+        )
+        if not path:
+            return
+        from exporters.excel_exporter import ExcelExporter
+
+        if not ExcelExporter.export(words, Path(path)):
+            QMessageBox.critical(self, "Export Failed", "Could not save the Excel file.")
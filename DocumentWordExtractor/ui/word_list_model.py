@@ -0,0 +1,41 @@
+"""List model showing a filtered view of a WordIndex."""
+
+from typing import Sequence
+
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+from processors.word_index import WordIndex
+
+
+class WordListModel(QAbstractListModel):
+    """Read-only model whose rows are word ids from a WordIndex.
+
+    Rows are looked up lazily, so showing a million-word result set costs a
+    single list assignment rather than creating one item per word.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._index: WordIndex | None = None
+        self._ids: Sequence[int] = ()
+
+    def set_results(self, index: WordIndex | None, ids: Sequence[int]) -> None:
+        """Replace the shown rows with the given ids of ``index``."""
+        self.beginResetModel()
+        self._index = index
+        self._ids = ids
+        self.endResetModel()
+
+    def word_id(self, row: int) -> int:
+        """Return the WordIndex id shown at the given row."""
+        return self._ids[row]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        if parent.isValid() or self._index is None:
+            return 0
+        return len(self._ids)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and self._index is not None and index.isValid():
+            return self._index.word(self._ids[index.row()])
+        return None
@@ -0,0 +1,77 @@
+"""Cheap content fingerprints for source documents."""
+
+import hashlib
+import os
+from pathlib import Path
+
+# Bytes hashed from the start, middle and end of large files
+SAMPLE_SIZE = 64 * 1024
+
+
+def fingerprint_file(file_path: Path, full: bool = False) -> str:
+    """Return a hex fingerprint of a file's content.
+
+    By default only the size plus the first, middle and last ``SAMPLE_SIZE``
+    bytes are hashed, which is constant-time for any file size and catches
+    rewrites, appends and truncations. Pass ``full=True`` to hash everything.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    size = os.path.getsize(file_path)
+    h.update(size.to_bytes(8, "little"))
+    with open(file_path, "rb") as f:
+        if full or size <= 3 * SAMPLE_SIZE:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                h.update(chunk)
+        else:
+            for offset in (0, size // 2 - SAMPLE_SIZE // 2, size - SAMPLE_SIZE):
+                f.seek(offset)
+                h.update(f.read(SAMPLE_SIZE))
+    return h.hexdigest()
+
+
+def stat_signature(file_path: Path) -> tuple[int, int] | None:
+    """Return (size, mtime_ns) for quick change checks, or None if missing."""
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+
+def source_signature(file_path: Path) -> dict:
+    """Return the ``stat`` and ``fingerprint`` to store with data derived from a file.
+
+    The fingerprint hashes the whole file, so ``source_unchanged`` can rely
+    on it once the stat signature differs. Both are None if the file is
+    missing.
+
+    Raises:
+        OSError: If the file cannot be read.
+    """
+    signature = stat_signature(file_path)
+    return {
+        "stat": list(signature) if signature else None,
+        "fingerprint": fingerprint_file(file_path, full=True) if signature else None,
+    }
+
+
+def source_unchanged(file_path: Path, header: dict) -> bool | None:
+    """Tell whether a file still matches the ``source_signature`` in ``header``.
+
+    The stat signature is checked first. If it differs, e.g. after a touch
+    or a copy, the whole file is hashed: a sampled fingerprint misses
+    same-size edits between its samples. Returns None if the file is
+    missing or cannot be read.
+    """
+    signature = stat_signature(file_path)
+    if signature is None:
+        return None
+    if header.get("stat") and tuple(header["stat"]) == signature:
+        return True
+    try:
+        return fingerprint_file(file_path, full=True) == header.get("fingerprint")
+    except OSError:
+        return None
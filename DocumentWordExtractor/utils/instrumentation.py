@@ -0,0 +1,160 @@
+"""Per-stage timing and memory instrumentation for document processing."""
+
+import json
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+@dataclass
+class StageMetrics:
+    """Measurements of one processing stage.
+
+    With memory tracing on, ``peak_kb`` is the tracemalloc peak during the
+    stage above what was allocated when it started; otherwise it is the
+    process peak RSS so far (``memory_source`` tells which). ``items``
+    counts what the stage processed, in ``unit``.
+    """
+
+    stage: str
+    wall_ms: float
+    cpu_ms: float
+    peak_kb: int | None = None
+    memory_source: str = ""
+    items: int | None = None
+    unit: str = ""
+
+
+class _StageCounter:
+    """Handle yielded by ``StageRecorder.stage`` to report processed items."""
+
+    __slots__ = ("items",)
+
+    def __init__(self) -> None:
+        self.items: int | None = None
+
+
+def _peak_rss_kb() -> int | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+class StageRecorder:
+    """Records the stages of processing one document.
+
+    Wall time uses ``perf_counter`` and CPU time ``thread_time``, since every
+    stage runs on a single thread. Set ``trace_memory`` to measure each
+    stage's allocation peak with tracemalloc; it slows allocation-heavy code
+    noticeably, so by default only the (free) peak RSS is recorded.
+    """
+
+    def __init__(self, document: str = "", trace_memory: bool = False) -> None:
+        self.document = document
+        self.trace_memory = trace_memory
+        self.stages: list[StageMetrics] = []
+
+    @contextmanager
+    def stage(self, name: str, unit: str = "") -> Iterator[_StageCounter]:
+        """Time the enclosed block as stage ``name``."""
+        counter = _StageCounter()
+        tracing = self.trace_memory and tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        wall = time.perf_counter()
+        cpu = time.thread_time()
+        try:
+            yield counter
+        finally:
+            cpu_ms = (time.thread_time() - cpu) * 1000
+            wall_ms = (time.perf_counter() - wall) * 1000
+            if tracing:
+                peak = tracemalloc.get_traced_memory()[1] - base
+                peak_kb, source = peak // 1024, "tracemalloc"
+            else:
+                peak_kb = _peak_rss_kb()
+                source = "rss" if peak_kb is not None else ""
+            self.add(StageMetrics(
+                name, round(wall_ms, 3), round(cpu_ms, 3), peak_kb, source, counter.items, unit,
+            ))
+
+    def add(self, metrics: StageMetrics) -> None:
+        """Record a stage, replacing an earlier run of the same stage."""
+        self.stages = [s for s in self.stages if s.stage != metrics.stage]
+        self.stages.append(metrics)
+
+    def total_wall_ms(self) -> float:
+        return sum(s.wall_ms for s in self.stages)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "document": self.document,
+            "total_ms": round(self.total_wall_ms(), 3),
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def to_json_line(self) -> str:
+        return json.dumps(self.as_dict(), ensure_ascii=False)
+
+    def summary(self) -> str:
+        """Return a one-line human-readable breakdown."""
+        return " · ".join(f"{s.stage} {s.wall_ms:.0f} ms" for s in self.stages)
+
+
+@contextmanager
+def memory_tracing() -> Iterator[None]:
+    """Enable tracemalloc for the enclosed block unless already enabled."""
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start()
+    try:
+        yield
+    finally:
+        if started:
+            tracemalloc.stop()
+
+
+def profile_call(func: Callable, *args, output: Path, engine: str = "cprofile", **kwargs) -> Any:
+    """Run ``func`` under a profiler and save the profile to ``output``.
+
+    ``cprofile`` writes pstats data (open with ``python -m pstats`` or
+    snakeviz); ``pyinstrument`` writes an HTML report.
+
+    Raises:
+        RuntimeError: If pyinstrument is requested but not installed.
+        ValueError: If the engine is unknown.
+    """
+    if engine == "cprofile":
+        import cProfile
+
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(func, *args, **kwargs)
+        finally:
+            profiler.dump_stats(output)
+    if engine == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError as e:
+            raise RuntimeError(
+                "pyinstrument is not installed. Install with: pip install pyinstrument"
+            ) from e
+        profiler = Profiler()
+        profiler.start()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.stop()
+            Path(output).write_text(profiler.output_html(), encoding="utf-8")
+    raise ValueError(f"Unknown profiler: {engine}")
@@ -0,0 +1,321 @@
+"""Compact on-disk snapshots of the open workspace for instant restore."""
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import threading
+import zlib
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+
+from processors.word_offsets import WordOffsetIndex
+from utils.fingerprint import source_signature, source_unchanged
+
+DOC_MAGIC = b"DWEDOC01"
+SEL_MAGIC = b"DWESEL01"
+MANIFEST_NAME = "session.json"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionDocument:
+    """One restored tab. ``offsets``/``text`` are None if only a path was saved."""
+
+    path: Path
+    text: str | None = None
+    offsets: WordOffsetIndex | None = None
+    selected_words: list[str] | None = None
+    source_changed: bool = False
+
+
+def document_key(file_path: Path) -> str:
+    """Return the snapshot file stem used for a source path."""
+    return hashlib.blake2b(str(file_path).encode("utf-8"), digest_size=10).hexdigest()
+
+
+def _u32(values) -> bytes:
+    data = array("I", values)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+def _pad(buf: bytearray) -> None:
+    """Align the next section to 8 bytes so it can be cast in place."""
+    buf.extend(b"\0" * (-len(buf) % 8))
+
+
+def _cast_u32(view: memoryview):
+    """View little-endian uint32 bytes as integers (copying on big-endian)."""
+    if sys.byteorder == "little":
+        return view.cast("I")
+    data = array("I", bytes(view))
+    data.byteswap()
+    return data
+
+
+def _copy_u32(view: memoryview) -> array:
+    """Copy little-endian uint32 bytes into an array."""
+    data = array("I")
+    data.frombytes(view)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data
+
+
+def encode_document(file_path: Path, text: str, offsets: WordOffsetIndex) -> bytes:
+    """Serialize a loaded document.
+
+    Layout: magic, u32 header length, JSON header, then 8-byte aligned
+    sections: zlib text, NUL-joined vocabulary, and the occurrence start,
+    occurrence word id and line start tables as uint32 arrays. The header
+    holds the source path, its fingerprint and each section's byte range.
+    """
+    sections = [
+        ("text", zlib.compress(text.encode("utf-8"), 1)),
+        ("vocab", "\0".join(offsets.unique_words()).encode("utf-8")),
+        ("starts", _u32(offsets.starts)),
+        ("ids", _u32(offsets.ids)),
+        ("lines", _u32(offsets.line_starts)),
+    ]
+    header = {
+        "path": str(file_path),
+        **source_signature(file_path),
+        "sections": {},
+    }
+    # Offsets are relative to the end of the header block
+    pos = 0
+    for name, data in sections:
+        pos += -pos % 8
+        header["sections"][name] = [pos, len(data)]
+        pos += len(data)
+
+    head = json.dumps(header).encode("utf-8")
+    buf = bytearray(DOC_MAGIC)
+    buf += struct.pack("<I", len(head))
+    buf += head
+    _pad(buf)
+    base = len(buf)
+    for name, data in sections:
+        _pad(buf)
+        assert len(buf) - base == header["sections"][name][0]
+        buf += data
+    return bytes(buf)
+
+
+def encode_selection(words: list[str], offsets: WordOffsetIndex | None) -> bytes:
+    """Serialize a selection as vocabulary ids.
+
+    Words found in the document vocabulary are stored as their id; other
+    phrases are appended as text and referenced with ids past the vocabulary.
+    """
+    vocab = offsets.unique_words() if offsets else []
+    vocab_size = len(vocab)
+    ids: list[int] = []
+    extra: list[str] = []
+    for word in words:
+        word_id = offsets.word_id(word) if offsets else None
+        if word_id is None or vocab[word_id] != word:
+            ids.append(vocab_size + len(extra))
+            extra.append(word)
+        else:
+            ids.append(word_id)
+    extra_blob = "\0".join(extra).encode("utf-8")
+    return (
+        SEL_MAGIC
+        + struct.pack("<III", vocab_size, len(ids), len(extra_blob))
+        + _u32(ids)
+        + extra_blob
+    )
+
+
+def decode_header(view: memoryview) -> tuple[dict, int]:
+    """Return a document snapshot's header and the offset of its sections."""
+    if bytes(view[:8]) != DOC_MAGIC:
+        raise ValueError("Not a document snapshot")
+    (head_len,) = struct.unpack_from("<I", view, 8)
+    header = json.loads(bytes(view[12:12 + head_len]))
+    base = 12 + head_len
+    return header, base + (-base % 8)
+
+
+def decode_document(view: memoryview, copy: bool = False) -> tuple[dict, str, WordOffsetIndex]:
+    """Parse a document snapshot.
+
+    Integer tables stay views into ``view`` unless ``copy`` is set, in
+    which case nothing refers to ``view`` afterwards.
+    """
+    header, base = decode_header(view)
+    table = _copy_u32 if copy else _cast_u32
+
+    def section(name: str) -> memoryview:
+        start, length = header["sections"][name]
+        return view[base + start:base + start + length]
+
+    text = zlib.decompress(section("text")).decode("utf-8")
+    vocab = bytes(section("vocab")).decode("utf-8")
+    forms = vocab.split("\0") if vocab else []
+    offsets = WordOffsetIndex.from_arrays(
+        forms,
+        table(section("starts")),
+        table(section("ids")),
+        table(section("lines")),
+    )
+    return header, text, offsets
+
+
+def decode_selection(data: bytes, offsets: WordOffsetIndex | None) -> list[str]:
+    """Turn a stored selection back into words."""
+    if data[:8] != SEL_MAGIC:
+        raise ValueError("Not a selection snapshot")
+    vocab_size, count, extra_len = struct.unpack_from("<III", data, 8)
+    ids = _cast_u32(memoryview(data)[20:20 + 4 * count])
+    blob = data[20 + 4 * count:20 + 4 * count + extra_len].decode("utf-8")
+    extra = blob.split("\0") if blob else []
+    vocab = offsets.unique_words() if offsets else []
+    if len(vocab) != vocab_size:
+        vocab = []  # Document changed; only the literal phrases survive
+    words = []
+    for i in ids:
+        if i >= vocab_size:
+            words.append(extra[i - vocab_size])
+        elif vocab:
+            words.append(vocab[i])
+    return words
+
+
+class SessionStore:
+    """Persists open tabs to a directory of compact binary snapshots.
+
+    Each document is written once after it loads (``<key>.doc``) and its
+    selection separately (``<key>.sel``), so editing the selection only
+    rewrites a small ID array. A JSON manifest records tab order. All writes
+    happen on a background thread; repeated saves of the same file are
+    coalesced to the latest state. Files are replaced atomically.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._pending: dict[str, tuple] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = threading.Thread(target=self._run, name="session-writer", daemon=True)
+        self._thread.start()
+
+    # -- saving ---------------------------------------------------------
+
+    def save_manifest(self, paths: list[Path], current: int) -> None:
+        """Record the open tabs in order and the active tab index."""
+        manifest = {"tabs": [str(p) for p in paths], "current": current}
+        self._enqueue(MANIFEST_NAME, ("manifest", manifest))
+
+    def save_document(self, file_path: Path, text: str, offsets: WordOffsetIndex) -> None:
+        """Snapshot a loaded document (text, vocabulary and offsets)."""
+        self._enqueue(document_key(file_path) + ".doc", ("doc", file_path, text, offsets))
+
+    def save_selection(self, file_path: Path, words: list[str], offsets: WordOffsetIndex | None) -> None:
+        """Snapshot a tab's selected words."""
+        self._enqueue(document_key(file_path) + ".sel", ("sel", list(words), offsets))
+
+    def forget(self, file_path: Path) -> None:
+        """Delete the snapshots of a closed tab."""
+        key = document_key(file_path)
+        self._enqueue(key + ".doc", ("delete",))
+        self._enqueue(key + ".sel", ("delete",))
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wait until all queued writes are on disk."""
+        self._wake.set()
+        return self._idle.wait(timeout)
+
+    def _enqueue(self, name: str, job: tuple) -> None:
+        with self._lock:
+            self._pending[name] = job
+            self._idle.clear()
+        self._wake.set()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            while True:
+                with self._lock:
+                    if not self._pending:
+                        self._idle.set()
+                        break
+                    name, job = next(iter(self._pending.items()))
+                    del self._pending[name]
+                try:
+                    self._write(name, job)
+                except Exception:
+                    # A lost snapshot only costs a reload from source
+                    logger.warning("Could not write session file %s", name, exc_info=True)
+
+    def _write(self, name: str, job: tuple) -> None:
+        target = self.directory / name
+        kind = job[0]
+        if kind == "delete":
+            target.unlink(missing_ok=True)
+            return
+        if kind == "manifest":
+            data = json.dumps(job[1]).encode("utf-8")
+        elif kind == "doc":
+            data = encode_document(*job[1:])
+        else:
+            data = encode_selection(*job[1:])
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(target.suffix + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, target)
+
+    # -- restoring ------------------------------------------------------
+
+    def load(self) -> tuple[list[SessionDocument], int]:
+        """Restore the saved tabs and the active tab index.
+
+        Snapshots are memory-mapped while they are read and their tables
+        copied out, so no map outlives ``load``: Windows cannot replace or
+        delete a file that is still mapped. A document whose source changed
+        since the snapshot comes back with ``source_changed`` set and no
+        text, so the caller reloads it.
+        """
+        try:
+            manifest = json.loads((self.directory / MANIFEST_NAME).read_bytes())
+        except (OSError, ValueError):
+            return [], 0
+
+        documents = []
+        for path_str in manifest.get("tabs", []):
+            path = Path(path_str)
+            key = document_key(path)
+            doc = SessionDocument(path)
+            offsets = None
+            try:
+                with open(self.directory / (key + ".doc"), "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        header, text, offsets = decode_document(memoryview(mm), copy=True)
+                # A missing source leaves the snapshot as all there is
+                if source_unchanged(path, header) is not False:
+                    doc.text, doc.offsets = text, offsets
+                else:
+                    doc.source_changed = True
+            except (OSError, ValueError, KeyError, zlib.error):
+                pass
+            try:
+                # A changed source still maps the old selection ids to words
+                data = (self.directory / (key + ".sel")).read_bytes()
+                doc.selected_words = decode_selection(data, offsets)
+            except (OSError, ValueError, struct.error):
+                pass
+            documents.append(doc)
+        return documents, int(manifest.get("current", 0))
+
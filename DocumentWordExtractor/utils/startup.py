@@ -0,0 +1,126 @@
+"""Startup instrumentation and background warm-up of heavy modules."""
+
+import importlib
+import sys
+import threading
+import time
+from importlib.abc import MetaPathFinder
+
+# Modules only needed after the first user action (open, export, update)
+WARM_MODULES: tuple[str, ...] = (
+    "fitz",
+    "docx",
+    "openpyxl",
+    "requests",
+    "exporters.excel_exporter",
+)
+
+
+class _TimedLoader:
+    """Wraps a module loader and records how long ``exec_module`` takes."""
+
+    def __init__(self, loader, timer: "ImportTimer", name: str):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        start = time.perf_counter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.record(self._name, time.perf_counter() - start)
+
+
+class ImportTimer(MetaPathFinder):
+    """Meta path finder that times every module import made while installed.
+
+    Times are inclusive: a module's time contains the imports it triggers.
+    """
+
+    def __init__(self) -> None:
+        self.timings: dict[str, float] = {}
+        self._local = threading.local()
+
+    def install(self) -> None:
+        sys.meta_path.insert(0, self)
+
+    def uninstall(self) -> None:
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def record(self, name: str, seconds: float) -> None:
+        self.timings[name] = self.timings.get(name, 0.0) + seconds
+
+    def find_spec(self, fullname, path=None, target=None):
+        if getattr(self._local, "busy", False):
+            return None
+        self._local.busy = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                        spec.loader = _TimedLoader(spec.loader, self, fullname)
+                    return spec
+            return None
+        finally:
+            self._local.busy = False
+
+
+class StartupProfiler:
+    """Collects startup milestones and per-module import costs."""
+
+    def __init__(self, t0: float | None = None) -> None:
+        self.t0 = time.perf_counter() if t0 is None else t0
+        self.marks: list[tuple[str, float]] = []
+        self.import_timer = ImportTimer()
+
+    def start(self) -> None:
+        self.import_timer.install()
+
+    def mark(self, name: str) -> float:
+        """Record a milestone and return milliseconds since start."""
+        elapsed = (time.perf_counter() - self.t0) * 1000
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def elapsed_ms(self, name: str) -> float | None:
+        for mark, ms in self.marks:
+            if mark == name:
+                return ms
+        return None
+
+    def report(self, top: int = 15) -> str:
+        """Return a human-readable startup report."""
+        lines = ["Startup milestones (ms since launch):"]
+        lines += [f"  {ms:9.1f}  {name}" for name, ms in self.marks]
+        lines.append(f"Slowest imports (inclusive ms, top {top}):")
+        slowest = sorted(
+            self.import_timer.timings.items(), key=lambda kv: kv[1], reverse=True
+        )[:top]
+        lines += [f"  {sec * 1000:9.1f}  {name}" for name, sec in slowest]
+        return "\n".join(lines)
+
+
+def warm_modules_in_background(modules: tuple[str, ...] = WARM_MODULES) -> threading.Thread:
+    """Import heavy modules on a daemon thread so first use is fast."""
+
+    def _warm():
+        for name in modules:
+            try:
+                importlib.import_module(name)
+            except Exception:
+                pass  # Missing optional dependencies surface on first real use
+
+    thread = threading.Thread(target=_warm, name="module-warmup", daemon=True)
+    thread.start()
+    return thread
@@ -138,7 +138,7 @@ QProgressBar::chunk {
 }
 
 /* List widget for selected words */
-QListWidget {
+QListView {
     background-color: #11111b;
     color: #cdd6f4;
     border: 1px solid #313244;
@@ -147,21 +147,21 @@ QListWidget {
     outline: none;
 }
 
-QListWidget::item {
+QListView::item {
     padding: 8px 12px;
     border-radius: 4px;
 }
 
-QListWidget::item:hover {
+QListView::item:hover {
     background-color: #313244;
 }
 
-QListWidget::item:selected {
+QListView::item:selected {
     background-color: #89b4fa;
     color: #1e1e2e;
 }
 
-QListWidget::item:selected:!active {
+QListView::item:selected:!active {
     background-color: #45475a;
 }
 
@@ -172,6 +172,19 @@ QFrame#wordsPanel {
     border-radius: 0;
 }
 
+/* Word filter box */
+QLineEdit#wordFilter {
+    background-color: #11111b;
+    color: #cdd6f4;
+    border: 1px solid #313244;
+    border-radius: 6px;
+    padding: 6px 8px;
+}
+
+QLineEdit#wordFilter:focus {
+    border: 1px solid #89b4fa;
+}
+
 /* Status bar */
 QStatusBar {
     background-color: #181825;
@@ -372,7 +385,7 @@ QProgressBar::chunk {
 }
 
 /* List widget for selected words */
-QListWidget {
+QListView {
     background-color: #ffffff;
     color: #4c4f69;
     border: 1px solid #ccd0da;
@@ -381,21 +394,21 @@ QListWidget {
     outline: none;
 }
 
-QListWidget::item {
+QListView::item {
     padding: 8px 12px;
     border-radius: 4px;
 }
 
-QListWidget::item:hover {
+QListView::item:hover {
     background-color: #e6e9ef;
 }
 
-QListWidget::item:selected {
+QListView::item:selected {
     background-color: #1e66f5;
     color: #ffffff;
 }
 
-QListWidget::item:selected:!active {
+QListView::item:selected:!active {
     background-color: #acb0be;
 }
 
@@ -406,6 +419,19 @@ QFrame#wordsPanel {
     border-radius: 0;
 }
 
+/* Word filter box */
+QLineEdit#wordFilter {
+    background-color: #ffffff;
+    color: #4c4f69;
+    border: 1px solid #ccd0da;
+    border-radius: 6px;
+    padding: 6px 8px;
+}
+
+QLineEdit#wordFilter:focus {
+    border: 1px solid #1e66f5;
+}
+
 /* Status bar */
 QStatusBar {
     background-color: #e6e9ef;
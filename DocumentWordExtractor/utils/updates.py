@@ -0,0 +1,328 @@
+"""Cached release checks and resumable, verified installer downloads.
+
+``UpdateChecker`` remembers the last release it saw in a small JSON file,
+together with the response's ``ETag`` and ``Last-Modified``. Checks
+within ``min_interval`` of the previous one are answered from that file
+without a request. Later checks send ``If-None-Match`` and
+``If-Modified-Since``; an unchanged release then costs a bodyless 304
+(which GitHub does not count against the rate limit).
+
+``download_installer`` streams the installer to ``<name>.part`` in
+chunks, hashing as it writes. An interrupted download resumes with a
+``Range`` request guarded by ``If-Range``, so a file that changed on the
+server is fetched again from the start. The file gets its final name only
+once its size and SHA-256 match the release.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Callable
+
+CHUNK_SIZE = 256 * 1024
+# Seconds between checks that actually contact the server
+MIN_CHECK_INTERVAL = 15 * 60
+TIMEOUT = (5.0, 30.0)
+# Release assets that may hold the installer's checksum
+CHECKSUM_ASSETS = ("SHA256SUMS", "SHA256SUMS.txt", "checksums.txt")
+
+
+class UpdateError(RuntimeError):
+    """A release check or installer download failed."""
+
+
+class ChecksumMismatchError(UpdateError):
+    """The downloaded installer does not match the release's checksum."""
+
+
+@dataclass
+class Release:
+    """The latest release and its installer asset."""
+
+    version: str
+    download_url: str = ""
+    asset_name: str = ""
+    size: int | None = None
+    sha256: str | None = None
+    checksum_url: str = ""  # Checksum asset to read when the API gives no digest
+
+    @classmethod
+    def from_api(cls, release: dict) -> "Release":
+        """Build a release from a GitHub ``releases/latest`` response."""
+        version = release.get("tag_name", "").lstrip("v")
+        assets = release.get("assets") or []
+        checksums = {a.get("name", ""): a for a in assets}
+        installers = [a for a in assets if not _is_checksum_asset(a.get("name", ""))]
+        if not installers:
+            return cls(version)
+        asset = installers[0]
+        name = asset.get("name", "")
+        digest = asset.get("digest") or ""
+        checksum = checksums.get(name + ".sha256") or next(
+            (checksums[n] for n in CHECKSUM_ASSETS if n in checksums), None
+        )
+        return cls(
+            version=version,
+            download_url=asset.get("browser_download_url", ""),
+            asset_name=name,
+            size=asset.get("size"),
+            sha256=digest[7:].lower() if digest.startswith("sha256:") else None,
+            checksum_url=checksum.get("browser_download_url", "") if checksum else "",
+        )
+
+
+def _is_checksum_asset(name: str) -> bool:
+    return name in CHECKSUM_ASSETS or name.lower().endswith(".sha256")
+
+
+def _session():
+    import requests
+
+    session = requests.Session()
+    session.headers["User-Agent"] = "DocumentWordExtractor"
+    return session
+
+
+class UpdateChecker:
+    """Checks for the latest release with conditional, cached requests.
+
+    ``cache_path`` is a JSON file holding the last release seen and its
+    validators; it is created on the first successful check.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        cache_path: Path,
+        min_interval: float = MIN_CHECK_INTERVAL,
+        session=None,
+    ) -> None:
+        self.api_url = api_url
+        self.cache_path = Path(cache_path)
+        self.min_interval = min_interval
+        self.session = session or _session()
+        # How the last check was answered: "cache", "not-modified" or "fetched"
+        self.last_source = ""
+
+    def _load(self) -> dict:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                cache = json.load(f)
+            release = cache.get("release")
+            # A cache written with other Release fields is treated as missing
+            if (
+                cache.get("url") == self.api_url
+                and isinstance(release, dict)
+                and set(release) == {f.name for f in fields(Release)}
+            ):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _save(self, cache: dict) -> None:
+        """Replace the cache file atomically; failures only cost a full request next time."""
+        tmp = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(cache, f)
+            os.replace(tmp, self.cache_path)
+        except OSError:
+            pass
+
+    def check(self, force: bool = False) -> Release:
+        """Return the latest release, asking the server at most every ``min_interval`` seconds.
+
+        ``force`` skips the interval but still sends a conditional request.
+
+        Raises:
+            UpdateError: If the server cannot be reached or answers with an error.
+        """
+        import requests
+
+        cache = self._load()
+        now = time.time()
+        if cache and not force and 0 <= now - cache.get("checked_at", 0) < self.min_interval:
+            self.last_source = "cache"
+            return Release(**cache["release"])
+        headers = {"Accept": "application/vnd.github+json"}
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("last_modified"):
+            headers["If-Modified-Since"] = cache["last_modified"]
+        try:
+            response = self.session.get(self.api_url, headers=headers, timeout=TIMEOUT)
+            if response.status_code == 304 and cache:
+                self.last_source = "not-modified"
+                cache["checked_at"] = now
+                self._save(cache)
+                return Release(**cache["release"])
+            response.raise_for_status()
+            release = Release.from_api(response.json())
+        except (requests.RequestException, ValueError) as e:
+            raise UpdateError(str(e)) from e
+        self.last_source = "fetched"
+        self._save({
+            "url": self.api_url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "checked_at": now,
+            "release": asdict(release),
+        })
+        return release
+
+
+def fetch_checksum(release: Release, session=None) -> str | None:
+    """Return the installer's SHA-256, from the release or its checksum asset."""
+    import requests
+
+    if release.sha256 or not release.checksum_url:
+        return release.sha256
+    session = session or _session()
+    try:
+        response = session.get(release.checksum_url, timeout=TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        raise UpdateError(f"Could not fetch the checksum: {e}") from e
+    # "<hex>  <name>" lines (sha256sum format), or a bare digest
+    for line in response.text.splitlines():
+        parts = line.split()
+        if not parts or len(parts[0]) != 64:
+            continue
+        if len(parts) == 1 or parts[-1].lstrip("*") == release.asset_name:
+            return parts[0].lower()
+    raise UpdateError(f"No checksum for {release.asset_name} in {release.checksum_url}")
+
+
+def download_installer(
+    release: Release,
+    directory: Path,
+    on_progress: Callable[[int, int | None], None] | None = None,
+    cancel: threading.Event | None = None,
+    session=None,
+) -> Path:
+    """Download the release's installer into ``directory`` and verify it.
+
+    A ``.part`` file left by an earlier attempt is resumed; one that is
+    already complete is only verified. ``on_progress``
+    is called with the bytes received so far and the total size (None if
+    unknown). Setting ``cancel`` stops the download, keeping the part file
+    for the next attempt. If the release publishes no checksum, only the
+    size is verified. Returns the installer's path.
+
+    Raises:
+        ChecksumMismatchError: If the file does not match the release's SHA-256.
+        UpdateError: If the download fails or is cancelled.
+    """
+    import requests
+
+    if not release.download_url:
+        raise UpdateError("The release has no installer to download")
+    session = session or _session()
+    expected = fetch_checksum(release, session)
+    directory = Path(directory)
+    name = os.path.basename(release.asset_name) or f"DocumentWordExtractor-{release.version}"
+    target = directory / name
+    part = directory / (name + ".part")
+    meta = directory / (name + ".part.json")
+    directory.mkdir(parents=True, exist_ok=True)
+
+    digest = hashlib.sha256()
+    done = 0
+    headers = {}
+    validator = _read_validator(meta, release.download_url)
+    if validator and part.exists():
+        # Hash what is already there so the checksum covers the whole file
+        with open(part, "rb") as f:
+            for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+                digest.update(chunk)
+                done += len(chunk)
+        if done:
+            headers = {"Range": f"bytes={done}-", "If-Range": validator}
+    try:
+        response = session.get(release.download_url, headers=headers, stream=True, timeout=TIMEOUT)
+        if response.status_code == 416 and headers:
+            # Nothing left past the part file: the app stopped after the last
+            # byte but before the rename, or the file on the server shrank
+            response.close()
+            total = _range_total(response.headers.get("Content-Range", "")) or release.size
+            if done == total and (expected is None or digest.hexdigest() == expected):
+                response = None
+            else:
+                _discard(part, meta)
+                digest, done = hashlib.sha256(), 0
+                response = session.get(release.download_url, stream=True, timeout=TIMEOUT)
+        if response is not None:
+            with response:
+                digest, done = _receive(response, part, meta, release, digest, done, on_progress, cancel)
+    except (requests.RequestException, OSError) as e:
+        raise UpdateError(f"Download failed: {e}") from e
+
+    if release.size is not None and done != release.size:
+        _discard(part, meta)
+        raise ChecksumMismatchError(f"Expected {release.size} bytes, received {done}")
+    if expected is not None and digest.hexdigest() != expected:
+        _discard(part, meta)
+        raise ChecksumMismatchError(f"Checksum mismatch for {name}")
+    os.replace(part, target)
+    meta.unlink(missing_ok=True)
+    return target
+
+
+def _receive(response, part: Path, meta: Path, release: Release, digest, done: int, on_progress, cancel):
+    """Append a download response to the part file; return the digest and size so far."""
+    response.raise_for_status()
+    if response.status_code != 206:
+        # No partial file, or the server sent the whole (possibly new) file
+        digest, done = hashlib.sha256(), 0
+    length = response.headers.get("Content-Length")
+    total = done + int(length) if length and length.isdigit() else release.size
+    validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+    _write_validator(meta, release.download_url, validator)
+    with open(part, "ab" if done else "wb") as out:
+        if on_progress is not None:
+            on_progress(done, total)
+        for chunk in response.iter_content(CHUNK_SIZE):
+            if cancel is not None and cancel.is_set():
+                raise UpdateError("Download cancelled")
+            out.write(chunk)
+            digest.update(chunk)
+            done += len(chunk)
+            if on_progress is not None:
+                on_progress(done, total)
+    return digest, done
+
+
+def _range_total(content_range: str) -> int | None:
+    """Return the full size from a ``Content-Range: bytes */<size>`` header."""
+    size = content_range.rpartition("/")[2]
+    return int(size) if size.isdigit() else None
+
+
+def _read_validator(meta: Path, url: str) -> str | None:
+    """Return the ETag or Last-Modified a part file was downloaded with."""
+    try:
+        with open(meta, encoding="utf-8") as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return info.get("validator") if info.get("url") == url else None
+
+
+def _write_validator(meta: Path, url: str, validator: str | None) -> None:
+    if validator:
+        with open(meta, "w", encoding="utf-8") as f:
+            json.dump({"url": url, "validator": validator}, f)
+    else:
+        # Without a validator a resumed range could mix two versions
+        meta.unlink(missing_ok=True)
+
+
+def _discard(part: Path, meta: Path) -> None:
+    part.unlink(missing_ok=True)
+    meta.unlink(missing_ok=True)
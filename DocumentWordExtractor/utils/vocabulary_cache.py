@@ -0,0 +1,96 @@
+"""On-disk cache of extracted vocabularies for repeated comparisons."""
+
+import json
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+
+from processors.vocabulary_diff import Vocabulary
+from utils.fingerprint import source_signature, source_unchanged
+from utils.session_store import document_key
+
+VOCAB_MAGIC = b"DWEVOC01"
+
+
+def encode_vocabulary(file_path: Path, vocabulary: Vocabulary) -> bytes:
+    """Serialize a vocabulary.
+
+    Layout: magic, u32 header length, JSON header (source path, stat,
+    fingerprint and word count), the uint32 counts, then the NUL-joined
+    word forms.
+    """
+    header = json.dumps({
+        "path": str(file_path),
+        **source_signature(file_path),
+        "words": len(vocabulary),
+    }).encode("utf-8")
+    counts = array("I", vocabulary.counts)
+    if sys.byteorder != "little":
+        counts.byteswap()
+    return (
+        VOCAB_MAGIC
+        + struct.pack("<I", len(header))
+        + header
+        + counts.tobytes()
+        + "\0".join(vocabulary.forms).encode("utf-8")
+    )
+
+
+def decode_vocabulary(data: bytes, name: str) -> tuple[dict, Vocabulary]:
+    """Parse a cached vocabulary; raises ValueError if the data is damaged."""
+    if data[:8] != VOCAB_MAGIC:
+        raise ValueError("Not a vocabulary cache file")
+    (head_len,) = struct.unpack_from("<I", data, 8)
+    header = json.loads(data[12:12 + head_len])
+    size = header["words"]
+    base = 12 + head_len
+    counts = array("I", data[base:base + 4 * size])
+    if sys.byteorder != "little":
+        counts.byteswap()
+    blob = data[base + 4 * size:].decode("utf-8")
+    forms = blob.split("\0") if blob else []
+    if len(forms) != size or len(counts) != size:
+        raise ValueError("Truncated vocabulary cache file")
+    ids = {w.lower(): i for i, w in enumerate(forms)}
+    return header, Vocabulary(name, ids, forms, counts)
+
+
+class VocabularyCache:
+    """Vocabularies of extracted documents, one file per source path.
+
+    An entry is used only while its source is unchanged: the stat signature
+    is checked first, then the content fingerprint. Files are replaced
+    atomically, so a crash never leaves a partial entry.
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = Path(directory)
+
+    def _entry(self, file_path: Path) -> Path:
+        return self.directory / (document_key(file_path) + ".voc")
+
+    def load(self, file_path: Path) -> Vocabulary | None:
+        """Return the cached vocabulary of a document, or None if stale or missing."""
+        try:
+            data = self._entry(file_path).read_bytes()
+            header, vocabulary = decode_vocabulary(data, file_path.name)
+        except (OSError, ValueError, KeyError, struct.error):
+            return None
+        if header.get("path") != str(file_path) or not source_unchanged(file_path, header):
+            return None
+        return vocabulary
+
+    def save(self, file_path: Path, vocabulary: Vocabulary) -> None:
+        """Store a document's vocabulary; failures only cost a re-extraction."""
+        target = self._entry(file_path)
+        tmp = target.with_suffix(".tmp")
+        try:
+            data = encode_vocabulary(file_path, vocabulary)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, target)
+        except OSError:
+            pass